@@ -6,10 +6,14 @@ from alembic import context
 from models.database import Base
 from models.project import Project
 from models.sprint import Sprint
+from models.sprint_snapshot import SprintSnapshot
 from models.task import Task
 from models.user import User
 from models.comment import Comment
 from models.activity_log import ActivityLog
+from models.activity_log_archive import ActivityLogArchive
+from models.task_tombstone import TaskTombstone
+from models.project_deletion_job import ProjectDeletionJob
 
 config = context.config
 
@@ -0,0 +1,44 @@
+"""sprint snapshots and task status timestamps
+
+Revision ID: a1c9e5d7b3f8
+Revises: f4c7a2e9b1d6
+Create Date: 2024-04-15 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'a1c9e5d7b3f8'
+down_revision = 'f4c7a2e9b1d6'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.add_column('tasks', sa.Column('started_at', sa.DateTime(), nullable=True))
+    op.add_column('tasks', sa.Column('completed_at', sa.DateTime(), nullable=True))
+    op.create_index('ix_tasks_project_completed', 'tasks', ['project_id', 'completed_at'])
+
+    op.create_table(
+        'sprint_snapshots',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('sprint_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('total_points', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('done_points', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('total_tasks', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('done_tasks', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('scope_added_points', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('scope_removed_points', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['sprint_id'], ['sprints.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('sprint_id', 'day', name='uq_sprint_snapshots_sprint_day'),
+        if_not_exists=True,
+    )
+    # Existing history is filled in by `python manage.py backfill-analytics`
+
+def downgrade():
+    op.drop_table('sprint_snapshots')
+    op.drop_index('ix_tasks_project_completed', table_name='tasks')
+    op.drop_column('tasks', 'completed_at')
+    op.drop_column('tasks', 'started_at')
@@ -0,0 +1,61 @@
+"""task board rank
+
+Revision ID: b5e2d8f4a6c1
+Revises: a1c9e5d7b3f8
+Create Date: 2024-04-22 14:10:00.000000
+
+"""
+from itertools import groupby
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'b5e2d8f4a6c1'
+down_revision = 'a1c9e5d7b3f8'
+branch_labels = None
+depends_on = None
+
+# A frozen copy of the key spacing at the time of this revision, so later changes to the app
+# cannot alter what the migration writes
+DIGITS = '0123456789abcdefghijklmnopqrstuvwxyz'
+
+def _encode(value, width):
+    chars = []
+    for _ in range(width):
+        value, digit = divmod(value, len(DIGITS))
+        chars.append(DIGITS[digit])
+    return ''.join(reversed(chars)).rstrip(DIGITS[0])
+
+def spaced_ranks(count):
+    base = len(DIGITS)
+    width = 1
+    while base ** width <= (count + 1) * base * base:
+        width += 1
+    step = base ** width // (2 * (count + 1))
+    return [_encode((i + 1) * step, width) for i in range(count)]
+
+def upgrade():
+    op.add_column('tasks', sa.Column('rank', sa.String(length=64), nullable=True))
+
+    # Existing columns keep their id order
+    tasks = sa.table('tasks', sa.column('id', sa.Integer), sa.column('project_id', sa.Integer),
+                     sa.column('status', sa.String), sa.column('rank', sa.String),
+                     sa.column('updated_at', sa.DateTime))
+    conn = op.get_bind()
+    rows = conn.execute(sa.select(tasks.c.id, tasks.c.project_id, tasks.c.status).order_by(
+        tasks.c.project_id, tasks.c.status, tasks.c.id
+    )).all()
+    stmt = tasks.update().where(tasks.c.id == sa.bindparam('task_id')).values(
+        rank=sa.bindparam('new_rank'), updated_at=tasks.c.updated_at
+    )
+    for _, column in groupby(rows, key=lambda row: (row.project_id, row.status)):
+        ids = [row.id for row in column]
+        conn.execute(stmt, [{'task_id': i, 'new_rank': r} for i, r in zip(ids, spaced_ranks(len(ids)))])
+
+    op.alter_column('tasks', 'rank', existing_type=sa.String(length=64), nullable=False)
+    op.create_index('ix_tasks_project_status_rank', 'tasks', ['project_id', 'status', 'rank'])
+    op.drop_index('ix_tasks_project_status', table_name='tasks')
+
+def downgrade():
+    op.create_index('ix_tasks_project_status', 'tasks', ['project_id', 'status'])
+    op.drop_index('ix_tasks_project_status_rank', table_name='tasks')
+    op.drop_column('tasks', 'rank')
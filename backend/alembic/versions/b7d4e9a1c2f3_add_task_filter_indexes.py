@@ -0,0 +1,29 @@
+"""add task filter indexes
+
+Revision ID: b7d4e9a1c2f3
+Revises: a3f8b2c1d4e5
+Create Date: 2024-02-05 09:30:00.000000
+
+"""
+from alembic import op
+
+revision = 'b7d4e9a1c2f3'
+down_revision = 'a3f8b2c1d4e5'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_index('ix_tasks_project_status', 'tasks', ['project_id', 'status'])
+    op.create_index('ix_tasks_project_sprint_status', 'tasks', ['project_id', 'sprint_id', 'status'])
+    op.create_index('ix_tasks_sprint_status', 'tasks', ['sprint_id', 'status'])
+    op.create_index('ix_tasks_assigned_status', 'tasks', ['assigned_to', 'status'])
+    op.create_index('ix_tasks_project_updated', 'tasks', ['project_id', 'updated_at', 'id'])
+    op.create_index('ix_tasks_updated', 'tasks', ['updated_at', 'id'])
+
+def downgrade():
+    op.drop_index('ix_tasks_updated', table_name='tasks')
+    op.drop_index('ix_tasks_project_updated', table_name='tasks')
+    op.drop_index('ix_tasks_assigned_status', table_name='tasks')
+    op.drop_index('ix_tasks_sprint_status', table_name='tasks')
+    op.drop_index('ix_tasks_project_sprint_status', table_name='tasks')
+    op.drop_index('ix_tasks_project_status', table_name='tasks')
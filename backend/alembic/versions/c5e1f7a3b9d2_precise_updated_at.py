@@ -0,0 +1,28 @@
+"""precise updated_at for conditional requests
+
+Revision ID: c5e1f7a3b9d2
+Revises: b7d4e9a1c2f3
+Create Date: 2024-02-19 14:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+revision = 'c5e1f7a3b9d2'
+down_revision = 'b7d4e9a1c2f3'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.alter_column('tasks', 'updated_at', type_=mysql.DATETIME(fsp=6), existing_nullable=True)
+    op.alter_column('projects', 'updated_at', type_=mysql.DATETIME(fsp=6), existing_nullable=True)
+    op.add_column('sprints', sa.Column('updated_at', mysql.DATETIME(fsp=6), nullable=True))
+    op.execute("UPDATE sprints SET updated_at = created_at")
+    op.create_index('ix_sprints_project_updated', 'sprints', ['project_id', 'updated_at'])
+
+def downgrade():
+    op.drop_index('ix_sprints_project_updated', table_name='sprints')
+    op.drop_column('sprints', 'updated_at')
+    op.alter_column('projects', 'updated_at', type_=sa.DateTime(), existing_nullable=True)
+    op.alter_column('tasks', 'updated_at', type_=sa.DateTime(), existing_nullable=True)
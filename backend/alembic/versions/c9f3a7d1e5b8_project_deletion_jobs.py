@@ -0,0 +1,32 @@
+"""project deletion jobs
+
+Revision ID: c9f3a7d1e5b8
+Revises: b5e2d8f4a6c1
+Create Date: 2024-05-06 10:15:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'c9f3a7d1e5b8'
+down_revision = 'b5e2d8f4a6c1'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        'project_deletion_jobs',
+        sa.Column('project_id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('total_tasks', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('deleted_tasks', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('started_at', sa.DateTime(), nullable=False),
+        sa.Column('heartbeat_at', sa.DateTime(), nullable=False),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint('project_id'),
+        if_not_exists=True,
+    )
+
+def downgrade():
+    op.drop_table('project_deletion_jobs')
@@ -0,0 +1,44 @@
+"""task change sequence and tombstones
+
+Revision ID: d2a6c8e4f1b7
+Revises: c5e1f7a3b9d2
+Create Date: 2024-03-04 11:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'd2a6c8e4f1b7'
+down_revision = 'c5e1f7a3b9d2'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.add_column('projects', sa.Column('change_seq', sa.BigInteger(), nullable=False, server_default='0'))
+    op.add_column('tasks', sa.Column('change_seq', sa.BigInteger(), nullable=True))
+    op.execute("UPDATE tasks SET change_seq = id")
+    op.execute(
+        "UPDATE projects SET change_seq = "
+        "(SELECT COALESCE(MAX(tasks.id), 0) FROM tasks WHERE tasks.project_id = projects.id)"
+    )
+    op.create_index('ix_tasks_project_change_seq', 'tasks', ['project_id', 'change_seq'])
+
+    op.create_table(
+        'task_tombstones',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('task_id', sa.Integer(), nullable=False),
+        sa.Column('change_seq', sa.BigInteger(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.id']),
+        sa.PrimaryKeyConstraint('id'),
+        if_not_exists=True,
+    )
+    op.create_index('ix_task_tombstones_project_seq', 'task_tombstones', ['project_id', 'change_seq'])
+
+def downgrade():
+    op.drop_index('ix_task_tombstones_project_seq', table_name='task_tombstones')
+    op.drop_table('task_tombstones')
+    op.drop_index('ix_tasks_project_change_seq', table_name='tasks')
+    op.drop_column('tasks', 'change_seq')
+    op.drop_column('projects', 'change_seq')
@@ -0,0 +1,25 @@
+"""fulltext search indexes
+
+Revision ID: e8b3d5f9a2c4
+Revises: d2a6c8e4f1b7
+Create Date: 2024-03-18 16:45:00.000000
+
+"""
+from alembic import op
+
+revision = 'e8b3d5f9a2c4'
+down_revision = 'd2a6c8e4f1b7'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    if op.get_bind().dialect.name != 'mysql':
+        return
+    op.create_index('ft_tasks_title_description', 'tasks', ['title', 'description'], mysql_prefix='FULLTEXT')
+    op.create_index('ft_comments_content', 'comments', ['content'], mysql_prefix='FULLTEXT')
+
+def downgrade():
+    if op.get_bind().dialect.name != 'mysql':
+        return
+    op.drop_index('ft_comments_content', table_name='comments')
+    op.drop_index('ft_tasks_title_description', table_name='tasks')
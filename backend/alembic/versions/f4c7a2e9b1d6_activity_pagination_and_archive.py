@@ -0,0 +1,40 @@
+"""activity pagination indexes and archive table
+
+Revision ID: f4c7a2e9b1d6
+Revises: e8b3d5f9a2c4
+Create Date: 2024-04-02 10:05:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'f4c7a2e9b1d6'
+down_revision = 'e8b3d5f9a2c4'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_index('ix_activity_logs_task_created', 'activity_logs', ['task_id', 'created_at'])
+    op.create_index('ix_comments_task_created', 'comments', ['task_id', 'created_at'])
+
+    op.create_table(
+        'activity_logs_archive',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('task_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('action', sa.String(length=100), nullable=False),
+        sa.Column('field_changed', sa.String(length=100), nullable=True),
+        sa.Column('old_value', sa.String(length=255), nullable=True),
+        sa.Column('new_value', sa.String(length=255), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        mysql_row_format='COMPRESSED',
+        if_not_exists=True,
+    )
+    op.create_index('ix_activity_logs_archive_task_created', 'activity_logs_archive', ['task_id', 'created_at'])
+
+def downgrade():
+    op.drop_index('ix_activity_logs_archive_task_created', table_name='activity_logs_archive')
+    op.drop_table('activity_logs_archive')
+    op.drop_index('ix_comments_task_created', table_name='comments')
+    op.drop_index('ix_activity_logs_task_created', table_name='activity_logs')
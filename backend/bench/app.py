@@ -0,0 +1,12 @@
+"""The app served over a benchmark database, for multi-worker runs: ``BENCH_DB=... gunicorn -c gunicorn.conf.py bench.app:app``."""
+import os
+
+# The bench database is SQLite, so search could only use a per-worker in-process index, which
+# gunicorn.conf.py refuses with several workers. No scenario searches, so leave it off.
+os.environ.setdefault("SEARCH_BACKEND", "off")
+
+from bench.data import bench_engine, use_engine
+
+use_engine(bench_engine(os.environ["BENCH_DB"]))
+
+from main import app
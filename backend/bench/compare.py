@@ -0,0 +1,52 @@
+"""Compare two bench.run reports.
+
+    python -m bench.compare baseline.json candidate.json --fail-over 10
+
+Exits non-zero when any scenario's p95 or throughput regresses by more than --fail-over percent.
+"""
+import argparse
+import json
+import sys
+
+METRICS = [("p50_ms", False), ("p95_ms", False), ("p99_ms", False), ("throughput_rps", True)]
+
+def change(before, after, higher_is_better):
+    if not before or after is None:
+        return None
+    delta = (after - before) / before * 100
+    return -delta if higher_is_better else delta
+
+def compare(baseline, candidate):
+    """Per-scenario metric pairs with the regression in percent (positive means worse)."""
+    rows = []
+    for name, after in candidate["scenarios"].items():
+        before = baseline["scenarios"].get(name)
+        if before is None:
+            continue
+        for metric, higher_is_better in METRICS:
+            rows.append((name, metric, before[metric], after[metric], change(before[metric], after[metric], higher_is_better)))
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two benchmark reports")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--fail-over", type=float, help="regression threshold in percent for p95 and throughput")
+    args = parser.parse_args()
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.candidate) as f:
+        candidate = json.load(f)
+
+    failed = False
+    print(f"{'scenario':<16} {'metric':<15} {'baseline':>10} {'candidate':>10} {'regression':>11}")
+    for name, metric, before, after, regression in compare(baseline, candidate):
+        shown = f"{regression:+.1f}%" if regression is not None else "-"
+        print(f"{name:<16} {metric:<15} {before!s:>10} {after!s:>10} {shown:>11}")
+        if args.fail_over is not None and metric in ("p95_ms", "throughput_rps") and regression is not None and regression > args.fail_over:
+            failed = True
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
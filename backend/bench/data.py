@@ -0,0 +1,206 @@
+"""Synthetic data for the benchmark suite.
+
+    python -m bench.data --db /tmp/taskforge-bench.db --scale 1.0
+
+Scale 1.0 is roughly 1M tasks, 500k comments and 2M activity rows over 50 projects. User and
+task volumes scale linearly; the same --seed always produces the same rows.
+"""
+import argparse
+import logging
+import math
+import os
+import random
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, event, insert, update
+from core.instrumentation import instrument_engine
+from core.ranking import rank_after
+from models import database
+from models.database import Base
+from models.project import Project
+from models.sprint import Sprint
+from models.sprint_snapshot import SprintSnapshot
+from models.task import Task
+from models.user import User
+from models.comment import Comment
+from models.activity_log import ActivityLog
+from models.activity_log_archive import ActivityLogArchive
+from models.task_tombstone import TaskTombstone
+
+logger = logging.getLogger(__name__)
+
+BASE_COUNTS = {
+    "users": 2000,
+    "projects": 50,
+    "sprints_per_project": 40,
+    "tasks": 1_000_000,
+    "comments_per_task": 0.5,
+    "activity_per_task": 2.0,
+}
+STATUSES = ["todo", "in_progress", "in_review", "done"]
+PRIORITIES = ["low", "medium", "high", "critical"]
+TASK_TYPES = ["task", "story", "bug"]
+WORDS = (
+    "board sprint deploy api cache query index latency migration frontend backend login report "
+    "export import search filter release review refactor timeout retry queue worker metric"
+).split()
+CHUNK_SIZE = 10_000
+
+def bench_engine(path):
+    """SQLite engine configured for concurrent benchmark traffic (WAL, generous lock timeout)."""
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False, "timeout": 30})
+
+    @event.listens_for(engine, "connect")
+    def _configure(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+    return engine
+
+def use_engine(engine):
+    # The app creates its engine lazily, so installing one first points every session at it
+    instrument_engine(engine)
+    database.engine = engine
+    database.SessionLocal.configure(bind=engine)
+
+def scaled_counts(scale):
+    return {
+        "users": max(3, int(BASE_COUNTS["users"] * scale)),
+        "projects": max(1, int(BASE_COUNTS["projects"] * min(scale * 10, 1))),
+        "sprints_per_project": max(1, int(BASE_COUNTS["sprints_per_project"] * min(scale * 10, 1))),
+        "tasks": max(10, int(BASE_COUNTS["tasks"] * scale)),
+        "comments_per_task": BASE_COUNTS["comments_per_task"],
+        "activity_per_task": BASE_COUNTS["activity_per_task"],
+    }
+
+def _sentence(rng, words):
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+def _insert_chunks(conn, table, rows):
+    for start in range(0, len(rows), CHUNK_SIZE):
+        conn.execute(insert(table), rows[start:start + CHUNK_SIZE])
+
+def generate(engine, scale=1.0, seed=42):
+    rng = random.Random(seed)
+    counts = scaled_counts(scale)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    epoch = datetime(2024, 1, 1)
+    started = time.perf_counter()
+
+    with engine.begin() as conn:
+        _insert_chunks(conn, User.__table__, [
+            {"id": i, "username": f"user{i}", "email": f"user{i}@example.com", "full_name": f"User {i}", "created_at": epoch}
+            for i in range(1, counts["users"] + 1)
+        ])
+        _insert_chunks(conn, Project.__table__, [
+            {"id": i, "name": f"Project {i}", "key": f"P{i}", "description": _sentence(rng, 12), "created_at": epoch, "updated_at": epoch}
+            for i in range(1, counts["projects"] + 1)
+        ])
+        sprints = []
+        for project_id in range(1, counts["projects"] + 1):
+            for n in range(counts["sprints_per_project"]):
+                start_date = epoch + timedelta(days=14 * n)
+                sprints.append({
+                    "id": len(sprints) + 1, "project_id": project_id, "name": f"Sprint {n + 1}",
+                    "goal": _sentence(rng, 6), "start_date": start_date, "end_date": start_date + timedelta(days=14),
+                    "status": "completed" if n < counts["sprints_per_project"] - 1 else "active",
+                    "created_at": start_date, "updated_at": start_date,
+                })
+        _insert_chunks(conn, Sprint.__table__, sprints)
+    logger.info(f"Inserted {counts['users']} users, {counts['projects']} projects, {len(sprints)} sprints")
+
+    change_seqs = [0] * (counts["projects"] + 1)
+    ranks = {}
+    comment_id = activity_id = 0
+    for chunk_start in range(0, counts["tasks"], CHUNK_SIZE):
+        tasks, comments, activity = [], [], []
+        for task_id in range(chunk_start + 1, min(chunk_start + CHUNK_SIZE, counts["tasks"]) + 1):
+            project_id = rng.randint(1, counts["projects"])
+            change_seqs[project_id] += 1
+            sprint_number = rng.randrange(counts["sprints_per_project"] + 1)
+            created_at = epoch + timedelta(minutes=rng.randrange(60 * 24 * 14 * counts["sprints_per_project"]))
+            updated_at = created_at + timedelta(seconds=rng.randrange(86400 * 7), microseconds=task_id % 1_000_000)
+            creator = rng.randint(1, counts["users"])
+            status = rng.choice(STATUSES)
+            # Fixed-width keys in creation order, the same shape appends produce in the app
+            ranks[project_id, status] = rank_after(ranks.get((project_id, status), "1"))
+            tasks.append({
+                "id": task_id,
+                "project_id": project_id,
+                # One in (sprints + 1) tasks sits in the backlog
+                "sprint_id": (project_id - 1) * counts["sprints_per_project"] + sprint_number + 1
+                    if sprint_number < counts["sprints_per_project"] else None,
+                "title": _sentence(rng, 5),
+                "description": _sentence(rng, 25),
+                "task_type": rng.choice(TASK_TYPES),
+                "status": status,
+                "priority": rng.choice(PRIORITIES),
+                "story_points": rng.choice([1, 2, 3, 5, 8, 13, None]),
+                "assigned_to": rng.randint(1, counts["users"]) if rng.random() < 0.8 else None,
+                "created_by": creator,
+                "created_at": created_at,
+                "updated_at": updated_at,
+                "due_date": None,
+                "change_seq": change_seqs[project_id],
+                "rank": ranks[project_id, status],
+            })
+            for _ in range(_poisson_count(rng, counts["comments_per_task"])):
+                comment_id += 1
+                at = created_at + timedelta(hours=rng.randrange(240))
+                comments.append({
+                    "id": comment_id, "task_id": task_id, "user_id": rng.randint(1, counts["users"]),
+                    "content": _sentence(rng, 15), "created_at": at, "updated_at": at,
+                })
+            for _ in range(_poisson_count(rng, counts["activity_per_task"])):
+                activity_id += 1
+                old, new = rng.sample(STATUSES, 2)
+                activity.append({
+                    "id": activity_id, "task_id": task_id, "user_id": creator, "action": "moved",
+                    "field_changed": "status", "old_value": old, "new_value": new,
+                    "created_at": created_at + timedelta(hours=rng.randrange(240)),
+                })
+        with engine.begin() as conn:
+            _insert_chunks(conn, Task.__table__, tasks)
+            _insert_chunks(conn, Comment.__table__, comments)
+            _insert_chunks(conn, ActivityLog.__table__, activity)
+        logger.info(f"Inserted {tasks[-1]['id']}/{counts['tasks']} tasks")
+
+    with engine.begin() as conn:
+        projects = Project.__table__
+        for project_id in range(1, counts["projects"] + 1):
+            conn.execute(update(projects).where(projects.c.id == project_id).values(change_seq=change_seqs[project_id]))
+    with engine.connect() as conn:
+        conn.exec_driver_sql("ANALYZE")
+
+    summary = {
+        **counts,
+        "sprints": len(sprints),
+        "comments": comment_id,
+        "activity": activity_id,
+        "seconds": round(time.perf_counter() - started, 1),
+    }
+    logger.info(f"Generated dataset: {summary}")
+    return summary
+
+def _poisson_count(rng, mean):
+    # Small-mean Poisson by inversion; enough spread for realistic per-task fan-out
+    limit, k, p = math.exp(-mean), 0, rng.random()
+    while p > limit:
+        k += 1
+        p *= rng.random()
+    return k
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic TaskForge dataset in SQLite")
+    parser.add_argument("--db", default=os.getenv("BENCH_DB", "/tmp/taskforge-bench.db"))
+    parser.add_argument("--scale", type=float, default=1.0, help="1.0 is about 1M tasks")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+    generate(bench_engine(args.db), args.scale, args.seed)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+"""Scripted load scenarios against the real app, served in-process over a generated SQLite database.
+
+    python -m bench.data --db /tmp/taskforge-bench.db --scale 0.1
+    python -m bench.run --db /tmp/taskforge-bench.db --out results.json
+    python -m bench.compare baseline.json results.json
+
+Each scenario runs --requests iterations with --concurrency in flight and reports per-iteration
+latency percentiles and throughput as JSON. Write scenarios mutate the dataset, so regenerate it
+(same --seed) before runs that are meant to be compared.
+
+With --workers N the app is served by gunicorn (gunicorn.conf.py, N uvicorn workers) on a local
+port and driven over HTTP instead of in-process; search is off there (see bench.app), as no scenario
+uses it. Throughput scaling is measured by running the same scenarios at increasing worker counts,
+regenerating the dataset in between:
+
+    for n in 1 2 4 8; do
+        python -m bench.data --db /tmp/taskforge-bench.db --scale 0.1
+        python -m bench.run --db /tmp/taskforge-bench.db --workers $n --concurrency 64 --out workers-$n.json
+    done
+    python -m bench.compare workers-1.json workers-4.json
+
+Read-heavy scenarios should scale close to linearly up to the core count. Write scenarios are
+bounded by the database; SQLite serializes writers, so measure those against MySQL.
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+os.environ.setdefault("STARTUP_MODE", "production")
+
+import httpx
+import sqlalchemy
+from sqlalchemy import func, select
+from bench.data import bench_engine, use_engine
+from models.project import Project
+from models.sprint import Sprint
+from models.task import Task
+from models.user import User
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SERVER_READY_TIMEOUT = 60
+
+STATUSES = ["todo", "in_progress", "in_review", "done"]
+
+class Dataset:
+    """Id ranges the scenarios draw from, read once from the database."""
+
+    def __init__(self, engine, rng):
+        self.rng = rng
+        with engine.connect() as conn:
+            self.max_task = conn.execute(select(func.max(Task.id))).scalar_one()
+            self.max_user = conn.execute(select(func.max(User.id))).scalar_one()
+            self.projects = conn.execute(select(Project.id)).scalars().all()
+            # Boards are opened on active sprints
+            self.active_sprints = conn.execute(
+                select(Sprint.id, Sprint.project_id).where(Sprint.status == "active")
+            ).all()
+
+    def task_id(self):
+        return self.rng.randint(1, self.max_task)
+
+    def project_id(self):
+        return self.rng.choice(self.projects)
+
+    def sprint(self):
+        return self.rng.choice(self.active_sprints)
+
+    def user_id(self):
+        return self.rng.randint(1, self.max_user)
+
+async def board_load(client, data):
+    """What the Kanban board fetches on open."""
+    sprint_id, project_id = data.sprint()
+    return [
+        await client.get("/api/tasks", params={"project_id": project_id, "sprint_id": sprint_id, "sort": "rank"}),
+        await client.get("/api/sprints", params={"project_id": project_id, "include": "stats"}),
+        await client.get("/api/users"),
+    ]
+
+async def dashboard(client, data):
+    return [
+        await client.get("/api/stats"),
+        await client.get(f"/api/projects/{data.project_id()}/stats"),
+        await client.get("/api/projects"),
+    ]
+
+async def task_page(client, data):
+    return [await client.get("/api/tasks", params={"project_id": data.project_id(), "limit": 100, "sort": "updated_at", "order": "desc"})]
+
+async def task_detail(client, data):
+    return [await client.get(f"/api/tasks/{data.task_id()}/detail")]
+
+async def move_storm(client, data):
+    return [await client.put(f"/api/tasks/{data.task_id()}/move", json={"status": data.rng.choice(STATUSES)})]
+
+async def comment_burst(client, data):
+    task_id = data.task_id()
+    return [await client.post(
+        f"/api/tasks/{task_id}/comments",
+        json={"task_id": task_id, "user_id": data.user_id(), "content": "Benchmark comment"},
+    )]
+
+SCENARIOS = {
+    "board_load": board_load,
+    "dashboard": dashboard,
+    "task_page": task_page,
+    "task_detail": task_detail,
+    "move_storm": move_storm,
+    "comment_burst": comment_burst,
+}
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def summarize(latencies, errors, elapsed):
+    latencies = sorted(latencies)
+    ms = lambda seconds: round(seconds * 1000, 3) if seconds is not None else None
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else None,
+        "mean_ms": ms(sum(latencies) / len(latencies)) if latencies else None,
+        "p50_ms": ms(percentile(latencies, 0.50)),
+        "p95_ms": ms(percentile(latencies, 0.95)),
+        "p99_ms": ms(percentile(latencies, 0.99)),
+        "max_ms": ms(latencies[-1]) if latencies else None,
+    }
+
+async def run_scenario(client, scenario, data, iterations, concurrency, warmup):
+    for _ in range(warmup):
+        await scenario(client, data)
+
+    latencies = []
+    errors = 0
+    remaining = iterations
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            responses = await scenario(client, data)
+            latencies.append(time.perf_counter() - started)
+            errors += sum(1 for response in responses if response.status_code >= 400)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, errors, time.perf_counter() - started)
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+async def _wait_ready(client, process):
+    deadline = time.monotonic() + SERVER_READY_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"gunicorn exited with status {process.returncode}")
+        with contextlib.suppress(httpx.TransportError):
+            if (await client.get("/ready")).status_code == 200:
+                return
+        await asyncio.sleep(0.2)
+    raise RuntimeError(f"Server not ready after {SERVER_READY_TIMEOUT}s")
+
+@contextlib.asynccontextmanager
+async def served_client(db, workers):
+    """A client for the app under gunicorn with ``workers`` processes, over the benchmark database."""
+    port = _free_port()
+    env = dict(
+        os.environ, BENCH_DB=os.path.abspath(db), WEB_CONCURRENCY=str(workers),
+        BIND=f"127.0.0.1:{port}", ACCESS_LOG="",
+    )
+    process = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "bench.app:app"], cwd=BACKEND_DIR, env=env
+    )
+    try:
+        limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=60) as client:
+            await _wait_ready(client, process)
+            yield client
+    finally:
+        process.terminate()
+        process.wait(30)
+
+@contextlib.asynccontextmanager
+async def in_process_client():
+    import main
+
+    async with main.app.router.lifespan_context(main.app):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            yield client
+
+async def run(args):
+    engine = bench_engine(args.db)
+    data = Dataset(engine, random.Random(args.seed))
+    if args.workers:
+        client_context = served_client(args.db, args.workers)
+    else:
+        use_engine(engine)
+        client_context = in_process_client()
+
+    results = {}
+    async with client_context as client:
+        for name in args.scenarios:
+            logger.info(f"Running {name}: {args.requests} iterations, concurrency {args.concurrency}")
+            results[name] = await run_scenario(
+                client, SCENARIOS[name], data, args.requests, args.concurrency, args.warmup
+            )
+            logger.info(f"{name}: {results[name]}")
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "database": "sqlite",
+            "tasks": data.max_task,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "workers": args.workers,
+            "seed": args.seed,
+        },
+        "scenarios": results,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Run TaskForge load scenarios and report latency percentiles")
+    parser.add_argument("--db", default=os.getenv("BENCH_DB", "/tmp/taskforge-bench.db"))
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--requests", type=int, default=200, help="iterations per scenario")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workers", type=int, help="serve with gunicorn and this many workers instead of in-process")
+    parser.add_argument("--out", help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s", stream=sys.stderr)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    if not os.path.exists(args.db):
+        parser.error(f"{args.db} does not exist; generate it first with python -m bench.data")
+    report = asyncio.run(run(args))
+    output = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+import asyncio
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from sqlalchemy import delete, event, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from models import database
+from core.pagination import encode_cursor, paginate
+from models.activity_log import ActivityLog
+from models.activity_log_archive import ActivityLogArchive
+
+logger = logging.getLogger(__name__)
+
+# "buffered": rows are queued when the request transaction commits and written in batches by a worker
+# "sync": rows are inserted inside the request transaction, as strict as the original behaviour
+ACTIVITY_LOG_MODE = os.getenv("ACTIVITY_LOG_MODE", "buffered").lower()
+ACTIVITY_LOG_BATCH_SIZE = int(os.getenv("ACTIVITY_LOG_BATCH_SIZE", "500"))
+ACTIVITY_LOG_FLUSH_INTERVAL = float(os.getenv("ACTIVITY_LOG_FLUSH_INTERVAL", "0.5"))
+ACTIVITY_LOG_QUEUE_SIZE = int(os.getenv("ACTIVITY_LOG_QUEUE_SIZE", "10000"))
+# How long a threadpool request waits for room in a full queue before writing its rows itself
+ACTIVITY_LOG_SUBMIT_TIMEOUT = float(os.getenv("ACTIVITY_LOG_SUBMIT_TIMEOUT", "1"))
+# Overflow from the event loop goes to this many writer threads; rows beyond the cap are dropped and counted
+ACTIVITY_LOG_OVERFLOW_WORKERS = int(os.getenv("ACTIVITY_LOG_OVERFLOW_WORKERS", "2"))
+ACTIVITY_LOG_OVERFLOW_MAX_ROWS = int(os.getenv("ACTIVITY_LOG_OVERFLOW_MAX_ROWS", "10000"))
+ACTIVITY_ARCHIVE_AFTER_DAYS = int(os.getenv("ACTIVITY_ARCHIVE_AFTER_DAYS", "90"))
+ACTIVITY_ARCHIVE_BATCH_SIZE = int(os.getenv("ACTIVITY_ARCHIVE_BATCH_SIZE", "5000"))
+ACTIVITY_SORT = "activity:created_at"
+
+PENDING_KEY = "pending_activity"
+_STOP = object()
+
+def _on_event_loop():
+    # True in async handlers and in the run_sync greenlets of DB_ASYNC mode
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+class ActivityLogWriter:
+    def __init__(self, batch_size, flush_interval, max_queue):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.dropped = 0
+        self._thread = None
+        self._overflow = None
+        self._overflow_rows = 0
+        self._overflow_lock = threading.Lock()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._thread = threading.Thread(target=self._run, name="activity-log-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=10):
+        if self.running:
+            # FIFO: everything submitted before the sentinel is flushed before the worker exits
+            self.queue.put(_STOP)
+            self._thread.join(timeout)
+            self._thread = None
+        if self._overflow is not None:
+            self._overflow.shutdown(wait=True)
+            self._overflow = None
+
+    def submit(self, rows):
+        if not self.running:
+            self._divert(rows)
+            return
+        # Threadpool handlers wait briefly for room, which pushes back on writers; the event loop never waits
+        on_loop = _on_event_loop()
+        for index, row in enumerate(rows):
+            try:
+                if on_loop:
+                    self.queue.put_nowait(row)
+                else:
+                    self.queue.put(row, timeout=ACTIVITY_LOG_SUBMIT_TIMEOUT)
+            except queue.Full:
+                diverted = rows[index:]
+                logger.warning(f"Activity log queue is full, writing {len(diverted)} rows outside the queue")
+                self._divert(diverted)
+                return
+
+    def _divert(self, rows):
+        if not _on_event_loop():
+            self.write(rows)
+            return
+        # A blocking insert here would stall every request on this worker. The pool is small and fixed
+        # so a burst cannot open a connection per request, and the cap bounds what it holds in memory.
+        with self._overflow_lock:
+            if self._overflow_rows + len(rows) > ACTIVITY_LOG_OVERFLOW_MAX_ROWS:
+                self.dropped += len(rows)
+                logger.error(f"Activity log overflow is full, dropped {len(rows)} rows ({self.dropped} in total)")
+                return
+            self._overflow_rows += len(rows)
+            if self._overflow is None:
+                self._overflow = ThreadPoolExecutor(
+                    max_workers=ACTIVITY_LOG_OVERFLOW_WORKERS, thread_name_prefix="activity-log-overflow"
+                )
+        self._overflow.submit(self._write_overflow, rows)
+
+    def _write_overflow(self, rows):
+        try:
+            self.write(rows)
+        finally:
+            with self._overflow_lock:
+                self._overflow_rows -= len(rows)
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            stopping = False
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self.queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            self.write(batch)
+            if stopping:
+                return
+
+    def write(self, rows):
+        try:
+            with database.get_engine().begin() as conn:
+                conn.execute(insert(ActivityLog.__table__), rows)
+        except IntegrityError:
+            # A task deleted before the flush would fail the whole batch; keep every row that still fits
+            for row in rows:
+                try:
+                    with database.get_engine().begin() as conn:
+                        conn.execute(insert(ActivityLog.__table__), row)
+                except IntegrityError:
+                    logger.warning(f"Dropping activity log row for missing task {row['task_id']}")
+        except Exception:
+            logger.exception(f"Failed to write {len(rows)} activity log rows")
+
+activity_writer = ActivityLogWriter(ACTIVITY_LOG_BATCH_SIZE, ACTIVITY_LOG_FLUSH_INTERVAL, ACTIVITY_LOG_QUEUE_SIZE)
+
+def activity_row(task_id, user_id, action, field_changed=None, old_value=None, new_value=None, created_at=None):
+    return {
+        "task_id": task_id,
+        "user_id": user_id,
+        "action": action,
+        "field_changed": field_changed,
+        "old_value": old_value,
+        "new_value": new_value,
+        "created_at": created_at or datetime.utcnow(),
+    }
+
+def record_activities(db: Session, rows):
+    if not rows:
+        return
+    if ACTIVITY_LOG_MODE == "sync":
+        db.execute(insert(ActivityLog), rows)
+    else:
+        db.info.setdefault(PENDING_KEY, []).extend(rows)
+
+def record_activity(db: Session, task_id, user_id, action, field_changed=None, old_value=None, new_value=None):
+    record_activities(db, [activity_row(task_id, user_id, action, field_changed, old_value, new_value)])
+
+@event.listens_for(Session, "after_commit")
+def _submit_committed_activity(session):
+    rows = session.info.pop(PENDING_KEY, None)
+    if rows:
+        activity_writer.submit(rows)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_activity(session):
+    session.info.pop(PENDING_KEY, None)
+
+def task_activity_page(db: Session, task_id, limit=None, after=None):
+    """Newest-first activity for a task, read across the hot table and the archive."""
+    rows = []
+    has_more = False
+    for model in (ActivityLog, ActivityLogArchive):
+        page, next_cursor = paginate(
+            db.query(model).filter(model.task_id == task_id),
+            [model.created_at, model.id], ACTIVITY_SORT,
+            limit=limit, after=after, descending=True
+        )
+        rows.extend(page)
+        has_more = has_more or next_cursor is not None
+    # Archived rows keep their ids, so (created_at, id) orders both tables as one
+    rows.sort(key=lambda row: (row.created_at, row.id), reverse=True)
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        has_more = True
+    next_cursor = encode_cursor(ACTIVITY_SORT, [rows[-1].created_at, rows[-1].id]) if has_more and rows else None
+    return rows, next_cursor
+
+def archive_activity(older_than_days=None, batch_size=None):
+    """Move activity older than the cutoff into activity_logs_archive, one short transaction per batch."""
+    older_than_days = ACTIVITY_ARCHIVE_AFTER_DAYS if older_than_days is None else older_than_days
+    batch_size = batch_size or ACTIVITY_ARCHIVE_BATCH_SIZE
+    cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+    hot = ActivityLog.__table__
+    archived = 0
+    while True:
+        with database.get_engine().begin() as conn:
+            ids = conn.execute(
+                select(hot.c.id).where(hot.c.created_at < cutoff).order_by(hot.c.id).limit(batch_size)
+            ).scalars().all()
+            if not ids:
+                break
+            conn.execute(
+                insert(ActivityLogArchive.__table__).from_select(
+                    [c.name for c in hot.columns],
+                    select(*hot.columns).where(hot.c.id.in_(ids))
+                )
+            )
+            conn.execute(delete(hot).where(hot.c.id.in_(ids)))
+        archived += len(ids)
+        logger.info(f"Archived {archived} activity rows older than {cutoff.isoformat()}")
+    return archived
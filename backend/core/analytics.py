@@ -0,0 +1,299 @@
+import logging
+import os
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+from sqlalchemy import bindparam, case, delete, event, func, insert, inspect, select, union_all, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from models import database
+from models.activity_log import ActivityLog
+from models.activity_log_archive import ActivityLogArchive
+from models.sprint import Sprint
+from models.sprint_snapshot import SprintSnapshot
+from models.task import Task
+
+logger = logging.getLogger(__name__)
+
+ANALYTICS_BACKFILL_BATCH_SIZE = int(os.getenv("ANALYTICS_BACKFILL_BATCH_SIZE", "2000"))
+NOT_STARTED_STATUS = "todo"
+DONE_STATUS = "done"
+TRACKED_FIELDS = ("sprint_id", "story_points", "status")
+TOTAL_COLUMNS = ("total_points", "done_points", "total_tasks", "done_tasks")
+DELTA_COLUMNS = TOTAL_COLUMNS + ("scope_added_points", "scope_removed_points")
+
+PENDING_KEY = "pending_sprint_changes"
+UPSERT_INSERTS = {"mysql": mysql_insert, "postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
+def initial_timestamps(status, at):
+    """started_at/completed_at for a task created in ``status`` at ``at``."""
+    return {
+        "started_at": at if status != NOT_STARTED_STATUS else None,
+        "completed_at": at if status == DONE_STATUS else None,
+    }
+
+def status_timestamps(old_status, new_status, started_at, at):
+    """The started_at/completed_at changes for a task moving from ``old_status`` to ``new_status``."""
+    values = {}
+    if old_status == new_status:
+        return values
+    if new_status != NOT_STARTED_STATUS and started_at is None:
+        values["started_at"] = at
+    if new_status == DONE_STATUS:
+        values["completed_at"] = at
+    elif old_status == DONE_STATUS:
+        # Reopened: cycle time counts from the original start to the final "done"
+        values["completed_at"] = None
+    return values
+
+def _add_scope(entry, delta):
+    if delta > 0:
+        entry["scope_added_points"] += delta
+    elif delta < 0:
+        entry["scope_removed_points"] -= delta
+
+def _add_task(entry, values, sign):
+    # Counts a task's state into (sign 1) or out of (sign -1) a sprint's totals
+    points = (values.get("story_points") or 0) * sign
+    done = values.get("status") == DONE_STATUS
+    entry["total_points"] += points
+    entry["total_tasks"] += sign
+    if done:
+        entry["done_points"] += points
+        entry["done_tasks"] += sign
+
+def track_task_change(db: Session, old, new):
+    """Queue deltas to today's snapshot for the sprints a task write touches.
+
+    ``old`` and ``new`` map the TRACKED_FIELDS to the task's values before and after the write;
+    pass None for a task being created or deleted. Points entering or leaving a sprint are
+    recorded as scope changes.
+    """
+    old = old or {}
+    new = new or {}
+    if all(old.get(key) == new.get(key) for key in TRACKED_FIELDS):
+        return
+    pending = db.info.setdefault(PENDING_KEY, {})
+    old_sprint, new_sprint = old.get("sprint_id"), new.get("sprint_id")
+    old_points, new_points = old.get("story_points") or 0, new.get("story_points") or 0
+    if old_sprint is not None:
+        _add_task(pending.setdefault(old_sprint, dict.fromkeys(DELTA_COLUMNS, 0)), old, -1)
+    if new_sprint is not None:
+        _add_task(pending.setdefault(new_sprint, dict.fromkeys(DELTA_COLUMNS, 0)), new, 1)
+    if old_sprint == new_sprint:
+        if old_sprint is not None:
+            _add_scope(pending[old_sprint], new_points - old_points)
+        return
+    if old_sprint is not None:
+        pending[old_sprint]["scope_removed_points"] += old_points
+    if new_sprint is not None:
+        pending[new_sprint]["scope_added_points"] += new_points
+
+def mark_sprint_changed(db: Session, sprint_id):
+    """Refresh the sprint's snapshot for today when the session commits, e.g. when it starts or completes."""
+    db.info.setdefault(PENDING_KEY, {}).setdefault(sprint_id, dict.fromkeys(DELTA_COLUMNS, 0))
+
+def _tracked(task, before=False):
+    values = {}
+    state = inspect(task)
+    for key in TRACKED_FIELDS:
+        history = state.attrs[key].history
+        values[key] = history.deleted[0] if before and history.deleted else getattr(task, key)
+    return values
+
+@event.listens_for(Session, "before_flush")
+def _track_task_status(session, flush_context, instances):
+    now = datetime.utcnow()
+    for obj in session.new:
+        if isinstance(obj, Task):
+            if obj.started_at is None and obj.completed_at is None:
+                for key, value in initial_timestamps(obj.status or NOT_STARTED_STATUS, now).items():
+                    setattr(obj, key, value)
+            track_task_change(session, None, _tracked(obj))
+    for obj in session.dirty:
+        if isinstance(obj, Task) and obj not in session.deleted:
+            old, new = _tracked(obj, before=True), _tracked(obj)
+            for key, value in status_timestamps(old["status"], new["status"], obj.started_at, now).items():
+                setattr(obj, key, value)
+            track_task_change(session, old, new)
+    for obj in session.deleted:
+        if isinstance(obj, Task):
+            track_task_change(session, _tracked(obj, before=True), None)
+
+def _sprint_totals(db: Session, sprint_ids):
+    is_done = Task.status == DONE_STATUS
+    rows = db.execute(
+        select(
+            Task.sprint_id,
+            func.coalesce(func.sum(Task.story_points), 0),
+            func.coalesce(func.sum(case((is_done, Task.story_points), else_=0)), 0),
+            func.count(Task.id),
+            func.sum(case((is_done, 1), else_=0)),
+        ).where(Task.sprint_id.in_(sprint_ids)).group_by(Task.sprint_id)
+    ).all()
+    return {row[0]: dict(zip(TOTAL_COLUMNS, (int(value or 0) for value in row[1:]))) for row in rows}
+
+def _snapshot_upsert(db: Session, values, deltas):
+    table = SprintSnapshot.__table__
+    dialect = db.get_bind().dialect.name
+    stmt = UPSERT_INSERTS[dialect](table).values(**values)
+    # A concurrent commit created the row first: its totals predate ours, so only add our deltas
+    updates = {key: table.c[key] + deltas[key] for key in DELTA_COLUMNS}
+    updates["updated_at"] = values["updated_at"]
+    if dialect == "mysql":
+        return stmt.on_duplicate_key_update(**updates)
+    return stmt.on_conflict_do_update(index_elements=["sprint_id", "day"], set_=updates)
+
+def write_sprint_snapshots(db: Session, changes):
+    """Apply ``changes`` (sprint_id -> column deltas) to each sprint's snapshot for today.
+
+    Only the first write of the day recomputes a sprint's totals, to seed its row; every later
+    write adds its deltas in place.
+    """
+    table = SprintSnapshot.__table__
+    now = datetime.utcnow()
+    # Sprint order keeps concurrent commits from deadlocking on each other's snapshot rows
+    for sprint_id in sorted(changes):
+        deltas = changes[sprint_id]
+        updated = db.execute(
+            update(table).where(table.c.sprint_id == sprint_id, table.c.day == now.date())
+            .values(updated_at=now, **{key: table.c[key] + deltas[key] for key in DELTA_COLUMNS})
+        ).rowcount
+        if updated:
+            continue
+        # The session is flushed, so the recomputed totals already include this transaction's changes
+        values = dict.fromkeys(TOTAL_COLUMNS, 0)
+        values.update(_sprint_totals(db, [sprint_id]).get(sprint_id, {}))
+        values.update(
+            sprint_id=sprint_id, day=now.date(), updated_at=now,
+            scope_added_points=deltas["scope_added_points"], scope_removed_points=deltas["scope_removed_points"],
+        )
+        db.execute(_snapshot_upsert(db, values, deltas))
+
+@event.listens_for(Session, "before_commit")
+def _write_pending_snapshots(session):
+    # Commit flushes after this hook, so flush here to collect the last task changes first
+    session.flush()
+    changes = session.info.pop(PENDING_KEY, None)
+    if changes:
+        write_sprint_snapshots(session, changes)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_snapshots(session):
+    session.info.pop(PENDING_KEY, None)
+
+def _status_transitions(conn, task_ids):
+    """Status changes per task, oldest first, read from the hot activity table and the archive."""
+    statements = [
+        select(model.task_id, model.created_at, model.id, model.old_value, model.new_value).where(
+            model.task_id.in_(task_ids), model.field_changed == "status"
+        )
+        for model in (ActivityLog, ActivityLogArchive)
+    ]
+    transitions = defaultdict(list)
+    for task_id, created_at, _, old, new in sorted(conn.execute(union_all(*statements)).all(), key=lambda r: (r[0], r[1], r[2])):
+        transitions[task_id].append((created_at, old, new))
+    return transitions
+
+def _replay(status, created_at, transitions, until=None):
+    """Replay a task's status history up to ``until``; returns (status, started_at, completed_at)."""
+    if transitions:
+        status = transitions[0][1] or NOT_STARTED_STATUS
+    timings = initial_timestamps(status, created_at)
+    for at, old, new in transitions:
+        if until is not None and at >= until:
+            break
+        timings.update(status_timestamps(status, new, timings["started_at"], at))
+        status = new
+    return status, timings["started_at"], timings["completed_at"]
+
+def _backfill_task_timings(project_id, batch_size):
+    tasks = Task.__table__
+    stmt = update(tasks).where(tasks.c.id == bindparam("task_id")).values(
+        started_at=bindparam("started"),
+        completed_at=bindparam("completed"),
+        # Leave updated_at (and the task's ETag) untouched
+        updated_at=tasks.c.updated_at,
+    )
+    last_id = 0
+    updated = 0
+    while True:
+        with database.get_engine().begin() as conn:
+            query = select(tasks.c.id, tasks.c.status, tasks.c.created_at).where(tasks.c.id > last_id)
+            if project_id is not None:
+                query = query.where(tasks.c.project_id == project_id)
+            rows = conn.execute(query.order_by(tasks.c.id).limit(batch_size)).all()
+            if not rows:
+                return updated
+            transitions = _status_transitions(conn, [row.id for row in rows])
+            params = []
+            for row in rows:
+                status, started, completed = _replay(row.status, row.created_at, transitions.get(row.id, []))
+                if status != row.status:
+                    # History does not end in the current status (e.g. archived or trimmed rows)
+                    status, started, completed = row.status, started or row.created_at, None
+                if status == DONE_STATUS and completed is None:
+                    completed = started or row.created_at
+                params.append({"task_id": row.id, "started": started, "completed": completed})
+            conn.execute(stmt, params)
+        updated += len(rows)
+        last_id = rows[-1].id
+        logger.info(f"Backfilled status timestamps for {updated} tasks")
+
+def _backfill_sprint(conn, sprint, today):
+    start, end = sprint.start_date.date(), min(sprint.end_date.date(), today)
+    conn.execute(delete(SprintSnapshot.__table__).where(SprintSnapshot.sprint_id == sprint.id))
+    if start > end:
+        return 0
+    tasks = conn.execute(
+        select(Task.id, Task.status, Task.story_points, Task.created_at).where(Task.sprint_id == sprint.id)
+    ).all()
+    transitions = _status_transitions(conn, [task.id for task in tasks]) if tasks else {}
+    now = datetime.utcnow()
+    rows = []
+    day = start
+    while day <= end:
+        until = datetime.combine(day + timedelta(days=1), time.min)
+        values = dict.fromkeys(TOTAL_COLUMNS, 0)
+        added = 0
+        for task in tasks:
+            created_at = task.created_at or sprint.start_date
+            if created_at >= until:
+                continue
+            points = task.story_points or 0
+            if day > start and created_at.date() == day:
+                added += points
+            status = _replay(task.status, created_at, transitions.get(task.id, []), until)[0]
+            values["total_points"] += points
+            values["total_tasks"] += 1
+            if status == DONE_STATUS:
+                values["done_points"] += points
+                values["done_tasks"] += 1
+        rows.append({**values, "sprint_id": sprint.id, "day": day, "updated_at": now,
+                     "scope_added_points": added, "scope_removed_points": 0})
+        day += timedelta(days=1)
+    conn.execute(insert(SprintSnapshot.__table__), rows)
+    return len(rows)
+
+def backfill_analytics(project_id=None, batch_size=None):
+    """Rebuild task status timestamps and daily sprint snapshots from the activity history.
+
+    Sprint membership and story points are taken as they are now: the activity log records
+    status moves reliably, but not every historical points or sprint change.
+    """
+    batch_size = batch_size or ANALYTICS_BACKFILL_BATCH_SIZE
+    tasks = _backfill_task_timings(project_id, batch_size)
+    today = datetime.utcnow().date()
+    query = select(Sprint.id, Sprint.start_date, Sprint.end_date).order_by(Sprint.id)
+    if project_id is not None:
+        query = query.where(Sprint.project_id == project_id)
+    snapshots = 0
+    with database.get_engine().connect() as conn:
+        sprints = conn.execute(query).all()
+    for sprint in sprints:
+        # One transaction per sprint keeps lock time short on large histories
+        with database.get_engine().begin() as conn:
+            snapshots += _backfill_sprint(conn, sprint, today)
+    logger.info(f"Wrote {snapshots} snapshots for {len(sprints)} sprints")
+    return tasks, snapshots
@@ -0,0 +1,49 @@
+import functools
+import inspect
+from fastapi import APIRouter, Depends
+from fastapi.routing import APIRoute
+from models.database import get_async_db, get_async_read_db, get_read_db
+
+ROUTE_OPTIONS = (
+    "response_model", "status_code", "tags", "summary", "description", "response_description",
+    "responses", "deprecated", "operation_id", "response_class", "name", "include_in_schema",
+)
+
+def _async_dependency(default):
+    # Read-only handlers keep going to the replicas
+    return get_async_read_db if getattr(default, "dependency", None) is get_read_db else get_async_db
+
+def run_in_async_session(endpoint):
+    """Wrap a sync handler taking ``db: Session`` into a coroutine backed by an AsyncSession.
+
+    The handler body runs through ``AsyncSession.run_sync``: its queries are awaited on the
+    event loop via the asyncio driver, so no threadpool worker is held while MySQL works.
+    """
+    signature = inspect.signature(endpoint)
+    parameters = [
+        p.replace(default=Depends(_async_dependency(p.default))) if p.name == "db" else p
+        for p in signature.parameters.values()
+    ]
+
+    @functools.wraps(endpoint)
+    async def wrapper(**kwargs):
+        db = kwargs.pop("db")
+        return await db.run_sync(lambda session: endpoint(db=session, **kwargs))
+
+    wrapper.__signature__ = signature.replace(parameters=parameters)
+    return wrapper
+
+def async_router(router: APIRouter):
+    converted = APIRouter()
+    for route in router.routes:
+        endpoint = getattr(route, "endpoint", None)
+        if (
+            not isinstance(route, APIRoute)
+            or inspect.iscoroutinefunction(endpoint)
+            or "db" not in inspect.signature(endpoint).parameters
+        ):
+            converted.routes.append(route)
+            continue
+        options = {option: getattr(route, option) for option in ROUTE_OPTIONS}
+        converted.add_api_route(route.path, run_in_async_session(endpoint), methods=list(route.methods), **options)
+    return converted
@@ -0,0 +1,200 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from sqlalchemy.util.concurrency import await_only, in_greenlet
+
+logger = logging.getLogger(__name__)
+
+# Optional shared backend so every worker sees the same entries and invalidations, e.g. redis://redis:6379/1
+CACHE_BACKEND_URL = os.getenv("CACHE_BACKEND_URL", "")
+REFERENCE_CACHE_TTL = float(os.getenv("REFERENCE_CACHE_TTL", "60"))
+REFERENCE_CACHE_MAX_ENTRIES = int(os.getenv("REFERENCE_CACHE_MAX_ENTRIES", "1024"))
+
+class TTLCache:
+    """In-process cache with per-entry TTL and, when ``maxsize`` is set, least-recently-used eviction."""
+
+    def __init__(self, ttl, maxsize=None):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, generation=None):
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            # A load that raced with an invalidation would otherwise put stale data back
+            if generation is not None and generation != self._generation:
+                return
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+                    self.evictions += 1
+
+    def invalidate(self, key=None):
+        with self._lock:
+            self._generation += 1
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+    def generation(self):
+        return self._generation
+
+    def get_or_load(self, key, loader):
+        """Read-through lookup; ``None`` results are not cached."""
+        value = self.get(key)
+        if value is None:
+            generation = self.generation()
+            value = loader()
+            if value is not None:
+                self.set(key, value, generation)
+        return value
+
+    def stats(self):
+        return {
+            "backend": "memory",
+            "size": len(self._data),
+            "max_size": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+class RedisCache(TTLCache):
+    """Shared cache in Redis; values must be JSON-serializable. Eviction is left to Redis' maxmemory policy."""
+
+    KEY_PREFIX = "taskforge:cache:"
+
+    def __init__(self, url, namespace, ttl):
+        import redis
+
+        super().__init__(ttl)
+        self.url = url
+        self.redis = redis.from_url(url)
+        self._async_redis = None
+        self.prefix = f"{self.KEY_PREFIX}{namespace}:"
+        # Bumped by every invalidation on any worker, so a load that raced with one is not stored
+        self.generation_key = f"{self.KEY_PREFIX}generation:{namespace}"
+
+    def _run(self, operation, async_operation=None):
+        # DB_ASYNC handlers run inside AsyncSession.run_sync, in a greenlet on the event loop thread. There
+        # the command is awaited on the asyncio client, the way the session awaits aiomysql, instead of
+        # blocking the loop on a socket read.
+        if in_greenlet():
+            if self._async_redis is None:
+                import redis.asyncio
+
+                self._async_redis = redis.asyncio.from_url(self.url)
+            return await_only((async_operation or operation)(self._async_redis))
+        return operation(self.redis)
+
+    def get(self, key):
+        try:
+            raw = self._run(lambda client: client.get(f"{self.prefix}{key}"))
+        except Exception as e:
+            logger.warning(f"Cache read failed, falling back to the database: {str(e)}")
+            raw = None
+        if raw is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(raw)
+
+    def generation(self):
+        try:
+            return int(self._run(lambda client: client.get(self.generation_key)) or 0)
+        except Exception as e:
+            logger.warning(f"Cache read failed: {str(e)}")
+            return None
+
+    def set(self, key, value, generation=None):
+        if self.ttl <= 0:
+            return
+        import redis
+
+        name = f"{self.prefix}{key}"
+        raw = json.dumps(value)
+
+        def store(client):
+            with client.pipeline() as pipe:
+                # WATCH aborts the write if an invalidation lands between the check and the SET
+                pipe.watch(self.generation_key)
+                if generation is not None and int(pipe.get(self.generation_key) or 0) != generation:
+                    return
+                pipe.multi()
+                pipe.set(name, raw, px=int(self.ttl * 1000))
+                pipe.execute()
+
+        async def store_async(client):
+            async with client.pipeline() as pipe:
+                await pipe.watch(self.generation_key)
+                if generation is not None and int(await pipe.get(self.generation_key) or 0) != generation:
+                    return
+                pipe.multi()
+                pipe.set(name, raw, px=int(self.ttl * 1000))
+                await pipe.execute()
+
+        try:
+            self._run(store, store_async)
+        except redis.WatchError:
+            return
+        except Exception as e:
+            logger.warning(f"Cache write failed: {str(e)}")
+
+    def invalidate(self, key=None):
+        pattern = f"{self.prefix}*"
+
+        async def scan_async(client):
+            return [name async for name in client.scan_iter(match=pattern)]
+
+        try:
+            self._run(lambda client: client.incr(self.generation_key))
+            if key is None:
+                keys = self._run(lambda client: list(client.scan_iter(match=pattern)), scan_async)
+            else:
+                keys = [f"{self.prefix}{key}"]
+            if keys:
+                self._run(lambda client: client.delete(*keys))
+        except Exception as e:
+            # Entries that could not be dropped still expire with their TTL
+            logger.warning(f"Cache invalidation failed: {str(e)}")
+
+    def stats(self):
+        return {"backend": "redis", "ttl": self.ttl, "hits": self.hits, "misses": self.misses}
+
+caches = {}
+
+def create_cache(namespace, ttl=REFERENCE_CACHE_TTL, maxsize=REFERENCE_CACHE_MAX_ENTRIES):
+    if CACHE_BACKEND_URL.startswith("redis"):
+        cache = RedisCache(CACHE_BACKEND_URL, namespace, ttl)
+    else:
+        cache = TTLCache(ttl, maxsize)
+    caches[namespace] = cache
+    return cache
@@ -0,0 +1,61 @@
+from collections import defaultdict
+from datetime import datetime
+from sqlalchemy import event, select, update
+from sqlalchemy.orm import Session
+from models.project import Project
+from models.task import Task
+from models.task_tombstone import TaskTombstone
+
+def allocate_change_seqs(db: Session, project_id, count=1):
+    """Reserve ``count`` consecutive change sequence numbers for a project.
+
+    The UPDATE holds the project row lock until the transaction ends, so writers to one project
+    commit in sequence order and a reader can never skip past a change that is still in flight.
+    """
+    projects = Project.__table__
+    db.execute(
+        update(projects)
+        .where(projects.c.id == project_id)
+        # Keep the project's own updated_at (and its ETag) untouched by task writes
+        .values(change_seq=projects.c.change_seq + count, updated_at=projects.c.updated_at)
+    )
+    last = db.execute(select(projects.c.change_seq).where(projects.c.id == project_id)).scalar_one()
+    return range(last - count + 1, last + 1)
+
+def allocate_for_projects(db: Session, counts):
+    # Always lock projects in id order so concurrent multi-project writes cannot deadlock
+    return {project_id: iter(allocate_change_seqs(db, project_id, counts[project_id])) for project_id in sorted(counts)}
+
+@event.listens_for(Session, "before_flush")
+def _stamp_task_changes(session, flush_context, instances):
+    deleted_projects = {obj.id for obj in session.deleted if isinstance(obj, Project)}
+    changed = [
+        obj for obj in session.new
+        if isinstance(obj, Task) and obj.change_seq is None
+    ] + [
+        obj for obj in session.dirty
+        if isinstance(obj, Task) and session.is_modified(obj) and obj not in session.deleted
+    ]
+    # Tasks going away with their project need no tombstone: the whole feed disappears
+    deleted = [
+        obj for obj in session.deleted
+        if isinstance(obj, Task) and obj.project_id not in deleted_projects
+    ]
+    if not changed and not deleted:
+        return
+
+    counts = defaultdict(int)
+    for task in changed + deleted:
+        counts[task.project_id] += 1
+    seqs = allocate_for_projects(session, counts)
+
+    for task in changed:
+        task.change_seq = next(seqs[task.project_id])
+    now = datetime.utcnow()
+    for task in deleted:
+        session.add(TaskTombstone(
+            project_id=task.project_id,
+            task_id=task.id,
+            change_seq=next(seqs[task.project_id]),
+            deleted_at=now,
+        ))
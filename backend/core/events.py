@@ -0,0 +1,159 @@
+import abc
+import asyncio
+import contextlib
+import json
+import logging
+import os
+from datetime import datetime
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+EVENTS_BROKER_URL = os.getenv("EVENTS_BROKER_URL", "")
+EVENTS_SUBSCRIBER_QUEUE_SIZE = int(os.getenv("EVENTS_SUBSCRIBER_QUEUE_SIZE", "256"))
+
+PENDING_KEY = "pending_events"
+RESYNC_MESSAGE = json.dumps({"type": "resync"})
+
+class Subscriber:
+    def __init__(self, project_id, max_queue):
+        self.project_id = project_id
+        self.queue = asyncio.Queue(maxsize=max_queue)
+        self.dropped = 0
+
+    def offer(self, message):
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # A slow client must not hold events for everyone else: drop its backlog and tell it to refetch
+            self.dropped += self.queue.qsize()
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC_MESSAGE)
+
+    async def get(self):
+        return await self.queue.get()
+
+class Broker(abc.ABC):
+    """Carries published events to every worker's hub; ``deliver(project_id, message)`` is the hub side."""
+
+    async def start(self, deliver):
+        self.deliver = deliver
+
+    @abc.abstractmethod
+    async def publish(self, project_id, message):
+        ...
+
+    async def stop(self):
+        pass
+
+class LocalBroker(Broker):
+    async def publish(self, project_id, message):
+        self.deliver(project_id, message)
+
+class RedisBroker(Broker):
+    CHANNEL_PREFIX = "taskforge:project:"
+
+    def __init__(self, url):
+        self.url = url
+        self._listener = None
+
+    async def start(self, deliver):
+        import redis.asyncio as redis
+
+        await super().start(deliver)
+        self.redis = redis.from_url(self.url)
+        self.pubsub = self.redis.pubsub()
+        await self.pubsub.psubscribe(f"{self.CHANNEL_PREFIX}*")
+        self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self):
+        async for item in self.pubsub.listen():
+            if item["type"] != "pmessage":
+                continue
+            channel = item["channel"].decode()
+            message = item["data"].decode()
+            self.deliver(int(channel[len(self.CHANNEL_PREFIX):]), message)
+
+    async def publish(self, project_id, message):
+        await self.redis.publish(f"{self.CHANNEL_PREFIX}{project_id}", message)
+
+    async def stop(self):
+        if self._listener:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+        await self.pubsub.aclose()
+        await self.redis.aclose()
+
+class EventHub:
+    def __init__(self, broker, max_queue):
+        self.broker = broker
+        self.max_queue = max_queue
+        self.subscribers = {}
+        self.loop = None
+
+    async def start(self):
+        self.loop = asyncio.get_running_loop()
+        await self.broker.start(self.deliver)
+
+    async def stop(self):
+        await self.broker.stop()
+        self.loop = None
+
+    def publish(self, project_id, payload):
+        """Thread-safe: callable from threadpool handlers as well as from the event loop."""
+        if self.loop is None:
+            return
+        message = json.dumps(payload, default=_json_default)
+        future = asyncio.run_coroutine_threadsafe(self.broker.publish(project_id, message), self.loop)
+        future.add_done_callback(_log_publish_error)
+
+    def deliver(self, project_id, message):
+        for subscriber in list(self.subscribers.get(project_id, ())):
+            subscriber.offer(message)
+
+    @contextlib.contextmanager
+    def subscribe(self, project_id):
+        subscriber = Subscriber(project_id, self.max_queue)
+        self.subscribers.setdefault(project_id, set()).add(subscriber)
+        try:
+            yield subscriber
+        finally:
+            subscribers = self.subscribers.get(project_id)
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del self.subscribers[project_id]
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _log_publish_error(future):
+    if not future.cancelled() and future.exception():
+        logger.error(f"Failed to publish event: {future.exception()}")
+
+def create_broker():
+    if EVENTS_BROKER_URL.startswith("redis"):
+        return RedisBroker(EVENTS_BROKER_URL)
+    return LocalBroker()
+
+event_hub = EventHub(create_broker(), EVENTS_SUBSCRIBER_QUEUE_SIZE)
+
+def notify_task_change(db: Session, event_type, project_id, task_id, fields=None):
+    """Queue a task event on the session; it is broadcast only once the transaction commits."""
+    payload = {"type": event_type, "project_id": project_id, "task_id": task_id}
+    if fields:
+        payload["fields"] = fields
+    db.info.setdefault(PENDING_KEY, []).append(payload)
+
+@event.listens_for(Session, "after_commit")
+def _publish_committed_events(session):
+    for payload in session.info.pop(PENDING_KEY, ()):
+        event_hub.publish(payload["project_id"], payload)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_events(session):
+    session.info.pop(PENDING_KEY, None)
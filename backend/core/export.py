@@ -0,0 +1,55 @@
+import csv
+import io
+import zlib
+from datetime import datetime
+import orjson
+from fastapi.responses import StreamingResponse
+from models import database
+
+EXPORT_BATCH_SIZE = 2000
+MEDIA_TYPES = {"csv": "text/csv; charset=utf-8", "ndjson": "application/x-ndjson"}
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+def _encode_csv(rows, columns, header):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(columns)
+    writer.writerows([_csv_value(value) for value in row] for row in rows)
+    return buffer.getvalue().encode()
+
+def _encode_ndjson(rows, columns):
+    return b"".join(orjson.dumps(dict(zip(columns, row))) + b"\n" for row in rows)
+
+def _iter_export(statements, columns, fmt, compress):
+    compressor = zlib.compressobj(wbits=31) if compress else None
+    header = fmt == "csv"
+    # A dedicated connection: request-scoped sessions may be closed before the body finishes streaming
+    with database.get_engine().connect() as conn:
+        for statement in statements:
+            result = conn.execution_options(stream_results=True, yield_per=EXPORT_BATCH_SIZE).execute(statement)
+            for rows in result.partitions():
+                chunk = _encode_csv(rows, columns, header) if fmt == "csv" else _encode_ndjson(rows, columns)
+                header = False
+                yield compressor.compress(chunk) if compressor else chunk
+    if header:
+        yield compressor.compress(_encode_csv([], columns, True)) if compressor else _encode_csv([], columns, True)
+    if compressor:
+        yield compressor.flush()
+
+def export_response(statements, columns, fmt, filename, compress=False):
+    """Stream the rows of ``statements`` (run in order) as CSV or NDJSON through a server-side cursor."""
+    headers = {"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'}
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(
+        _iter_export(statements, columns, fmt, compress),
+        media_type=MEDIA_TYPES[fmt],
+        headers=headers,
+    )
@@ -0,0 +1,245 @@
+import codecs
+import csv
+import json
+import logging
+import os
+import weakref
+from datetime import datetime
+from pydantic import ValidationError
+from sqlalchemy import insert, text
+from sqlalchemy.orm import Session
+from core.activity_log import activity_row
+from core.analytics import initial_timestamps, track_task_change
+from core.changes import allocate_change_seqs
+from core.events import notify_task_change
+from core.ranking import append_ranks
+from core.search import queue_search_op
+from models.activity_log import ActivityLog
+from models.sprint import Sprint
+from models.task import Task
+from models.user import User
+from schemas.task import TaskCreate
+
+logger = logging.getLogger(__name__)
+
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", "2000"))
+IMPORT_MAX_REPORTED_ERRORS = 1000
+READ_SIZE = 64 * 1024
+
+# Per engine: whether a multi-row INSERT is guaranteed one consecutive block of task ids
+_consecutive_ids = weakref.WeakKeyDictionary()
+
+def _has_consecutive_ids(db: Session):
+    engine = db.get_bind().engine
+    if engine not in _consecutive_ids:
+        consecutive = False
+        if engine.dialect.name in ("mysql", "mariadb"):
+            lock_mode = db.execute(text("SELECT @@innodb_autoinc_lock_mode")).scalar()
+            table_engine = db.execute(text(
+                "SELECT ENGINE FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'tasks'"
+            )).scalar()
+            triggers = db.execute(text(
+                "SELECT COUNT(*) FROM information_schema.TRIGGERS "
+                "WHERE EVENT_OBJECT_SCHEMA = DATABASE() AND EVENT_OBJECT_TABLE = 'tasks'"
+            )).scalar()
+            consecutive = lock_mode in (1, 2) and (table_engine or "").lower() == "innodb" and not triggers
+            if not consecutive:
+                logger.warning(
+                    f"Task ids are assigned per row (innodb_autoinc_lock_mode={lock_mode}, engine={table_engine}, "
+                    f"triggers={triggers}); bulk inserts will be slower"
+                )
+        _consecutive_ids[engine] = consecutive
+    return _consecutive_ids[engine]
+
+def insert_tasks(db: Session, rows):
+    """Insert task rows, in one statement where the new ids can be known, and return the new ids in order."""
+    if db.get_bind().dialect.insert_executemany_returning:
+        stmt = insert(Task).returning(Task.id, sort_by_parameter_order=True)
+        return list(db.scalars(stmt, rows))
+
+    if _has_consecutive_ids(db):
+        # MySQL has no INSERT ... RETURNING. A single multi-row INSERT knows its row count up front, so
+        # InnoDB reserves one consecutive id block for it (autoinc lock modes 1 and 2) starting at LAST_INSERT_ID()
+        first_id = db.execute(insert(Task).values(rows)).lastrowid
+        step = db.execute(text("SELECT @@auto_increment_increment")).scalar_one()
+        return [first_id + i * step for i in range(len(rows))]
+
+    # Otherwise let the unit of work collect lastrowid per row
+    tasks = [Task(**row) for row in rows]
+    db.add_all(tasks)
+    db.flush()
+    return [task.id for task in tasks]
+
+def iter_csv(stream, encoding="utf-8"):
+    lines = codecs.iterdecode(stream, encoding)
+    for record in csv.DictReader(lines):
+        # Blank CSV cells mean "not set", not empty strings
+        yield {key: (value if value != "" else None) for key, value in record.items() if key}
+
+def iter_ndjson(stream):
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            # One bad line fails that row only; the rest of the file still imports
+            yield ValueError(f"Invalid JSON: {e}")
+
+def iter_json_array(stream, encoding="utf-8"):
+    """Yield the objects of a top-level JSON array without loading the whole document."""
+    decoder = json.JSONDecoder()
+    reader = codecs.getincrementaldecoder(encoding)()
+    buffer = ""
+    position = 0
+    started = False
+    while True:
+        chunk = stream.read(READ_SIZE)
+        buffer = buffer[position:] + reader.decode(chunk, final=not chunk)
+        position = 0
+        while True:
+            while position < len(buffer) and (buffer[position].isspace() or buffer[position] == ","):
+                position += 1
+            if position == len(buffer):
+                break
+            if not started:
+                if buffer[position] != "[":
+                    raise ValueError("Expected a JSON array of task objects")
+                started = True
+                position += 1
+                continue
+            if buffer[position] == "]":
+                return
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if not chunk:
+                    raise
+                break  # The object continues in the next chunk
+            yield value
+            position = end
+        if not chunk:
+            raise ValueError("Unterminated JSON array")
+
+READERS = {"csv": iter_csv, "ndjson": iter_ndjson, "json": iter_json_array}
+
+class TaskImporter:
+    """Validates task records, resolves people and sprints by name, and inserts them in batched transactions.
+
+    Records use the TaskCreate fields; ``assignee``, ``creator`` (username or email) and ``sprint``
+    (sprint name within the project) may be given instead of the matching ids.
+    """
+
+    def __init__(self, db: Session, project_id, default_creator=None, batch_size=IMPORT_BATCH_SIZE):
+        self.db = db
+        self.project_id = project_id
+        self.batch_size = batch_size
+        self.users = {}
+        for user_id, username, email in db.query(User.id, User.username, User.email).all():
+            self.users[username.lower()] = user_id
+            self.users[email.lower()] = user_id
+        self.user_ids = set(self.users.values())
+        self.sprints = {
+            name.casefold(): sprint_id
+            for sprint_id, name in db.query(Sprint.id, Sprint.name).filter(Sprint.project_id == project_id).all()
+        }
+        self.sprint_ids = set(self.sprints.values())
+        self.default_creator = self._user(default_creator) if default_creator is not None else None
+        self.processed = 0
+        self.imported = 0
+        self.failed = 0
+        self.errors = []
+
+    def _user(self, value):
+        if value is None or value == "":
+            return None
+        if isinstance(value, int) or str(value).isdigit():
+            user_id = int(value)
+            if user_id not in self.user_ids:
+                raise LookupError(f"Unknown user id {user_id}")
+            return user_id
+        user_id = self.users.get(str(value).lower())
+        if user_id is None:
+            raise LookupError(f"Unknown user '{value}'")
+        return user_id
+
+    def _sprint(self, value):
+        if value is None or value == "":
+            return None
+        if isinstance(value, int) or str(value).isdigit():
+            if int(value) not in self.sprint_ids:
+                raise LookupError(f"Sprint {value} is not in this project")
+            return int(value)
+        sprint_id = self.sprints.get(str(value).casefold())
+        if sprint_id is None:
+            raise LookupError(f"Unknown sprint '{value}'")
+        return sprint_id
+
+    def _row(self, record):
+        record = dict(record)
+        assignee = record.pop("assignee", None)
+        creator = record.pop("creator", None)
+        sprint = record.pop("sprint", None)
+        record["project_id"] = self.project_id
+        record["assigned_to"] = self._user(record.get("assigned_to") or assignee)
+        record["created_by"] = self._user(record.get("created_by") or creator) or self.default_creator
+        record["sprint_id"] = self._sprint(record.get("sprint_id") or sprint)
+        return TaskCreate.model_validate({key: value for key, value in record.items() if value is not None}).model_dump()
+
+    def _fail(self, index, error):
+        self.failed += 1
+        if len(self.errors) < IMPORT_MAX_REPORTED_ERRORS:
+            self.errors.append({"row": index, "error": error})
+
+    def _write_batch(self, rows, last):
+        if rows:
+            seqs = iter(allocate_change_seqs(self.db, self.project_id, len(rows)))
+            now = datetime.utcnow()
+            ranks = append_ranks(self.db, [(self.project_id, row["status"]) for row in rows])
+            for row, rank in zip(rows, ranks):
+                row["change_seq"] = next(seqs)
+                row["rank"] = rank
+                row.update(initial_timestamps(row["status"], now))
+                track_task_change(self.db, None, row)
+            task_ids = insert_tasks(self.db, rows)
+            self.db.execute(insert(ActivityLog), [
+                activity_row(task_id, row["created_by"], "created", created_at=now)
+                for task_id, row in zip(task_ids, rows)
+            ])
+            for task_id, row in zip(task_ids, rows):
+                queue_search_op(self.db, ("task", task_id, self.project_id, {"title": row["title"], "description": row["description"]}))
+        if last:
+            # One refetch for open boards instead of an event per imported task
+            notify_task_change(self.db, "resync", self.project_id, None)
+        self.db.commit()
+        self.imported += len(rows)
+
+    def run(self, records):
+        """Import ``records``, yielding a progress dict after each committed batch."""
+        batch = []
+        for index, record in enumerate(records, start=1):
+            self.processed += 1
+            try:
+                if isinstance(record, ValueError):
+                    raise record
+                if not isinstance(record, dict):
+                    raise ValueError("Row is not an object")
+                batch.append(self._row(record))
+            except ValidationError as e:
+                self._fail(index, "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors()))
+            except (LookupError, ValueError) as e:
+                self._fail(index, str(e))
+            if len(batch) >= self.batch_size:
+                self._write_batch(batch, last=False)
+                batch = []
+                yield self.progress()
+        self._write_batch(batch, last=True)
+        if batch:
+            yield self.progress()
+
+    def progress(self):
+        return {"processed": self.processed, "imported": self.imported, "failed": self.failed}
+
+    def summary(self):
+        return {**self.progress(), "errors": self.errors}
@@ -0,0 +1,109 @@
+import contextvars
+import logging
+import os
+import time
+from sqlalchemy import event
+from core.metrics import LATENCY_BUCKETS, QUERY_COUNT_BUCKETS, LabeledHistograms
+
+logger = logging.getLogger(__name__)
+
+SQL_INSTRUMENTATION = os.getenv("SQL_INSTRUMENTATION", "true").lower() == "true"
+# Statements slower than this are logged with their bound parameters; 0 disables the log
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "200"))
+SLOW_QUERY_MAX_PARAMS_LENGTH = 2000
+
+class RequestStats:
+    __slots__ = ("scope", "queries", "db_seconds")
+
+    def __init__(self, scope):
+        self.scope = scope
+        self.queries = 0
+        self.db_seconds = 0.0
+
+    @property
+    def route(self):
+        # Routing stores the matched route on the scope, so this is only known once the handler runs
+        path = getattr(self.scope.get("route"), "path", None)
+        if path is None:
+            return "unmatched"
+        # Routes from an included router keep their unprefixed path; recover the prefix from the request path
+        try:
+            concrete = path.format(**self.scope.get("path_params", {}))
+        except (KeyError, IndexError, ValueError):
+            return path
+        request_path = self.scope.get("path", "")
+        if request_path.endswith(concrete):
+            return request_path[:len(request_path) - len(concrete)] + path
+        return path
+
+# Threadpool handlers and run_sync greenlets inherit the request's context, so engine events can find it
+current_request = contextvars.ContextVar("current_request", default=None)
+
+request_latency = LabeledHistograms(LATENCY_BUCKETS)
+request_db_time = LabeledHistograms(LATENCY_BUCKETS)
+request_queries = LabeledHistograms(QUERY_COUNT_BUCKETS)
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_started = time.perf_counter()
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_query_started", None)
+    if started is None:
+        return
+    elapsed = time.perf_counter() - started
+    stats = current_request.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_seconds += elapsed
+    if SLOW_QUERY_THRESHOLD_MS > 0 and elapsed * 1000 >= SLOW_QUERY_THRESHOLD_MS:
+        params = repr(parameters)
+        if len(params) > SLOW_QUERY_MAX_PARAMS_LENGTH:
+            params = params[:SLOW_QUERY_MAX_PARAMS_LENGTH] + "..."
+        route = stats.route if stats is not None else "-"
+        logger.warning(f"Slow query ({elapsed * 1000:.1f} ms, {route}): {' '.join(statement.split())} params={params}")
+
+def instrument_engine(engine):
+    """Count and time every statement on ``engine`` (a sync Engine, or an AsyncEngine's sync_engine)."""
+    if not SQL_INSTRUMENTATION or event.contains(engine, "after_cursor_execute", _after_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+class SQLInstrumentationMiddleware:
+    """Per-request query count and DB time, reported as Server-Timing and per-route histograms."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not SQL_INSTRUMENTATION:
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats(scope)
+        token = current_request.set(stats)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                # Streaming responses (SSE, exports) start before their queries finish; the header covers what ran so far
+                total_ms = (time.perf_counter() - started) * 1000
+                timing = (
+                    f'db;dur={stats.db_seconds * 1000:.2f};desc="{stats.queries} queries", '
+                    f"app;dur={total_ms:.2f}"
+                )
+                message["headers"] = list(message.get("headers", [])) + [(b"server-timing", timing.encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_request.reset(token)
+            labels = (("method", scope["method"]), ("route", stats.route), ("status", status))
+            request_latency.observe(labels, time.perf_counter() - started)
+            request_db_time.observe(labels[:2], stats.db_seconds)
+            request_queries.observe(labels[:2], stats.queries)
@@ -0,0 +1,61 @@
+import base64
+import json
+import os
+from datetime import datetime
+from fastapi import HTTPException
+from sqlalchemy import DateTime, and_, or_
+
+# Lists are always paged: a client that omits ``limit`` gets this many rows and an X-Next-Cursor
+DEFAULT_PAGE_SIZE = int(os.getenv("DEFAULT_PAGE_SIZE", "100"))
+MAX_PAGE_SIZE = 1000
+
+def encode_cursor(sort, values):
+    payload = [sort] + [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor, sort, columns):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(payload, list) or len(payload) != len(columns) + 1 or payload[0] != sort:
+        raise HTTPException(status_code=400, detail="Cursor does not match the requested sort")
+
+    values = []
+    for column, value in zip(columns, payload[1:]):
+        if value is not None and isinstance(column.type, DateTime):
+            try:
+                value = datetime.fromisoformat(value)
+            except (ValueError, TypeError):
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+        values.append(value)
+    return values
+
+def keyset_after(columns, values, descending=False):
+    # Expanded form of (c1, c2, ...) > (v1, v2, ...) so MySQL can use a range scan on the index
+    clauses = []
+    for i, (column, value) in enumerate(zip(columns, values)):
+        equal = [columns[j] == values[j] for j in range(i)]
+        step = column < value if descending else column > value
+        clauses.append(and_(*equal, step))
+    return or_(*clauses)
+
+def order_columns(columns, descending=False):
+    return [c.desc() if descending else c.asc() for c in columns]
+
+def paginate(query, columns, sort, limit=None, after=None, descending=False):
+    if after:
+        query = query.filter(keyset_after(columns, decode_cursor(after, sort, columns), descending))
+    query = query.order_by(*order_columns(columns, descending))
+    if limit is None:
+        return query.all(), None
+
+    rows = query.limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(sort, [getattr(last, c.key) for c in columns])
+    return rows, next_cursor
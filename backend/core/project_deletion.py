@@ -0,0 +1,160 @@
+import logging
+import os
+import threading
+from datetime import datetime, timedelta
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+from core.changes import allocate_change_seqs
+from core.events import notify_task_change
+from core.search import queue_search_op
+from models import database
+from models.activity_log import ActivityLog
+from models.activity_log_archive import ActivityLogArchive
+from models.comment import Comment
+from models.project import Project
+from models.project_deletion_job import ProjectDeletionJob
+from models.sprint import Sprint
+from models.sprint_snapshot import SprintSnapshot
+from models.task import Task
+from models.task_tombstone import TaskTombstone
+
+logger = logging.getLogger(__name__)
+
+PROJECT_DELETE_BATCH_SIZE = int(os.getenv("PROJECT_DELETE_BATCH_SIZE", "1000"))
+# Projects with more tasks than this are deleted by a background job instead of inside the request
+PROJECT_DELETE_INLINE_MAX_TASKS = int(os.getenv("PROJECT_DELETE_INLINE_MAX_TASKS", "2000"))
+# A running job whose progress has not moved for this long is taken to have died with its worker
+PROJECT_DELETE_STALE_SECONDS = int(os.getenv("PROJECT_DELETE_STALE_SECONDS", "300"))
+PROJECT_DELETE_CLAIM_TIMEOUT = int(os.getenv("PROJECT_DELETE_CLAIM_TIMEOUT", "10"))
+
+def _delete_tasks(db: Session, task_ids):
+    for model in (Comment, ActivityLog, ActivityLogArchive):
+        db.execute(delete(model).where(model.task_id.in_(task_ids)))
+    db.execute(delete(Task).where(Task.id.in_(task_ids)))
+    for task_id in task_ids:
+        queue_search_op(db, ("delete_task", task_id))
+
+def _task_ids(db: Session, project_id, limit=None):
+    return db.scalars(select(Task.id).where(Task.project_id == project_id).order_by(Task.id).limit(limit)).all()
+
+def delete_project_rows(db: Session, project_id, batch_size=None):
+    """Delete a project and everything under it with set-based DELETEs, children first.
+
+    Tasks go in batches of ``batch_size``, one transaction each, so no single statement holds
+    locks on the whole project; yields the running count of deleted tasks after each batch.
+    """
+    batch_size = batch_size or PROJECT_DELETE_BATCH_SIZE
+    deleted = 0
+    while True:
+        task_ids = _task_ids(db, project_id, batch_size)
+        if not task_ids:
+            break
+        _delete_tasks(db, task_ids)
+        # Bump the project's list version so cached task lists see each batch go
+        allocate_change_seqs(db, project_id)
+        db.commit()
+        deleted += len(task_ids)
+        yield deleted
+
+    # Locking the project row blocks task inserts against it, so nothing can slip in before it goes
+    db.execute(select(Project.id).where(Project.id == project_id).with_for_update())
+    late_task_ids = _task_ids(db, project_id)
+    if late_task_ids:
+        _delete_tasks(db, late_task_ids)
+    db.execute(delete(TaskTombstone).where(TaskTombstone.project_id == project_id))
+    sprint_ids = select(Sprint.id).where(Sprint.project_id == project_id)
+    db.execute(delete(SprintSnapshot).where(SprintSnapshot.sprint_id.in_(sprint_ids)))
+    db.execute(delete(Sprint).where(Sprint.project_id == project_id))
+    db.execute(delete(Project).where(Project.id == project_id))
+    notify_task_change(db, "resync", project_id, None)
+    db.commit()
+    if late_task_ids:
+        yield deleted + len(late_task_ids)
+
+def _job_status(job):
+    status = job.status
+    if status == "running" and job.heartbeat_at < datetime.utcnow() - timedelta(seconds=PROJECT_DELETE_STALE_SECONDS):
+        # The process running it went away; deleting the project again picks up the remaining tasks
+        status = "interrupted"
+    return {
+        "project_id": job.project_id,
+        "status": status,
+        "total_tasks": job.total_tasks,
+        "deleted_tasks": job.deleted_tasks,
+        "started_at": job.started_at.isoformat(),
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+        "error": job.error,
+    }
+
+def _update_job(project_id, **values):
+    jobs = ProjectDeletionJob.__table__
+    with database.get_engine().begin() as conn:
+        conn.execute(
+            update(jobs).where(jobs.c.project_id == project_id).values(heartbeat_at=datetime.utcnow(), **values)
+        )
+
+class ProjectDeletionJobs:
+    """Background deletions of large projects, tracked in project_deletion_jobs.
+
+    Any worker can report a job's progress, and the claim is taken under a named lock so two
+    workers asked to delete the same project do not both start.
+    """
+
+    def get(self, project_id):
+        database.get_engine()
+        db = database.SessionLocal()
+        try:
+            job = db.get(ProjectDeletionJob, project_id)
+            return _job_status(job) if job else None
+        finally:
+            db.close()
+
+    def start(self, project_id, total_tasks, on_finished=None):
+        """Start deleting ``project_id`` unless a deletion is already running, and return its status."""
+        database.get_engine()
+        db = database.SessionLocal()
+        try:
+            with database.advisory_lock(f"delete-project:{project_id}", PROJECT_DELETE_CLAIM_TIMEOUT):
+                job = db.get(ProjectDeletionJob, project_id)
+                if job and _job_status(job)["status"] == "running":
+                    return _job_status(job)
+                if job is None:
+                    job = ProjectDeletionJob(project_id=project_id)
+                    db.add(job)
+                now = datetime.utcnow()
+                job.status = "running"
+                job.total_tasks = total_tasks
+                job.deleted_tasks = 0
+                job.started_at = now
+                job.heartbeat_at = now
+                job.finished_at = None
+                job.error = None
+                db.commit()
+                status = _job_status(job)
+        finally:
+            db.close()
+        threading.Thread(
+            target=self._run, args=(project_id, total_tasks, on_finished),
+            name=f"delete-project-{project_id}", daemon=True,
+        ).start()
+        return status
+
+    def _run(self, project_id, total_tasks, on_finished):
+        database.get_engine()
+        db = database.SessionLocal()
+        status, error = "completed", None
+        try:
+            for deleted in delete_project_rows(db, project_id):
+                _update_job(project_id, deleted_tasks=deleted)
+                logger.info(f"Project {project_id}: deleted {deleted} of {total_tasks} tasks")
+        except Exception as e:
+            db.rollback()
+            logger.exception(f"Deleting project {project_id} failed")
+            status, error = "failed", str(e)
+        finally:
+            db.close()
+            if on_finished:
+                on_finished(project_id)
+        _update_job(project_id, status=status, error=error, finished_at=datetime.utcnow())
+
+deletion_jobs = ProjectDeletionJobs()
@@ -0,0 +1,289 @@
+import logging
+import os
+import queue
+import threading
+from collections import Counter
+from sqlalchemy import bindparam, event, func, inspect, select, update
+from sqlalchemy.orm import Session
+from core.changes import allocate_change_seqs
+from models import database
+from models.task import Task
+
+logger = logging.getLogger(__name__)
+
+# Lowercase base-36 sorts the same under binary and case-insensitive collations
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+# Columns whose keys grow past this are rewritten by the rebalancer
+RANK_REBALANCE_LENGTH = int(os.getenv("RANK_REBALANCE_LENGTH", "16"))
+RANK_APPEND_WIDTH = 6
+
+PENDING_KEY = "pending_rank_rebalances"
+_STOP = object()
+
+class RankConflict(ValueError):
+    pass
+
+def _midpoint(low, high):
+    if high is not None:
+        n = 0
+        while n < len(high) and (low[n] if n < len(low) else DIGITS[0]) == high[n]:
+            n += 1
+        if n:
+            return high[:n] + _midpoint(low[n:], high[n:])
+    low_digit = DIGITS.index(low[0]) if low else 0
+    high_digit = DIGITS.index(high[0]) if high is not None else len(DIGITS)
+    if high_digit - low_digit > 1:
+        return DIGITS[(low_digit + high_digit + 1) // 2]
+    if high is not None and len(high) > 1:
+        return high[0]
+    return DIGITS[low_digit] + _midpoint(low[1:], None)
+
+def rank_between(low=None, high=None):
+    """A key sorting strictly between ``low`` and ``high``; None leaves that side open.
+
+    Keys are base-36 fractions without trailing zeros, so there is always room between two of them.
+    """
+    if low is not None and high is not None and low >= high:
+        raise RankConflict(f"Rank {low!r} does not sort before {high!r}")
+    return _midpoint(low or "", high)
+
+def rank_after(low):
+    """The next key after ``low`` at no greater length, so appending to a column does not grow its keys."""
+    if low is None:
+        return spaced_ranks(1)[0]
+    base = len(DIGITS)
+    # Step at a fixed precision: short keys are padded so a column can take many appends before growing
+    width = max(len(low), RANK_APPEND_WIDTH)
+    while True:
+        value = _decode(low.ljust(width, DIGITS[0])) + 1
+        if value % base == 0:
+            # A trailing zero would be dropped and shorten the key, leaving less room after it
+            value += 1
+        if value < base ** width:
+            return _encode(value, width)
+        # The column has reached the top of the key space: continue at a finer precision
+        width += RANK_APPEND_WIDTH
+
+def _decode(key):
+    value = 0
+    for char in key:
+        value = value * len(DIGITS) + DIGITS.index(char)
+    return value
+
+def _encode(value, width):
+    chars = []
+    for _ in range(width):
+        value, digit = divmod(value, len(DIGITS))
+        chars.append(DIGITS[digit])
+    return "".join(reversed(chars)).rstrip(DIGITS[0])
+
+def spaced_ranks(count):
+    """``count`` ascending keys spread over the lower half of the key space.
+
+    The gaps leave room for many moves in between, and the empty upper half absorbs appends.
+    """
+    base = len(DIGITS)
+    width = 1
+    while base ** width <= (count + 1) * base * base:
+        width += 1
+    step = base ** width // (2 * (count + 1))
+    return [_encode((i + 1) * step, width) for i in range(count)]
+
+def _queue_rebalance(db: Session, project_id, status, rank):
+    if rank is not None and len(rank) > RANK_REBALANCE_LENGTH:
+        db.info.setdefault(PENDING_KEY, set()).add((project_id, status))
+
+def column_tail(db: Session, project_id, status):
+    return db.scalar(select(func.max(Task.rank)).where(Task.project_id == project_id, Task.status == status))
+
+def append_ranks(db: Session, columns):
+    """Keys for new entries at the bottom of each ``(project_id, status)`` column, in the order given."""
+    pending = {}
+    for column, count in Counter(columns).items():
+        tail = column_tail(db, *column)
+        if tail is None:
+            pending[column] = iter(spaced_ranks(count))
+            continue
+        ranks = []
+        for _ in range(count):
+            tail = rank_after(tail)
+            ranks.append(tail)
+        _queue_rebalance(db, *column, tail)
+        pending[column] = iter(ranks)
+    return [next(pending[column]) for column in columns]
+
+def _neighbour_ranks(db: Session, task, before_id, after_id):
+    ids = [i for i in (before_id, after_id) if i is not None]
+    if task.id in ids:
+        raise RankConflict("A task cannot be placed next to itself")
+    rows = {
+        row.id: row for row in db.execute(
+            select(Task.id, Task.project_id, Task.status, Task.rank).where(Task.id.in_(ids)).with_for_update()
+        )
+    }
+    ranks = []
+    for neighbour_id in (before_id, after_id):
+        if neighbour_id is None:
+            ranks.append(None)
+            continue
+        row = rows.get(neighbour_id)
+        if row is None or row.project_id != task.project_id or row.status != task.status:
+            raise RankConflict(f"Task {neighbour_id} is not in the same column")
+        ranks.append(row.rank)
+    low, high = ranks
+    # With one side given, the other is whichever task really sits next to it in the column
+    if high is None and before_id is not None:
+        high = _adjacent_rank(db, task, Task.rank > low, Task.rank.asc())
+    elif low is None and after_id is not None:
+        low = _adjacent_rank(db, task, Task.rank < high, Task.rank.desc())
+    return low, high
+
+def _adjacent_rank(db: Session, task, condition, order):
+    return db.scalar(
+        select(Task.rank).where(
+            Task.project_id == task.project_id, Task.status == task.status, Task.id != task.id, condition
+        ).order_by(order).limit(1).with_for_update()
+    )
+
+def place_task(db: Session, task, before_id=None, after_id=None):
+    """Rank ``task`` between two tasks of its (already updated) column, touching only its own row.
+
+    ``before_id`` is the task directly above the new position and ``after_id`` the one directly
+    below; given only one of them, the task goes right next to it.
+    """
+    # Without autoflush the status change and the new rank go out as one UPDATE
+    with db.no_autoflush:
+        low, high = _neighbour_ranks(db, task, before_id, after_id)
+        if low is not None and low == high:
+            # Two tasks appended concurrently can share a key; spread the column out, then place again
+            rebalance_column(db, task.project_id, task.status)
+            low, high = _neighbour_ranks(db, task, before_id, after_id)
+    task.rank = rank_between(low, high)
+    _queue_rebalance(db, task.project_id, task.status, task.rank)
+
+def rebalance_column(db: Session, project_id, status):
+    """Rewrite a column's keys short and evenly spaced, keeping its order; returns the number of tasks."""
+    # Locking the column keeps concurrent moves from ranking against keys that are about to change
+    task_ids = db.scalars(
+        select(Task.id).where(Task.project_id == project_id, Task.status == status)
+        .order_by(Task.rank, Task.id).with_for_update()
+    ).all()
+    if task_ids:
+        tasks = Task.__table__
+        # The keys change even though the order does not: a new change_seq sends them to clients
+        # through /changes and moves list ETags, while updated_at stays a record of user edits
+        seqs = allocate_change_seqs(db, project_id, len(task_ids))
+        db.execute(
+            update(tasks).where(tasks.c.id == bindparam("task_id")).values(
+                rank=bindparam("new_rank"), change_seq=bindparam("new_seq"), updated_at=tasks.c.updated_at
+            ),
+            [
+                {"task_id": task_id, "new_rank": rank, "new_seq": seq}
+                for task_id, rank, seq in zip(task_ids, spaced_ranks(len(task_ids)), seqs)
+            ],
+        )
+    return len(task_ids)
+
+def rebalance_long_ranks(min_length=None):
+    """Rebalance every column holding a key longer than ``min_length``, one transaction per column."""
+    min_length = RANK_REBALANCE_LENGTH if min_length is None else min_length
+    database.get_engine()
+    db = database.SessionLocal()
+    try:
+        columns = db.execute(
+            select(Task.project_id, Task.status).group_by(Task.project_id, Task.status)
+            .having(func.max(func.length(Task.rank)) > min_length)
+        ).all()
+        for project_id, status in columns:
+            count = rebalance_column(db, project_id, status)
+            db.commit()
+            logger.info(f"Rebalanced {count} ranks in project {project_id} column {status}")
+        return len(columns)
+    finally:
+        db.close()
+
+@event.listens_for(Session, "before_flush")
+def _rank_moved_tasks(session, flush_context, instances):
+    # New tasks, and tasks moved to another column without an explicit position, go to the bottom
+    columns, tasks = [], []
+    for obj in session.new:
+        if isinstance(obj, Task) and obj.rank is None:
+            columns.append((obj.project_id, obj.status or "todo"))
+            tasks.append(obj)
+    for obj in session.dirty:
+        if isinstance(obj, Task) and obj not in session.deleted:
+            state = inspect(obj).attrs
+            moved = state.status.history.has_changes() or state.project_id.history.has_changes()
+            if moved and not state.rank.history.has_changes():
+                columns.append((obj.project_id, obj.status))
+                tasks.append(obj)
+    if tasks:
+        for task, rank in zip(tasks, append_ranks(session, columns)):
+            task.rank = rank
+
+@event.listens_for(Session, "after_commit")
+def _request_committed_rebalances(session):
+    for project_id, status in session.info.pop(PENDING_KEY, ()):
+        rank_rebalancer.request(project_id, status)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_rebalances(session):
+    session.info.pop(PENDING_KEY, None)
+
+class RankRebalancer:
+    """Rebalances columns whose keys have grown too long, off the request path."""
+
+    def __init__(self):
+        self.queue = queue.Queue()
+        self.pending = set()
+        self.lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._thread = threading.Thread(target=self._run, name="rank-rebalancer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=10):
+        if not self.running:
+            return
+        self.queue.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def request(self, project_id, status):
+        # Without the worker (CLI, tests) long keys wait for `manage.py rebalance-ranks`
+        with self.lock:
+            if not self.running or (project_id, status) in self.pending:
+                return
+            self.pending.add((project_id, status))
+        self.queue.put((project_id, status))
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            if item is _STOP:
+                return
+            with self.lock:
+                self.pending.discard(item)
+            self.rebalance(*item)
+
+    def rebalance(self, project_id, status):
+        database.get_engine()
+        db = database.SessionLocal()
+        try:
+            count = rebalance_column(db, project_id, status)
+            db.commit()
+            logger.info(f"Rebalanced {count} ranks in project {project_id} column {status}")
+        except Exception:
+            db.rollback()
+            logger.exception(f"Failed to rebalance project {project_id} column {status}")
+        finally:
+            db.close()
+
+rank_rebalancer = RankRebalancer()
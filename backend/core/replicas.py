@@ -0,0 +1,153 @@
+import itertools
+import logging
+import os
+import threading
+import time
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+logger = logging.getLogger(__name__)
+
+REPLICA_CHECK_INTERVAL = float(os.getenv("REPLICA_CHECK_INTERVAL", "5"))
+# Replicas further behind the primary than this are taken out of rotation until they catch up
+REPLICA_MAX_LAG_SECONDS = float(os.getenv("REPLICA_MAX_LAG_SECONDS", "5"))
+# How long a client that wrote keeps reading from the primary; should cover normal replication lag
+READ_YOUR_WRITES_SECONDS = float(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+READ_PRIMARY_COOKIE = "read_primary_until"
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+def read_from_primary(request):
+    """Whether the client wrote within the read-your-writes window."""
+    try:
+        return float(request.cookies.get(READ_PRIMARY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+def _replica_lag(conn):
+    if conn.dialect.name != "mysql":
+        return None
+    # SHOW SLAVE STATUS for MySQL before 8.0.22
+    for statement in ("SHOW REPLICA STATUS", "SHOW SLAVE STATUS"):
+        try:
+            row = conn.exec_driver_sql(statement).mappings().first()
+            break
+        except DBAPIError:
+            continue
+    else:
+        # Without REPLICATION CLIENT the lag is unknown; answering queries has to do
+        return None
+    if row is None:
+        return None
+    lag = row.get("Seconds_Behind_Source", row.get("Seconds_Behind_Master"))
+    # NULL means replication is stopped: the replica is as good as infinitely behind
+    return float("inf") if lag is None else float(lag)
+
+class ReplicaMonitor:
+    """Health checks the read replicas in the background and hands out healthy ones round-robin.
+
+    Replicas start out of rotation and join after their first passing check, so reads only
+    reach a replica that has been seen answering and keeping up.
+    """
+
+    def __init__(self):
+        self.engines = []
+        self.status = []
+        self.healthy = []
+        self.lock = threading.Lock()
+        self._counter = itertools.count()
+        self._wake = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, engines):
+        if self.running or not engines:
+            return
+        self.engines = list(engines)
+        self.status = [
+            {"url": engine.url.render_as_string(hide_password=True), "healthy": False, "lag_seconds": None, "error": None}
+            for engine in self.engines
+        ]
+        self._wake.clear()
+        self._thread = threading.Thread(target=self._run, name="replica-monitor", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=10):
+        if not self.running:
+            return
+        self._wake.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def choose(self):
+        """Index of a healthy replica, or None when reads should go to the primary."""
+        healthy = self.healthy
+        if not healthy:
+            return None
+        return healthy[next(self._counter) % len(healthy)]
+
+    def mark_failed(self, index, error):
+        # Failover is immediate; the replica rejoins once a background check passes again
+        logger.warning(f"Read replica {self.status[index]['url']} failed, reading from the primary: {error}")
+        self._update(index, healthy=False, error=str(error))
+
+    def stats(self):
+        with self.lock:
+            return [dict(status) for status in self.status]
+
+    def _update(self, index, **values):
+        with self.lock:
+            self.status[index].update(values)
+            self.healthy = [i for i, status in enumerate(self.status) if status["healthy"]]
+
+    def check(self, index):
+        engine = self.engines[index]
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                lag = _replica_lag(conn)
+        except Exception as e:
+            if self.status[index]["healthy"]:
+                logger.warning(f"Read replica {self.status[index]['url']} is unavailable: {e}")
+            self._update(index, healthy=False, error=str(e))
+            return
+        healthy = lag is None or lag <= REPLICA_MAX_LAG_SECONDS
+        if healthy != self.status[index]["healthy"]:
+            state = "back in rotation" if healthy else f"{lag}s behind, out of rotation"
+            logger.info(f"Read replica {self.status[index]['url']} is {state}")
+        self._update(index, healthy=healthy, lag_seconds=lag, error=None)
+
+    def _run(self):
+        while True:
+            for index in range(len(self.engines)):
+                self.check(index)
+            if self._wake.wait(REPLICA_CHECK_INTERVAL):
+                return
+
+replica_monitor = ReplicaMonitor()
+
+class ReadYourWritesMiddleware:
+    """Marks clients after a successful write so their reads stay on the primary for a while."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                until = time.time() + READ_YOUR_WRITES_SECONDS
+                cookie = (
+                    f"{READ_PRIMARY_COOKIE}={until:.3f}; Max-Age={int(READ_YOUR_WRITES_SECONDS) + 1}; "
+                    "Path=/; HttpOnly; SameSite=Lax"
+                )
+                message["headers"] = list(message.get("headers", [])) + [(b"set-cookie", cookie.encode())]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
@@ -0,0 +1,323 @@
+import bisect
+import html
+import logging
+import os
+import re
+import threading
+from collections import Counter, defaultdict
+from sqlalchemy import event, func, inspect, select, text, union_all
+from sqlalchemy.dialects.mysql import match
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+from models import database
+from models.comment import Comment
+from models.task import Task
+
+logger = logging.getLogger(__name__)
+
+# "auto" uses MySQL FULLTEXT indexes when they exist and the in-process index otherwise; "off" disables search
+SEARCH_BACKEND = os.getenv("SEARCH_BACKEND", "auto").lower()
+
+TITLE_WEIGHT = 3.0
+DESCRIPTION_WEIGHT = 1.0
+COMMENT_WEIGHT = 0.5
+PREFIX_WEIGHT = 0.8
+MAX_PREFIX_EXPANSIONS = 200
+SNIPPET_LENGTH = 160
+MAX_COMMENT_SNIPPETS = 3
+# How long a search waits for the in-process index that is still being built at startup
+SEARCH_INDEX_WAIT = float(os.getenv("SEARCH_INDEX_WAIT", "5"))
+
+PENDING_KEY = "pending_search_ops"
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+def tokenize(value):
+    return [token for token in TOKEN_RE.findall((value or "").lower()) if len(token) > 1]
+
+class InvertedIndex:
+    """Term -> task postings over task titles, descriptions and comments, with prefix lookup."""
+
+    def __init__(self):
+        self.postings = defaultdict(dict)
+        self.vocabulary = []
+        self.sources = defaultdict(dict)
+        self.projects = {}
+        self.comment_tasks = {}
+        # Reverse of comment_tasks, so deleting a task drops its comments without a full scan
+        self.task_comments = defaultdict(set)
+        self.lock = threading.RLock()
+        self.state = "empty"
+        self.backlog = []
+        self.ready = threading.Event()
+
+    def _add(self, task_id, counts, weight):
+        for token, count in counts.items():
+            postings = self.postings[token]
+            if not postings:
+                bisect.insort(self.vocabulary, token)
+            postings[task_id] = postings.get(task_id, 0.0) + count * weight
+
+    def _remove(self, task_id, counts, weight):
+        for token, count in counts.items():
+            postings = self.postings.get(token)
+            if postings is None or task_id not in postings:
+                continue
+            remaining = postings[task_id] - count * weight
+            if remaining > 1e-9:
+                postings[task_id] = remaining
+                continue
+            del postings[task_id]
+            if not postings:
+                del self.postings[token]
+                index = bisect.bisect_left(self.vocabulary, token)
+                if index < len(self.vocabulary) and self.vocabulary[index] == token:
+                    del self.vocabulary[index]
+
+    def _set_source(self, task_id, source, value, weight):
+        previous = self.sources[task_id].pop(source, None)
+        if previous:
+            self._remove(task_id, *previous)
+        counts = Counter(tokenize(value))
+        if counts:
+            self.sources[task_id][source] = (counts, weight)
+            self._add(task_id, counts, weight)
+
+    def apply(self, op):
+        with self.lock:
+            if self.state == "building":
+                self.backlog.append(op)
+            elif self.state == "ready":
+                self._apply(op)
+
+    def _apply(self, op):
+        kind = op[0]
+        if kind == "task":
+            _, task_id, project_id, fields = op
+            if project_id is not None:
+                self.projects[task_id] = project_id
+            if "title" in fields:
+                self._set_source(task_id, "title", fields["title"], TITLE_WEIGHT)
+            if "description" in fields:
+                self._set_source(task_id, "description", fields["description"], DESCRIPTION_WEIGHT)
+        elif kind == "delete_task":
+            task_id = op[1]
+            for counts, weight in self.sources.pop(task_id, {}).values():
+                self._remove(task_id, counts, weight)
+            self.projects.pop(task_id, None)
+            for comment_id in self.task_comments.pop(task_id, ()):
+                self.comment_tasks.pop(comment_id, None)
+        elif kind == "comment":
+            _, comment_id, task_id, content = op
+            self.comment_tasks[comment_id] = task_id
+            self.task_comments[task_id].add(comment_id)
+            self._set_source(task_id, f"comment:{comment_id}", content, COMMENT_WEIGHT)
+        elif kind == "delete_comment":
+            task_id = self.comment_tasks.pop(op[1], None)
+            if task_id is not None:
+                comments = self.task_comments.get(task_id)
+                if comments is not None:
+                    comments.discard(op[1])
+                    if not comments:
+                        del self.task_comments[task_id]
+                self._set_source(task_id, f"comment:{op[1]}", None, COMMENT_WEIGHT)
+
+    def build(self, db: Session):
+        with self.lock:
+            if self.state != "empty":
+                return
+            self.state = "building"
+        try:
+            # Built outside the lock so writes keep flowing; they are replayed from the backlog afterwards
+            ops = []
+            for row in db.execute(select(Task.id, Task.project_id, Task.title, Task.description).execution_options(yield_per=2000)):
+                ops.append(("task", row.id, row.project_id, {"title": row.title, "description": row.description}))
+            for row in db.execute(select(Comment.id, Comment.task_id, Comment.content).execution_options(yield_per=2000)):
+                ops.append(("comment", row.id, row.task_id, row.content))
+        except Exception:
+            with self.lock:
+                self.state = "empty"
+                self.backlog = []
+            raise
+        with self.lock:
+            for op in ops + self.backlog:
+                self._apply(op)
+            self.backlog = []
+            self.state = "ready"
+            self.ready.set()
+        logger.info(f"Built in-process search index: {len(self.projects)} tasks, {len(self.vocabulary)} terms")
+
+    def _expand(self, term):
+        start = bisect.bisect_left(self.vocabulary, term)
+        tokens = []
+        for token in self.vocabulary[start:start + MAX_PREFIX_EXPANSIONS]:
+            if not token.startswith(term):
+                break
+            tokens.append(token)
+        return tokens
+
+    def search(self, terms, project_id=None):
+        with self.lock:
+            scores = None
+            for term in terms:
+                term_scores = defaultdict(float)
+                for token in self._expand(term):
+                    factor = 1.0 if token == term else PREFIX_WEIGHT
+                    for task_id, weight in self.postings[token].items():
+                        term_scores[task_id] += weight * factor
+                if scores is None:
+                    scores = term_scores
+                else:
+                    scores = {task_id: score + term_scores[task_id] for task_id, score in scores.items() if task_id in term_scores}
+                if not scores:
+                    return []
+            if project_id is not None:
+                scores = {task_id: score for task_id, score in scores.items() if self.projects.get(task_id) == project_id}
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+
+search_index = InvertedIndex()
+_fulltext_available = None
+
+def use_fulltext(db: Session):
+    global _fulltext_available
+    if SEARCH_BACKEND == "memory":
+        return False
+    if db.get_bind().dialect.name != "mysql":
+        return False
+    if SEARCH_BACKEND == "fulltext":
+        return True
+    if _fulltext_available is None:
+        rows = db.execute(text(
+            "SELECT DISTINCT table_name FROM information_schema.statistics "
+            "WHERE table_schema = DATABASE() AND index_type = 'FULLTEXT' AND table_name IN ('tasks', 'comments')"
+        )).all()
+        _fulltext_available = len(rows) == 2
+    return _fulltext_available
+
+def _fulltext_search(db: Session, terms, project_id, limit, offset):
+    # Boolean mode: every term is required and matched as a prefix
+    against = " ".join(f"+{term}*" for term in terms)
+    task_score = match(Task.title, Task.description, against=against).in_boolean_mode()
+    comment_score = match(Comment.content, against=against).in_boolean_mode()
+
+    task_query = select(Task.id.label("task_id"), (task_score * TITLE_WEIGHT).label("score")).where(task_score)
+    comment_query = select(Comment.task_id.label("task_id"), (comment_score * COMMENT_WEIGHT).label("score")).where(comment_score)
+    if project_id is not None:
+        task_query = task_query.where(Task.project_id == project_id)
+        comment_query = comment_query.join(Task, Task.id == Comment.task_id).where(Task.project_id == project_id)
+
+    matches = union_all(task_query, comment_query).subquery()
+    score = func.sum(matches.c.score).label("score")
+    rows = db.execute(
+        select(matches.c.task_id, score)
+        .group_by(matches.c.task_id)
+        .order_by(score.desc(), matches.c.task_id)
+        .limit(limit + 1)
+        .offset(offset)
+    ).all()
+    return [(row.task_id, float(row.score)) for row in rows]
+
+def search_tasks(db: Session, query, project_id=None, limit=20, offset=0):
+    """Return ``([(task_id, score), ...], has_more)`` ranked by relevance."""
+    if SEARCH_BACKEND == "off":
+        raise HTTPException(status_code=503, detail="Search is disabled")
+    terms = list(dict.fromkeys(tokenize(query)))
+    if not terms:
+        return [], False
+    if use_fulltext(db):
+        ranked = _fulltext_search(db, terms, project_id, limit, offset)
+    else:
+        # Normally built at startup; this only runs the build if that one failed
+        search_index.build(db)
+        if not search_index.ready.wait(SEARCH_INDEX_WAIT):
+            raise HTTPException(status_code=503, detail="Search index is still being built")
+        ranked = search_index.search(terms, project_id)[offset:offset + limit + 1]
+    return ranked[:limit], len(ranked) > limit
+
+def highlight(value, terms, snippet=False):
+    if not value:
+        return value
+    pattern = re.compile(r"\b(?:" + "|".join(re.escape(term) for term in terms) + r")\w*", re.IGNORECASE)
+    start, end = 0, len(value)
+    if snippet:
+        first = pattern.search(value)
+        if not first:
+            return None
+        start = max(0, first.start() - SNIPPET_LENGTH // 3)
+        end = min(len(value), start + SNIPPET_LENGTH)
+
+    parts = ["…" if start > 0 else ""]
+    position = start
+    for found in pattern.finditer(value, start, end):
+        parts.append(html.escape(value[position:found.start()]))
+        parts.append(f"<mark>{html.escape(found.group())}</mark>")
+        position = found.end()
+    parts.append(html.escape(value[position:end]))
+    parts.append("…" if end < len(value) else "")
+    return "".join(parts)
+
+def comment_snippets(db: Session, task_ids, terms):
+    """Highlighted snippets of the first comments on each task that match ``terms``."""
+    snippets = defaultdict(list)
+    rows = db.query(Comment.id, Comment.task_id, Comment.content).filter(
+        Comment.task_id.in_(task_ids)
+    ).order_by(Comment.id)
+    for comment_id, task_id, content in rows:
+        if len(snippets[task_id]) >= MAX_COMMENT_SNIPPETS:
+            continue
+        snippet = highlight(content, terms, snippet=True)
+        if snippet:
+            snippets[task_id].append((comment_id, snippet))
+    return snippets
+
+def start_search_index():
+    """Build the in-process index in the background at startup, unless FULLTEXT serves searches."""
+    if SEARCH_BACKEND == "off":
+        return
+    # The check needs the database too, so it runs in the thread rather than holding up startup
+    threading.Thread(target=_build_search_index, name="search-index-builder", daemon=True).start()
+
+def _build_search_index():
+    database.get_engine()
+    db = database.SessionLocal()
+    try:
+        if not use_fulltext(db):
+            search_index.build(db)
+    except Exception:
+        logger.exception("Failed to build the in-process search index")
+    finally:
+        db.close()
+
+def queue_search_op(db: Session, op):
+    db.info.setdefault(PENDING_KEY, []).append(op)
+
+@event.listens_for(Session, "after_flush")
+def _collect_search_changes(session, flush_context):
+    for obj in session.new:
+        if isinstance(obj, Task):
+            queue_search_op(session, ("task", obj.id, obj.project_id, {"title": obj.title, "description": obj.description}))
+        elif isinstance(obj, Comment):
+            queue_search_op(session, ("comment", obj.id, obj.task_id, obj.content))
+    for obj in session.dirty:
+        if isinstance(obj, Task):
+            fields = {key: getattr(obj, key) for key in ("title", "description") if _changed(obj, key)}
+            if fields:
+                queue_search_op(session, ("task", obj.id, obj.project_id, fields))
+        elif isinstance(obj, Comment) and _changed(obj, "content"):
+            queue_search_op(session, ("comment", obj.id, obj.task_id, obj.content))
+    for obj in session.deleted:
+        if isinstance(obj, Task):
+            queue_search_op(session, ("delete_task", obj.id))
+        elif isinstance(obj, Comment):
+            queue_search_op(session, ("delete_comment", obj.id))
+
+def _changed(obj, key):
+    return inspect(obj).attrs[key].history.has_changes()
+
+@event.listens_for(Session, "after_commit")
+def _apply_committed_search_changes(session):
+    for op in session.info.pop(PENDING_KEY, ()):
+        search_index.apply(op)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_search_changes(session):
+    session.info.pop(PENDING_KEY, None)
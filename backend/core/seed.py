@@ -0,0 +1,47 @@
+from datetime import datetime, timedelta
+from sqlalchemy.orm import Session
+from models.project import Project
+from models.sprint import Sprint
+from models.task import Task
+from models.user import User
+
+def seed_demo_data(db: Session):
+    """Insert the demo users, project, sprint and tasks. Does nothing (and returns False) once any user exists."""
+    if db.query(User).count() > 0:
+        return False
+    
+    users = [
+        User(username="john_doe", email="john@example.com", full_name="John Doe", avatar_url="https://i.pravatar.cc/150?img=1"),
+        User(username="jane_smith", email="jane@example.com", full_name="Jane Smith", avatar_url="https://i.pravatar.cc/150?img=2"),
+        User(username="bob_wilson", email="bob@example.com", full_name="Bob Wilson", avatar_url="https://i.pravatar.cc/150?img=3"),
+    ]
+    db.add_all(users)
+    db.commit()
+
+    project = Project(name="DevTaskBoard", key="DTB", description="Task management system for development teams")
+    db.add(project)
+    db.commit()
+
+    sprint = Sprint(
+        project_id=project.id,
+        name="Sprint 1",
+        goal="Build core features",
+        start_date=datetime.now(),
+        end_date=datetime.now() + timedelta(days=14),
+        status="active"
+    )
+    db.add(sprint)
+    db.commit()
+
+    tasks = [
+        Task(project_id=project.id, sprint_id=sprint.id, title="Setup project infrastructure", description="Initialize project with FastAPI and Next.js", task_type="task", status="done", priority="high", story_points=5, assigned_to=1, created_by=1),
+        Task(project_id=project.id, sprint_id=sprint.id, title="Create database models", description="Define SQLAlchemy models for all entities", task_type="task", status="done", priority="high", story_points=3, assigned_to=1, created_by=1),
+        Task(project_id=project.id, sprint_id=sprint.id, title="Build Kanban board", description="Implement drag-and-drop task board", task_type="story", status="in_progress", priority="high", story_points=8, assigned_to=2, created_by=1),
+        Task(project_id=project.id, sprint_id=sprint.id, title="Add task filtering", description="Allow users to filter tasks by status and assignee", task_type="story", status="todo", priority="medium", story_points=5, assigned_to=2, created_by=1),
+        Task(project_id=project.id, sprint_id=sprint.id, title="Fix bug in task assignment", description="Tasks not updating when assigned to users", task_type="bug", status="in_review", priority="high", story_points=2, assigned_to=3, created_by=2),
+        Task(project_id=project.id, title="Design sprint planning view", description="Create UI mockups for sprint planning", task_type="story", status="todo", priority="medium", story_points=5, created_by=1),
+        Task(project_id=project.id, title="Implement user authentication", description="Add JWT-based authentication", task_type="story", status="todo", priority="high", story_points=8, created_by=1),
+    ]
+    db.add_all(tasks)
+    db.commit()
+    return True
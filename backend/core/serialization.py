@@ -0,0 +1,22 @@
+import orjson
+from fastapi import Response
+
+def response_columns(model, entity):
+    """Mapped columns backing every field of a response model, in field order."""
+    table = entity.__table__
+    return [table.c[name] for name in model.model_fields if name in table.c]
+
+class FastJSONResponse(Response):
+    """Encodes plain rows with orjson, skipping per-row Pydantic validation.
+
+    Only use it for content whose shape already matches the declared response model:
+    naive datetimes come out in the same ISO format Pydantic produces.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content):
+        return orjson.dumps(content)
+
+def rows_response(rows, headers=None):
+    return FastJSONResponse([row._asdict() for row in rows], headers=headers)
@@ -0,0 +1,79 @@
+"""Multi-worker production server: ``gunicorn -c gunicorn.conf.py main:app``.
+
+gunicorn supervises uvicorn workers: SIGHUP starts fresh workers and drains the old ones, SIGTERM
+drains in-flight requests before exiting, and TTIN/TTOU add or remove a worker. The app is
+preloaded in the master, so deploying new code takes a full restart rather than SIGHUP.
+"""
+import logging
+import os
+import sys
+import time
+
+logger = logging.getLogger("gunicorn.error")
+
+def _cpu_count():
+    # Respects container CPU pinning, unlike os.cpu_count()
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+# One event loop per core; each worker also keeps its own threadpool and connection pool
+workers = int(os.getenv("WEB_CONCURRENCY", str(_cpu_count())))
+worker_class = "uvicorn_worker.UvicornWorker"
+# Import the app once in the master; workers fork with it loaded and boot in milliseconds
+preload_app = True
+# In-flight requests get this long to finish on shutdown and restarts
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", "30"))
+timeout = int(os.getenv("WORKER_TIMEOUT", "60"))
+keepalive = int(os.getenv("KEEPALIVE", "5"))
+# Optional periodic recycling; the jitter keeps workers from restarting together
+max_requests = int(os.getenv("MAX_REQUESTS", "0"))
+max_requests_jitter = max_requests // 10
+accesslog = os.getenv("ACCESS_LOG", "-") or None
+
+def _in_process_search():
+    from core.search import SEARCH_BACKEND, use_fulltext
+    from models import database
+
+    if SEARCH_BACKEND == "off":
+        return False
+    database.get_engine()
+    db = database.SessionLocal()
+    try:
+        return not use_fulltext(db)
+    finally:
+        db.close()
+        database.engine.dispose()
+
+def on_starting(server):
+    import main
+    from core.cache import CACHE_BACKEND_URL
+    from core.events import EVENTS_BROKER_URL
+
+    # Schema and demo data once, before any worker exists to race for them
+    main.prepare_before_fork()
+    if server.cfg.workers > 1:
+        # Each worker would build its own index and only apply its own writes to it, so search results
+        # would differ by worker. Project deletion jobs live in the database and need no such care.
+        if _in_process_search():
+            logger.error(
+                "The in-process search index cannot be shared between workers: create the FULLTEXT indexes "
+                "(alembic upgrade head) and use SEARCH_BACKEND=auto or fulltext, set SEARCH_BACKEND=off, or run with WEB_CONCURRENCY=1"
+            )
+            sys.exit(1)
+        if not EVENTS_BROKER_URL:
+            logger.warning("EVENTS_BROKER_URL is not set: live board events only reach clients on the same worker")
+        if not CACHE_BACKEND_URL:
+            logger.warning("CACHE_BACKEND_URL is not set: each worker caches separately and may serve stale entries until their TTL")
+
+def post_fork(server, worker):
+    import main
+    from models import database
+
+    # Connections pooled by the master must never be shared with a forked worker
+    if database.engine is not None:
+        database.engine.dispose(close=False)
+    # The startup budget covers this worker's own boot, not the master's uptime
+    main.STARTED_AT = time.perf_counter()
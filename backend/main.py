@@ -1,8 +1,31 @@
+import logging
 import os
+import time
+
+# Taken before the heavy imports so the startup budget covers them too
+STARTED_AT = time.perf_counter()
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from models.database import engine, Base
-from routers import projects, sprints, tasks, users
+from fastapi.responses import JSONResponse
+from sqlalchemy import text
+from core.activity_log import activity_writer
+from core.async_routes import async_router
+from core.events import event_hub
+from core.instrumentation import SQLInstrumentationMiddleware
+from core.ranking import rank_rebalancer
+from core.replicas import ReadYourWritesMiddleware, replica_monitor
+from core.search import start_search_index
+from models import database
+from models.database import Base, DB_ASYNC
+from routers import admin, analytics, bulk, events, export, imports, projects, search, sprints, stats, tasks, users
+
+logger = logging.getLogger(__name__)
+
+# "production": schema comes from `alembic upgrade head` and demo data from `python manage.py seed`;
+# "development" keeps the old behaviour of creating the database, tables and demo data on boot
+STARTUP_MODE = os.getenv("STARTUP_MODE", "development").lower()
+STARTUP_BUDGET_SECONDS = float(os.getenv("STARTUP_BUDGET_SECONDS", "2"))
 
 app_id = os.getenv("APP_ID", "")
 preview_domain = os.getenv("PREVIEW_DOMAIN", "")
@@ -32,64 +55,93 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "Server-Timing"],
 )
+app.add_middleware(SQLInstrumentationMiddleware)
+if database.MYSQL_REPLICAS:
+    app.add_middleware(ReadYourWritesMiddleware)
 
-Base.metadata.create_all(bind=engine)
+def db_router(router):
+    return async_router(router) if DB_ASYNC else router
 
-app.include_router(projects.router, prefix="/api", tags=["projects"])
-app.include_router(sprints.router, prefix="/api", tags=["sprints"])
-app.include_router(tasks.router, prefix="/api", tags=["tasks"])
-app.include_router(users.router, prefix="/api", tags=["users"])
+app.include_router(db_router(projects.router), prefix="/api", tags=["projects"])
+app.include_router(db_router(sprints.router), prefix="/api", tags=["sprints"])
+app.include_router(db_router(analytics.router), prefix="/api", tags=["analytics"])
+app.include_router(db_router(search.router), prefix="/api", tags=["search"])
+app.include_router(db_router(stats.router), prefix="/api", tags=["stats"])
+app.include_router(db_router(bulk.router), prefix="/api", tags=["tasks"])
+app.include_router(db_router(tasks.router), prefix="/api", tags=["tasks"])
+app.include_router(db_router(users.router), prefix="/api", tags=["users"])
+app.include_router(export.router, prefix="/api", tags=["export"])
+app.include_router(imports.router, prefix="/api", tags=["tasks"])
+app.include_router(events.router, prefix="/api", tags=["events"])
+app.include_router(admin.router, prefix="/api", tags=["admin"])
 
 @app.get("/")
 def read_root():
     return {"message": "DevTaskBoard API is running"}
 
+startup_state = {"complete": False, "seconds": None, "prepared": False}
+
+@app.get("/ready")
+def ready():
+    """Readiness probe: startup has finished and the database answers. ``/`` stays a pure liveness check."""
+    if not startup_state["complete"]:
+        return JSONResponse(status_code=503, content={"ready": False, "reason": "starting"})
+    try:
+        with database.get_engine().connect() as conn:
+            conn.execute(text("SELECT 1"))
+    except Exception as e:
+        logger.warning(f"Readiness check failed: {str(e)}")
+        return JSONResponse(status_code=503, content={"ready": False, "reason": "database unavailable"})
+    return {"ready": True, "startup_seconds": startup_state["seconds"]}
+
+def prepare_development_database():
+    from core.seed import seed_demo_data
+    
+    database.ensure_database_exists()
+    # Workers and containers booting together take turns; whoever comes second finds tables and users in place
+    with database.advisory_lock("startup"):
+        Base.metadata.create_all(bind=database.get_engine())
+        db = database.SessionLocal()
+        try:
+            seed_demo_data(db)
+        finally:
+            db.close()
+
+def prepare_before_fork():
+    """Startup database work for a pre-forking server: done once in the master instead of per worker."""
+    if STARTUP_MODE != "production" and not startup_state["prepared"]:
+        prepare_development_database()
+        startup_state["prepared"] = True
+    if database.engine is not None:
+        database.engine.dispose()
+
 @app.on_event("startup")
 async def startup_event():
-    from models.database import SessionLocal
-    from models.project import Project
-    from models.sprint import Sprint
-    from models.task import Task
-    from models.user import User
-    from datetime import datetime, timedelta
+    activity_writer.start()
+    rank_rebalancer.start()
+    replica_monitor.start(database.get_replica_engines())
+    await event_hub.start()
     
-    db = SessionLocal()
-    try:
-        if db.query(User).count() == 0:
-            users = [
-                User(username="john_doe", email="john@example.com", full_name="John Doe", avatar_url="https://i.pravatar.cc/150?img=1"),
-                User(username="jane_smith", email="jane@example.com", full_name="Jane Smith", avatar_url="https://i.pravatar.cc/150?img=2"),
-                User(username="bob_wilson", email="bob@example.com", full_name="Bob Wilson", avatar_url="https://i.pravatar.cc/150?img=3"),
-            ]
-            db.add_all(users)
-            db.commit()
-            
-            project = Project(name="DevTaskBoard", key="DTB", description="Task management system for development teams")
-            db.add(project)
-            db.commit()
-            
-            sprint = Sprint(
-                project_id=project.id,
-                name="Sprint 1",
-                goal="Build core features",
-                start_date=datetime.now(),
-                end_date=datetime.now() + timedelta(days=14),
-                status="active"
-            )
-            db.add(sprint)
-            db.commit()
-            
-            tasks = [
-                Task(project_id=project.id, sprint_id=sprint.id, title="Setup project infrastructure", description="Initialize project with FastAPI and Next.js", task_type="task", status="done", priority="high", story_points=5, assigned_to=1, created_by=1),
-                Task(project_id=project.id, sprint_id=sprint.id, title="Create database models", description="Define SQLAlchemy models for all entities", task_type="task", status="done", priority="high", story_points=3, assigned_to=1, created_by=1),
-                Task(project_id=project.id, sprint_id=sprint.id, title="Build Kanban board", description="Implement drag-and-drop task board", task_type="story", status="in_progress", priority="high", story_points=8, assigned_to=2, created_by=1),
-                Task(project_id=project.id, sprint_id=sprint.id, title="Add task filtering", description="Allow users to filter tasks by status and assignee", task_type="story", status="todo", priority="medium", story_points=5, assigned_to=2, created_by=1),
-                Task(project_id=project.id, sprint_id=sprint.id, title="Fix bug in task assignment", description="Tasks not updating when assigned to users", task_type="bug", status="in_review", priority="high", story_points=2, assigned_to=3, created_by=2),
-                Task(project_id=project.id, title="Design sprint planning view", description="Create UI mockups for sprint planning", task_type="story", status="todo", priority="medium", story_points=5, created_by=1),
-                Task(project_id=project.id, title="Implement user authentication", description="Add JWT-based authentication", task_type="story", status="todo", priority="high", story_points=8, created_by=1),
-            ]
-            db.add_all(tasks)
-            db.commit()
-    finally:
-        db.close()
\ No newline at end of file
+    if STARTUP_MODE != "production" and not startup_state["prepared"]:
+        prepare_development_database()
+    start_search_index()
+    
+    startup_state["seconds"] = round(time.perf_counter() - STARTED_AT, 3)
+    startup_state["complete"] = True
+    if startup_state["seconds"] > STARTUP_BUDGET_SECONDS:
+        logger.warning(f"Startup took {startup_state['seconds']}s, over the {STARTUP_BUDGET_SECONDS}s budget")
+    else:
+        logger.info(f"Startup finished in {startup_state['seconds']}s ({STARTUP_MODE} mode)")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    activity_writer.stop()
+    rank_rebalancer.stop()
+    replica_monitor.stop()
+    await event_hub.stop()
+    if database.async_engine is not None:
+        await database.async_engine.dispose()
+    for replica in database.async_replica_engines or []:
+        await replica.dispose()
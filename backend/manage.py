@@ -0,0 +1,105 @@
+import argparse
+import logging
+import os
+from models import database
+# Every model must be registered before the first query so relationships resolve
+from models.project import Project
+from models.sprint import Sprint
+from models.sprint_snapshot import SprintSnapshot
+from models.task import Task
+from models.user import User
+from models.comment import Comment
+from models.activity_log import ActivityLog
+from models.activity_log_archive import ActivityLogArchive
+from models.task_tombstone import TaskTombstone
+
+logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+logger = logging.getLogger("manage")
+
+def create_db(args):
+    database.ensure_database_exists()
+
+def seed(args):
+    from core.seed import seed_demo_data
+
+    database.get_engine()
+    db = database.SessionLocal()
+    try:
+        # Safe to run from every container of a deployment at once
+        with database.advisory_lock("startup"):
+            if seed_demo_data(db):
+                logger.info("Seeded demo data")
+            else:
+                logger.info("Database already has users; nothing seeded")
+    finally:
+        db.close()
+
+def archive_activity(args):
+    from core.activity_log import archive_activity as run_archive
+
+    archived = run_archive(args.older_than_days, args.batch_size)
+    logger.info(f"Archived {archived} activity rows")
+
+def import_tasks(args):
+    from core.importer import IMPORT_BATCH_SIZE, READERS, TaskImporter
+
+    fmt = args.format or {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson", ".json": "json"}.get(
+        os.path.splitext(args.file)[1].lower()
+    )
+    if fmt is None:
+        raise SystemExit("Cannot tell the format from the file name; pass --format")
+
+    database.get_engine()
+    db = database.SessionLocal()
+    try:
+        if db.get(Project, args.project_id) is None:
+            raise SystemExit(f"Project {args.project_id} does not exist")
+        importer = TaskImporter(db, args.project_id, args.created_by, args.batch_size or IMPORT_BATCH_SIZE)
+        with open(args.file, "rb") as f:
+            for progress in importer.run(READERS[fmt](f)):
+                logger.info(f"Processed {progress['processed']}, imported {progress['imported']}, failed {progress['failed']}")
+        for error in importer.errors:
+            logger.warning(f"Row {error['row']}: {error['error']}")
+    finally:
+        db.close()
+
+def backfill_analytics(args):
+    from core.analytics import backfill_analytics as run_backfill
+
+    tasks, snapshots = run_backfill(args.project_id, args.batch_size)
+    logger.info(f"Backfilled {tasks} tasks and {snapshots} sprint snapshots")
+
+def rebalance_ranks(args):
+    from core.ranking import rebalance_long_ranks
+
+    columns = rebalance_long_ranks(args.min_length)
+    logger.info(f"Rebalanced {columns} board columns")
+
+def main():
+    parser = argparse.ArgumentParser(description="DevTaskBoard management commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("create-db", help="Create the MySQL database if it does not exist").set_defaults(func=create_db)
+    commands.add_parser("seed", help="Insert demo data into an empty database").set_defaults(func=seed)
+    archive = commands.add_parser("archive-activity", help="Move old activity rows into activity_logs_archive")
+    archive.add_argument("--older-than-days", type=int, default=None)
+    archive.add_argument("--batch-size", type=int, default=None)
+    archive.set_defaults(func=archive_activity)
+    backfill = commands.add_parser("backfill-analytics", help="Rebuild sprint snapshots and task status timestamps from activity history")
+    backfill.add_argument("--project-id", type=int, default=None)
+    backfill.add_argument("--batch-size", type=int, default=None)
+    backfill.set_defaults(func=backfill_analytics)
+    rebalance = commands.add_parser("rebalance-ranks", help="Shorten board rank keys in columns where they have grown long")
+    rebalance.add_argument("--min-length", type=int, default=None, help="rebalance columns with keys longer than this")
+    rebalance.set_defaults(func=rebalance_ranks)
+    importer = commands.add_parser("import-tasks", help="Import tasks from a CSV, NDJSON or JSON array file")
+    importer.add_argument("file")
+    importer.add_argument("--project-id", type=int, required=True)
+    importer.add_argument("--format", choices=["csv", "ndjson", "json"], default=None)
+    importer.add_argument("--created-by", default=None, help="username, email or id for rows without a creator")
+    importer.add_argument("--batch-size", type=int, default=None)
+    importer.set_defaults(func=import_tasks)
+    args = parser.parse_args()
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, String, DateTime, Index
+from models.database import Base
+
+class ActivityLogArchive(Base):
+    """Cold copy of old activity_logs rows, moved here by the archival job with their original ids."""
+
+    __tablename__ = "activity_logs_archive"
+    __table_args__ = (
+        Index("ix_activity_logs_archive_task_created", "task_id", "created_at"),
+        # Written once and read rarely: trade CPU for a much smaller footprint on InnoDB
+        {"mysql_row_format": "COMPRESSED"},
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    task_id = Column(Integer, nullable=False)
+    user_id = Column(Integer, nullable=False)
+    action = Column(String(100), nullable=False)
+    field_changed = Column(String(100), nullable=True)
+    old_value = Column(String(255), nullable=True)
+    new_value = Column(String(255), nullable=True)
+    created_at = Column(DateTime, nullable=False)
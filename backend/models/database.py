@@ -1,9 +1,15 @@
+import contextlib
 import os
 from urllib.parse import quote_plus
-import pymysql
-from sqlalchemy import create_engine
+from fastapi import Request
+from sqlalchemy import DateTime, create_engine, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.dialects import mysql
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from core.instrumentation import instrument_engine
+from core.metrics import InstrumentedAsyncQueuePool, InstrumentedQueuePool
+from core.replicas import read_from_primary, replica_monitor
 
 MYSQL_HOST = os.getenv("MYSQL_HOST", "mysql-shared")
 MYSQL_PORT = os.getenv("MYSQL_PORT", "3306")
@@ -15,6 +21,8 @@ APP_NAME = "devtaskboard"
 MYSQL_DB = f"{APP_NAME}_{APP_ID[:8]}" if APP_ID else os.getenv("MYSQL_DB", "devtaskboard_db")
 
 def ensure_database_exists():
+    import pymysql
+
     try:
         conn = pymysql.connect(
             host=MYSQL_HOST,
@@ -28,17 +36,157 @@ def ensure_database_exists():
     except Exception as e:
         print(f"Warning: Could not create database: {e}")
 
-ensure_database_exists()
+def mysql_url(driver, host, port):
+    return f"mysql+{driver}://{MYSQL_USER}:{quote_plus(MYSQL_PASSWORD)}@{host}:{port}/{MYSQL_DB}"
+
+DATABASE_URL = mysql_url("pymysql", MYSQL_HOST, MYSQL_PORT)
+ASYNC_DATABASE_URL = mysql_url("aiomysql", MYSQL_HOST, MYSQL_PORT)
+
+# Optional read replicas as "host[:port],host[:port]", sharing the primary's credentials and schema
+MYSQL_REPLICAS = [
+    (host, port or MYSQL_PORT)
+    for host, _, port in (entry.strip().partition(":") for entry in os.getenv("MYSQL_REPLICAS", "").split(","))
+    if host
+]
 
-DATABASE_URL = f"mysql+pymysql://{MYSQL_USER}:{quote_plus(MYSQL_PASSWORD)}@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DB}"
+# How long a process waits for another one's startup work (schema, demo data) before giving up
+STARTUP_LOCK_TIMEOUT = int(os.getenv("STARTUP_LOCK_TIMEOUT", "120"))
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Serve the routers from an asyncio engine instead of the threadpool + pymysql path
+DB_ASYNC = os.getenv("DB_ASYNC", "false").lower() == "true"
+
+# Defaults: room for bursts, and recycle well under MySQL's wait_timeout so idle connections never go stale
+POOL_OPTIONS = {
+    "pool_size": int(os.getenv("DB_POOL_SIZE", "10")),
+    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "20")),
+    "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+    "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+    "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower() == "true",
+}
+
+# Created on first use so importing the app never touches MySQL
+engine = None
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
 Base = declarative_base()
 
+# Microsecond precision so two writes within the same second still produce distinct validators
+PreciseDateTime = DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql")
+
+def get_engine():
+    global engine
+    if engine is None:
+        engine = create_engine(DATABASE_URL, poolclass=InstrumentedQueuePool, **POOL_OPTIONS)
+        instrument_engine(engine)
+        SessionLocal.configure(bind=engine)
+    return engine
+
+@contextlib.contextmanager
+def advisory_lock(name, timeout=STARTUP_LOCK_TIMEOUT):
+    """Hold a MySQL named lock for the block, so one process at a time runs it across every server."""
+    with get_engine().connect() as conn:
+        if conn.dialect.name != "mysql":
+            yield
+            return
+        # Named locks are server-wide; scope them to this schema
+        lock_name = f"{MYSQL_DB}:{name}"
+        if conn.execute(text("SELECT GET_LOCK(:name, :timeout)"), {"name": lock_name, "timeout": timeout}).scalar() != 1:
+            raise TimeoutError(f"Timed out after {timeout}s waiting for lock {lock_name}")
+        try:
+            yield
+        finally:
+            conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": lock_name})
+
 def get_db():
+    get_engine()
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+replica_engines = None
+
+def get_replica_engines():
+    global replica_engines
+    if replica_engines is None:
+        replica_engines = []
+        for host, port in MYSQL_REPLICAS:
+            replica = create_engine(mysql_url("pymysql", host, port), poolclass=InstrumentedQueuePool, **POOL_OPTIONS)
+            instrument_engine(replica)
+            replica_engines.append(replica)
+    return replica_engines
+
+def _read_replica(request: Request):
+    # Clients that wrote recently read from the primary so they see their own changes
+    if not MYSQL_REPLICAS or read_from_primary(request):
+        return None
+    return replica_monitor.choose()
+
+def get_read_db(request: Request):
+    """Session for read-only handlers: a healthy replica when one is configured, else the primary."""
+    get_engine()
+    index = _read_replica(request)
+    db = None
+    if index is not None:
+        db = SessionLocal(bind=get_replica_engines()[index])
+        try:
+            # Check out the connection now, while falling back to the primary is still possible
+            db.connection()
+        except DBAPIError as e:
+            db.close()
+            db = None
+            replica_monitor.mark_failed(index, e)
+    if db is None:
+        db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async_engine = None
+AsyncSessionLocal = None
+
+def get_async_sessionmaker():
+    global async_engine, AsyncSessionLocal
+    if AsyncSessionLocal is None:
+        # Imported lazily so the sync path does not need aiomysql/greenlet installed
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+        async_engine = create_async_engine(ASYNC_DATABASE_URL, poolclass=InstrumentedAsyncQueuePool, **POOL_OPTIONS)
+        instrument_engine(async_engine.sync_engine)
+        # Responses are serialized after the session's greenlet has returned, so nothing may lazy-load
+        AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+    return AsyncSessionLocal
+
+async def get_async_db():
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+async_replica_engines = None
+
+def get_async_replica_engines():
+    global async_replica_engines
+    if async_replica_engines is None:
+        from sqlalchemy.ext.asyncio import create_async_engine
+        async_replica_engines = []
+        for host, port in MYSQL_REPLICAS:
+            replica = create_async_engine(mysql_url("aiomysql", host, port), poolclass=InstrumentedAsyncQueuePool, **POOL_OPTIONS)
+            instrument_engine(replica.sync_engine)
+            async_replica_engines.append(replica)
+    return async_replica_engines
+
+async def get_async_read_db(request: Request):
+    make_session = get_async_sessionmaker()
+    index = _read_replica(request)
+    if index is not None:
+        db = make_session(bind=get_async_replica_engines()[index])
+        try:
+            await db.connection()
+        except DBAPIError as e:
+            await db.close()
+            replica_monitor.mark_failed(index, e)
+        else:
+            async with db:
+                yield db
+            return
+    async with make_session() as db:
+        yield db
\ No newline at end of file
@@ -1,7 +1,7 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy import Column, Integer, BigInteger, String, Text, DateTime
 from sqlalchemy.orm import relationship
 from datetime import datetime
-from models.database import Base
+from models.database import Base, PreciseDateTime
 
 class Project(Base):
     __tablename__ = "projects"
@@ -11,7 +11,9 @@ class Project(Base):
     key = Column(String(10), unique=True, nullable=False)
     description = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(PreciseDateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Last change sequence handed out to this project's tasks; see core/changes.py
+    change_seq = Column(BigInteger, nullable=False, default=0)
 
     sprints = relationship("Sprint", back_populates="project", cascade="all, delete-orphan")
     tasks = relationship("Task", back_populates="project", cascade="all, delete-orphan")
\ No newline at end of file
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime
+from models.database import Base
+
+class ProjectDeletionJob(Base):
+    """Progress of a background project deletion, kept in the database so every worker can report it."""
+
+    __tablename__ = "project_deletion_jobs"
+
+    # No foreign key: the row outlives the project it reports on
+    project_id = Column(Integer, primary_key=True, autoincrement=False)
+    status = Column(String(20), nullable=False)
+    total_tasks = Column(Integer, nullable=False, default=0)
+    deleted_tasks = Column(Integer, nullable=False, default=0)
+    started_at = Column(DateTime, nullable=False)
+    heartbeat_at = Column(DateTime, nullable=False)
+    finished_at = Column(DateTime, nullable=True)
+    error = Column(Text, nullable=True)
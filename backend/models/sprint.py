@@ -1,7 +1,7 @@
 from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
 from sqlalchemy.orm import relationship
 from datetime import datetime
-from models.database import Base
+from models.database import Base, PreciseDateTime
 
 class Sprint(Base):
     __tablename__ = "sprints"
@@ -14,6 +14,7 @@ class Sprint(Base):
     end_date = Column(DateTime, nullable=False)
     status = Column(String(50), nullable=False, default="planned")
     created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(PreciseDateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     project = relationship("Project", back_populates="sprints")
     tasks = relationship("Task", back_populates="sprint")
\ No newline at end of file
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, Date, DateTime, ForeignKey, UniqueConstraint
+from datetime import datetime
+from models.database import Base
+
+class SprintSnapshot(Base):
+    """A sprint's state at the end of one day, kept current by every task change that touches it that day."""
+
+    __tablename__ = "sprint_snapshots"
+    __table_args__ = (
+        UniqueConstraint("sprint_id", "day", name="uq_sprint_snapshots_sprint_day"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    sprint_id = Column(Integer, ForeignKey("sprints.id"), nullable=False)
+    day = Column(Date, nullable=False)
+    total_points = Column(Integer, nullable=False, default=0)
+    done_points = Column(Integer, nullable=False, default=0)
+    total_tasks = Column(Integer, nullable=False, default=0)
+    done_tasks = Column(Integer, nullable=False, default=0)
+    scope_added_points = Column(Integer, nullable=False, default=0)
+    scope_removed_points = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -1,10 +1,22 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, BigInteger, String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
-from models.database import Base
+from models.database import Base, PreciseDateTime
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Also serves plain (project_id, status) filters; a column reads in board order straight off it
+        Index("ix_tasks_project_status_rank", "project_id", "status", "rank"),
+        Index("ix_tasks_project_sprint_status", "project_id", "sprint_id", "status"),
+        Index("ix_tasks_sprint_status", "sprint_id", "status"),
+        Index("ix_tasks_assigned_status", "assigned_to", "status"),
+        Index("ix_tasks_project_updated", "project_id", "updated_at", "id"),
+        Index("ix_tasks_updated", "updated_at", "id"),
+        Index("ix_tasks_project_change_seq", "project_id", "change_seq"),
+        Index("ix_tasks_project_completed", "project_id", "completed_at"),
+        Index("ft_tasks_title_description", "title", "description", mysql_prefix="FULLTEXT").ddl_if(dialect="mysql"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
@@ -18,8 +30,14 @@ class Task(Base):
     assigned_to = Column(Integer, ForeignKey("users.id"), nullable=True)
     created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(PreciseDateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     due_date = Column(DateTime, nullable=True)
+    change_seq = Column(BigInteger, nullable=True)
+    # Maintained by core.analytics: first move out of "todo", and the latest move into "done"
+    started_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
+    # Board position within the (project_id, status) column, see core.ranking
+    rank = Column(String(64), nullable=False)
 
     project = relationship("Project", back_populates="tasks")
     sprint = relationship("Sprint", back_populates="tasks")
@@ -0,0 +1,79 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from core.cache import caches
+from core.instrumentation import request_db_time, request_latency, request_queries
+from core.metrics import InstrumentedPoolMixin, pool_stats, prometheus_family
+from core.replicas import replica_monitor
+from models import database
+
+router = APIRouter()
+
+@router.get("/admin/pool")
+def get_pool_stats():
+    pools = {"sync": pool_stats(database.get_engine().pool)}
+    if database.async_engine is not None:
+        pools["async"] = pool_stats(database.async_engine.sync_engine.pool)
+    for index, replica in enumerate(database.replica_engines or []):
+        pools[f"replica_{index}"] = pool_stats(replica.pool)
+    for index, replica in enumerate(database.async_replica_engines or []):
+        pools[f"async_replica_{index}"] = pool_stats(replica.sync_engine.pool)
+    return pools
+
+@router.get("/admin/replicas")
+def get_replica_status():
+    return replica_monitor.stats()
+
+@router.get("/admin/cache")
+def get_cache_stats():
+    return {name: cache.stats() for name, cache in caches.items()}
+
+@router.get("/admin/metrics", response_class=PlainTextResponse)
+def get_metrics():
+    """Prometheus text exposition of request, SQL, pool and cache metrics."""
+    pools = [({"engine": "sync"}, database.get_engine().pool)]
+    if database.async_engine is not None:
+        pools.append(({"engine": "async"}, database.async_engine.sync_engine.pool))
+    for index, replica in enumerate(database.replica_engines or []):
+        pools.append(({"engine": f"replica_{index}"}, replica.pool))
+    for index, replica in enumerate(database.async_replica_engines or []):
+        pools.append(({"engine": f"async_replica_{index}"}, replica.sync_engine.pool))
+    pools = [(labels, pool) for labels, pool in pools if isinstance(pool, InstrumentedPoolMixin)]
+
+    lines = []
+    lines += prometheus_family(
+        "http_request_duration_seconds", "histogram", "Request latency by route.",
+        [(dict(labels), histogram) for labels, histogram in request_latency.items()],
+    )
+    lines += prometheus_family(
+        "http_request_db_seconds", "histogram", "Time spent in SQL statements per request.",
+        [(dict(labels), histogram) for labels, histogram in request_db_time.items()],
+    )
+    lines += prometheus_family(
+        "http_request_db_queries", "histogram", "SQL statements issued per request.",
+        [(dict(labels), histogram) for labels, histogram in request_queries.items()],
+    )
+    lines += prometheus_family(
+        "db_pool_checkout_wait_seconds", "histogram", "Time spent waiting for a pooled connection.",
+        [(labels, pool.wait_time) for labels, pool in pools],
+    )
+    lines += prometheus_family(
+        "db_pool_checkout_timeouts_total", "counter", "Connection checkouts that timed out.",
+        [(labels, pool.timeouts) for labels, pool in pools],
+    )
+    lines += prometheus_family(
+        "db_pool_checked_out", "gauge", "Connections currently checked out.",
+        [(labels, pool.checkedout()) for labels, pool in pools],
+    )
+    lines += prometheus_family(
+        "db_replica_healthy", "gauge", "Whether a read replica is in rotation.",
+        [({"replica": str(index)}, int(status["healthy"])) for index, status in enumerate(replica_monitor.stats())],
+    )
+    lines += prometheus_family(
+        "cache_hits_total", "counter", "Reference data cache hits.",
+        [({"cache": name}, cache.hits) for name, cache in caches.items()],
+    )
+    lines += prometheus_family(
+        "cache_misses_total", "counter", "Reference data cache misses.",
+        [({"cache": name}, cache.misses) for name, cache in caches.items()],
+    )
+    return "\n".join(lines) + "\n"
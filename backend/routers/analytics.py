@@ -0,0 +1,126 @@
+from datetime import datetime, timedelta
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from models.database import get_read_db
+from models.project import Project
+from models.sprint import Sprint
+from models.sprint_snapshot import SprintSnapshot
+from models.task import Task
+from schemas.analytics import BurndownDay, BurndownResponse, CycleTimeResponse, SprintVelocity, VelocityResponse
+
+router = APIRouter()
+
+# All three endpoints read what core.analytics maintains on every task write; none replays activity
+
+def _percentile(sorted_values, q):
+    index = min(len(sorted_values) - 1, max(0, round(q * (len(sorted_values) - 1))))
+    return round(sorted_values[index], 2)
+
+def _require_project(db: Session, project_id):
+    if not db.query(Project.id).filter(Project.id == project_id).first():
+        raise HTTPException(status_code=404, detail="Project not found")
+
+@router.get("/sprints/{sprint_id}/burndown", response_model=BurndownResponse)
+def get_sprint_burndown(sprint_id: int, db: Session = Depends(get_read_db)):
+    sprint = db.query(Sprint).filter(Sprint.id == sprint_id).first()
+    if not sprint:
+        raise HTTPException(status_code=404, detail="Sprint not found")
+
+    snapshots = db.query(SprintSnapshot).filter(SprintSnapshot.sprint_id == sprint_id).order_by(SprintSnapshot.day).all()
+    start, end = sprint.start_date.date(), sprint.end_date.date()
+    last_day = min(end, datetime.utcnow().date())
+    by_day = {snapshot.day: snapshot for snapshot in snapshots}
+    # Snapshots are only written on days something changed; quiet days carry the previous state forward
+    current = None
+    for snapshot in snapshots:
+        if snapshot.day > start:
+            break
+        current = snapshot
+
+    sprint_days = max((end - start).days, 1)
+    committed = current.total_points if current else 0
+    days = []
+    day = start
+    while day <= last_day:
+        snapshot = by_day.get(day)
+        if snapshot:
+            current = snapshot
+        total = current.total_points if current else 0
+        done = current.done_points if current else 0
+        days.append(BurndownDay(
+            day=day,
+            total_points=total,
+            done_points=done,
+            remaining_points=total - done,
+            total_tasks=current.total_tasks if current else 0,
+            done_tasks=current.done_tasks if current else 0,
+            scope_added_points=snapshot.scope_added_points if snapshot else 0,
+            scope_removed_points=snapshot.scope_removed_points if snapshot else 0,
+            ideal_remaining_points=round(committed * (1 - (day - start).days / sprint_days), 2),
+        ))
+        day += timedelta(days=1)
+    return BurndownResponse(sprint_id=sprint_id, start_date=sprint.start_date, end_date=sprint.end_date, days=days)
+
+@router.get("/projects/{project_id}/velocity", response_model=VelocityResponse)
+def get_project_velocity(
+    project_id: int,
+    sprints: int = Query(6, ge=1, le=50, description="Number of most recently completed sprints"),
+    db: Session = Depends(get_read_db),
+):
+    _require_project(db, project_id)
+    recent = db.query(Sprint).filter(
+        Sprint.project_id == project_id, Sprint.status == "completed"
+    ).order_by(Sprint.end_date.desc()).limit(sprints).all()
+
+    snapshots = {}
+    if recent:
+        for snapshot in db.query(SprintSnapshot).filter(
+            SprintSnapshot.sprint_id.in_([sprint.id for sprint in recent])
+        ).order_by(SprintSnapshot.day):
+            snapshots.setdefault(snapshot.sprint_id, []).append(snapshot)
+
+    entries = []
+    for sprint in reversed(recent):
+        history = snapshots.get(sprint.id, [])
+        if not history:
+            continue
+        # Committed is what the sprint held when it started; completed is where it ended
+        at_start = [snapshot for snapshot in history if snapshot.day <= sprint.start_date.date()]
+        committed = (at_start[-1] if at_start else history[0]).total_points
+        entries.append(SprintVelocity(
+            sprint_id=sprint.id,
+            name=sprint.name,
+            end_date=sprint.end_date,
+            committed_points=committed,
+            completed_points=history[-1].done_points,
+        ))
+    average = round(sum(e.completed_points for e in entries) / len(entries), 2) if entries else None
+    return VelocityResponse(project_id=project_id, sprints=entries, average_completed_points=average)
+
+@router.get("/projects/{project_id}/cycle-time", response_model=CycleTimeResponse)
+def get_project_cycle_time(
+    project_id: int,
+    days: int = Query(90, ge=1, le=3650, description="Only tasks completed in the last N days"),
+    sprint_id: Optional[int] = Query(None),
+    db: Session = Depends(get_read_db),
+):
+    _require_project(db, project_id)
+    query = db.query(Task.started_at, Task.completed_at).filter(
+        Task.project_id == project_id,
+        Task.completed_at >= datetime.utcnow() - timedelta(days=days),
+        # Tasks created already done have no measurable cycle
+        Task.completed_at > Task.started_at,
+    )
+    if sprint_id:
+        query = query.filter(Task.sprint_id == sprint_id)
+    hours = sorted((completed - started).total_seconds() / 3600 for started, completed in query.all())
+
+    response = CycleTimeResponse(project_id=project_id, sprint_id=sprint_id, days=days, count=len(hours))
+    if hours:
+        response.mean_hours = round(sum(hours) / len(hours), 2)
+        response.p50_hours = _percentile(hours, 0.50)
+        response.p75_hours = _percentile(hours, 0.75)
+        response.p90_hours = _percentile(hours, 0.90)
+        response.p95_hours = _percentile(hours, 0.95)
+    return response
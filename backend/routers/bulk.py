@@ -0,0 +1,239 @@
+from contextlib import contextmanager
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from datetime import datetime
+from collections import Counter
+from core.activity_log import activity_row, record_activities
+from core.analytics import initial_timestamps, status_timestamps, track_task_change
+from core.changes import allocate_for_projects
+from core.events import notify_task_change
+from core.importer import insert_tasks
+from core.ranking import append_ranks
+from core.search import queue_search_op
+from models.database import get_db
+from models.project import Project
+from models.sprint import Sprint
+from models.task import Task
+from models.user import User
+from routers.stats import invalidate_task_stats
+from schemas.task import (
+    TaskBulkAssign, TaskBulkCreate, TaskBulkMove, TaskBulkResponse, TaskBulkResult, TaskBulkUpdate,
+    TaskResponse,
+)
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Registered ahead of routers.tasks so /tasks/bulk/... is not captured by /tasks/{task_id}/...
+router = APIRouter()
+
+def _existing_ids(db: Session, column, ids):
+    ids = {i for i in ids if i is not None}
+    if not ids:
+        return set()
+    return {row[0] for row in db.query(column).filter(column.in_(ids)).all()}
+
+def _activity(state, action, field_changed=None, old_value=None, new_value=None, now=None):
+    return activity_row(state["id"], state["created_by"], action, field_changed, old_value, new_value, now)
+
+@contextmanager
+def _bulk_transaction(db: Session):
+    # Statements are checked as they run (MySQL checks foreign keys per row), so a constraint violation
+    # can surface at any of them, not only at commit
+    try:
+        yield
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        logger.error(f"Bulk task operation failed: {str(e)}")
+        raise HTTPException(status_code=400, detail="Bulk operation violates a database constraint")
+
+def _finish(db: Session, results, project_ids):
+    task_ids = [r.task_id for r in results if r.success]
+    if task_ids:
+        tasks = {t.id: t for t in db.query(Task).filter(Task.id.in_(task_ids)).all()}
+        for result in results:
+            if result.success:
+                result.task = TaskResponse.model_validate(tasks[result.task_id])
+    for project_id in project_ids:
+        invalidate_task_stats(project_id)
+
+    succeeded = sum(1 for r in results if r.success)
+    return TaskBulkResponse(succeeded=succeeded, failed=len(results) - succeeded, results=results)
+
+def _apply_task_updates(db: Session, items, changes_for, event_type):
+    task_ids = {item.task_id for item in items}
+    states = {
+        row.id: dict(row._mapping)
+        for row in db.query(*Task.__table__.columns).filter(Task.id.in_(task_ids)).all()
+    }
+
+    originals = {task_id: dict(state) for task_id, state in states.items()}
+
+    now = datetime.utcnow()
+    results = []
+    values_by_task = {}
+    activities = []
+    for index, item in enumerate(items):
+        state = states.get(item.task_id)
+        if state is None:
+            results.append(TaskBulkResult(index=index, task_id=item.task_id, success=False, error="Task not found"))
+            continue
+        error, values, item_activities = changes_for(item, state, now)
+        if error:
+            results.append(TaskBulkResult(index=index, task_id=item.task_id, success=False, error=error))
+            continue
+        # Later items for the same task see the earlier items' values, so their activity rows chain correctly
+        state.update(values)
+        values_by_task.setdefault(item.task_id, {}).update(values)
+        activities.extend(item_activities)
+        results.append(TaskBulkResult(index=index, task_id=item.task_id, success=True))
+
+    with _bulk_transaction(db):
+        rows = []
+        for task_id, values in values_by_task.items():
+            if not values:
+                continue
+            before, after = originals[task_id], states[task_id]
+            timestamps = status_timestamps(before["status"], after["status"], before["started_at"], now)
+            rows.append({"id": task_id, **values, **timestamps, "updated_at": now})
+            track_task_change(db, before, after)
+        # Tasks that changed column go to the bottom of their new one
+        moved = [row for row in rows if originals[row["id"]]["status"] != states[row["id"]]["status"]]
+        ranks = append_ranks(db, [(states[row["id"]]["project_id"], states[row["id"]]["status"]) for row in moved])
+        for row, rank in zip(moved, ranks):
+            row["rank"] = rank
+        seqs = allocate_for_projects(db, Counter(states[row["id"]]["project_id"] for row in rows))
+        for row in rows:
+            row["change_seq"] = next(seqs[states[row["id"]]["project_id"]])
+        if rows:
+            db.execute(update(Task), rows)
+        record_activities(db, activities)
+        for task_id, values in values_by_task.items():
+            if values:
+                notify_task_change(db, event_type, states[task_id]["project_id"], task_id, jsonable_encoder(values))
+            text_fields = {key: values[key] for key in ("title", "description") if key in values}
+            if text_fields:
+                queue_search_op(db, ("task", task_id, states[task_id]["project_id"], text_fields))
+
+    return _finish(db, results, {states[task_id]["project_id"] for task_id in values_by_task})
+
+@router.post("/tasks/bulk", response_model=TaskBulkResponse)
+def bulk_create_tasks(payload: TaskBulkCreate, db: Session = Depends(get_db)):
+    items = payload.tasks
+    projects = _existing_ids(db, Project.id, [t.project_id for t in items])
+    sprints = _existing_ids(db, Sprint.id, [t.sprint_id for t in items])
+    users = _existing_ids(db, User.id, [t.assigned_to for t in items] + [t.created_by for t in items])
+
+    results = []
+    rows = []
+    for index, task in enumerate(items):
+        error = None
+        if task.project_id not in projects:
+            error = "Project not found"
+        elif task.sprint_id is not None and task.sprint_id not in sprints:
+            error = "Sprint not found"
+        elif task.created_by not in users or (task.assigned_to is not None and task.assigned_to not in users):
+            error = "User not found"
+        results.append(TaskBulkResult(index=index, success=error is None, error=error))
+        if error is None:
+            rows.append(task.model_dump())
+
+    if rows:
+        with _bulk_transaction(db):
+            seqs = allocate_for_projects(db, Counter(row["project_id"] for row in rows))
+            now = datetime.utcnow()
+            ranks = append_ranks(db, [(row["project_id"], row["status"]) for row in rows])
+            for row, rank in zip(rows, ranks):
+                row["change_seq"] = next(seqs[row["project_id"]])
+                row["rank"] = rank
+                row.update(initial_timestamps(row["status"], now))
+                track_task_change(db, None, row)
+            task_ids = insert_tasks(db, rows)
+            created = [result for result in results if result.success]
+            activities = []
+            for result, task_id, row in zip(created, task_ids, rows):
+                result.task_id = task_id
+                activities.append(_activity({"id": task_id, "created_by": row["created_by"]}, "created", now=now))
+            record_activities(db, activities)
+            for task_id, row in zip(task_ids, rows):
+                notify_task_change(db, "task.created", row["project_id"], task_id, {"id": task_id, **jsonable_encoder(row)})
+                queue_search_op(db, ("task", task_id, row["project_id"], {"title": row["title"], "description": row["description"]}))
+
+    return _finish(db, results, {row["project_id"] for row in rows})
+
+@router.put("/tasks/bulk/move", response_model=TaskBulkResponse)
+def bulk_move_tasks(payload: TaskBulkMove, db: Session = Depends(get_db)):
+    sprints = _existing_ids(db, Sprint.id, [item.sprint_id for item in payload.items if item.sprint_id])
+
+    def changes_for(move, state, now):
+        if move.before_id is not None or move.after_id is not None:
+            return "Positioning between tasks is only supported by the single-task move", None, None
+        values = {}
+        activities = []
+        if move.status:
+            activities.append(_activity(state, "moved", "status", state["status"], move.status, now))
+            values["status"] = move.status
+        if move.sprint_id is not None:
+            if move.sprint_id and move.sprint_id not in sprints:
+                return "Sprint not found", None, None
+            old_sprint = state["sprint_id"]
+            activities.append(_activity(
+                state, "moved", "sprint_id",
+                str(old_sprint) if old_sprint else None,
+                str(move.sprint_id) if move.sprint_id else None,
+                now,
+            ))
+            values["sprint_id"] = move.sprint_id
+        return None, values, activities
+
+    return _apply_task_updates(db, payload.items, changes_for, "task.moved")
+
+@router.put("/tasks/bulk/assign", response_model=TaskBulkResponse)
+def bulk_assign_tasks(payload: TaskBulkAssign, db: Session = Depends(get_db)):
+    users = _existing_ids(db, User.id, [item.user_id for item in payload.items])
+
+    def changes_for(assign, state, now):
+        if assign.user_id not in users:
+            return "User not found", None, None
+        old_assignee = state["assigned_to"]
+        activity = _activity(
+            state, "assigned", "assigned_to",
+            str(old_assignee) if old_assignee else None,
+            str(assign.user_id),
+            now,
+        )
+        return None, {"assigned_to": assign.user_id}, [activity]
+
+    return _apply_task_updates(db, payload.items, changes_for, "task.assigned")
+
+@router.put("/tasks/bulk/update", response_model=TaskBulkResponse)
+def bulk_update_tasks(payload: TaskBulkUpdate, db: Session = Depends(get_db)):
+    sprints = _existing_ids(db, Sprint.id, [item.sprint_id for item in payload.items])
+    users = _existing_ids(db, User.id, [item.assigned_to for item in payload.items])
+
+    def changes_for(task, state, now):
+        fields = task.model_dump(exclude_unset=True, exclude={"task_id"})
+        if fields.get("sprint_id") is not None and fields["sprint_id"] not in sprints:
+            return "Sprint not found", None, None
+        if fields.get("assigned_to") is not None and fields["assigned_to"] not in users:
+            return "User not found", None, None
+
+        values = {}
+        activities = []
+        for key, value in fields.items():
+            old_value = state[key]
+            if old_value != value:
+                activities.append(_activity(
+                    state, "updated", key,
+                    str(old_value) if old_value else None,
+                    str(value) if value else None,
+                    now,
+                ))
+                values[key] = value
+        return None, values, activities
+
+    return _apply_task_updates(db, payload.items, changes_for, "task.updated")
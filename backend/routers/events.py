@@ -0,0 +1,48 @@
+import asyncio
+import contextlib
+from fastapi import APIRouter, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from core.events import event_hub
+
+router = APIRouter()
+
+SSE_HEARTBEAT_SECONDS = 15
+
+@router.websocket("/ws/projects/{project_id}")
+async def project_events_socket(websocket: WebSocket, project_id: int):
+    await websocket.accept()
+    with event_hub.subscribe(project_id) as subscriber:
+        async def forward():
+            while True:
+                await websocket.send_text(await subscriber.get())
+
+        sender = asyncio.create_task(forward())
+        try:
+            # The board never sends anything; reading only tells us when the client goes away
+            while True:
+                await websocket.receive_text()
+        except WebSocketDisconnect:
+            pass
+        finally:
+            sender.cancel()
+            with contextlib.suppress(asyncio.CancelledError, WebSocketDisconnect, RuntimeError):
+                await sender
+
+@router.get("/projects/{project_id}/events")
+async def project_events_stream(project_id: int, request: Request):
+    async def stream():
+        with event_hub.subscribe(project_id) as subscriber:
+            yield ": connected\n\n"
+            while not await request.is_disconnected():
+                try:
+                    message = await asyncio.wait_for(subscriber.get(), SSE_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": heartbeat\n\n"
+                    continue
+                yield f"data: {message}\n\n"
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,49 @@
+from fastapi import APIRouter, Query
+from sqlalchemy import select
+from typing import Optional
+from core.export import export_response
+from core.serialization import response_columns
+from models.activity_log import ActivityLog
+from models.activity_log_archive import ActivityLogArchive
+from models.task import Task
+from routers.tasks import task_filters
+from schemas.activity_log import ActivityLogResponse
+from schemas.task import TaskResponse
+
+router = APIRouter()
+
+FORMAT_PATTERN = "^(csv|ndjson)$"
+
+# No db dependency: the body outlives the request scope, so core.export opens its own connection
+
+@router.get("/export/tasks")
+def export_tasks(
+    project_id: Optional[int] = Query(None),
+    sprint_id: Optional[int] = Query(None),
+    status: Optional[str] = Query(None),
+    assigned_to: Optional[int] = Query(None),
+    format: str = Query("csv", pattern=FORMAT_PATTERN),
+    gzip: bool = Query(False),
+):
+    columns = response_columns(TaskResponse, Task)
+    statement = select(*columns).where(*task_filters(project_id, sprint_id, status, assigned_to)).order_by(Task.id)
+    return export_response([statement], [c.name for c in columns], format, "tasks", gzip)
+
+@router.get("/export/activity")
+def export_activity(
+    project_id: Optional[int] = Query(None),
+    task_id: Optional[int] = Query(None),
+    format: str = Query("csv", pattern=FORMAT_PATTERN),
+    gzip: bool = Query(False),
+):
+    statements = []
+    # Archived rows are the oldest, so streaming the archive first keeps the export in id order
+    for model in (ActivityLogArchive, ActivityLog):
+        columns = response_columns(ActivityLogResponse, model)
+        statement = select(*columns).order_by(model.id)
+        if task_id:
+            statement = statement.where(model.task_id == task_id)
+        if project_id:
+            statement = statement.where(model.task_id.in_(select(Task.id).where(Task.project_id == project_id)))
+        statements.append(statement)
+    return export_response(statements, [c.name for c in columns], format, "activity", gzip)
@@ -0,0 +1,87 @@
+import logging
+import tempfile
+from typing import Optional
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from core.importer import IMPORT_BATCH_SIZE, READERS, TaskImporter
+from models import database
+from models.project import Project
+from routers.stats import invalidate_task_stats
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# Uploads larger than this are spooled to disk instead of held in memory
+IMPORT_SPOOL_MEMORY_LIMIT = 8 * 1024 * 1024
+CONTENT_TYPE_FORMATS = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+    "application/json": "json",
+}
+
+# No db dependency: the import outlives the request scope, so it opens its own session
+
+def _line(payload):
+    return orjson.dumps(payload) + b"\n"
+
+def _open_importer(project_id, created_by, batch_size):
+    database.get_engine()
+    db = database.SessionLocal()
+    try:
+        if db.get(Project, project_id) is None:
+            raise HTTPException(status_code=404, detail="Project not found")
+        try:
+            return TaskImporter(db, project_id, created_by, batch_size)
+        except LookupError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    except Exception:
+        db.close()
+        raise
+
+def _run_import(importer, records, spool):
+    try:
+        for progress in importer.run(records):
+            yield _line({"type": "progress", **progress})
+        invalidate_task_stats(importer.project_id)
+        yield _line({"type": "summary", **importer.summary()})
+    except Exception as e:
+        importer.db.rollback()
+        logger.exception(f"Import into project {importer.project_id} failed")
+        # Batches committed before the failure stay imported; the summary says how far it got
+        invalidate_task_stats(importer.project_id)
+        yield _line({"type": "error", "detail": str(e), **importer.summary()})
+    finally:
+        importer.db.close()
+        spool.close()
+
+@router.post("/projects/{project_id}/import")
+async def import_tasks(
+    project_id: int,
+    request: Request,
+    format: Optional[str] = Query(None, pattern="^(csv|ndjson|json)$"),
+    created_by: Optional[str] = Query(None, description="Creator for rows that do not name one"),
+    batch_size: int = Query(IMPORT_BATCH_SIZE, ge=1, le=10000),
+):
+    """Import tasks from a CSV, NDJSON or JSON array body, streaming NDJSON progress lines back."""
+    if format is None:
+        content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+        format = CONTENT_TYPE_FORMATS.get(content_type)
+        if format is None:
+            raise HTTPException(status_code=415, detail="Pass format=csv|ndjson|json or a matching Content-Type")
+
+    importer = await run_in_threadpool(_open_importer, project_id, created_by, batch_size)
+    spool = tempfile.SpooledTemporaryFile(max_size=IMPORT_SPOOL_MEMORY_LIMIT)
+    try:
+        async for chunk in request.stream():
+            spool.write(chunk)
+    except BaseException:
+        importer.db.close()
+        spool.close()
+        raise
+    spool.seek(0)
+
+    return StreamingResponse(_run_import(importer, READERS[format](spool), spool), media_type="application/x-ndjson")
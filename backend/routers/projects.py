@@ -1,9 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from typing import List
+from core.cache import create_cache
+from core.etag import conditional_response, make_etag
+from core.project_deletion import PROJECT_DELETE_INLINE_MAX_TASKS, delete_project_rows, deletion_jobs
 from models.database import get_db
 from models.project import Project
+from models.task import Task
+from routers.sprints import invalidate_sprint_cache
+from routers.stats import invalidate_task_stats
 from schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse
 import logging
 
@@ -11,22 +18,51 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+project_cache = create_cache("projects")
+
+def invalidate_project_cache(project_id=None):
+    project_cache.invalidate("all")
+    if project_id is not None:
+        project_cache.invalidate(project_id)
+
+def _load_projects(db: Session):
+    count, last_updated = db.query(func.count(Project.id), func.max(Project.updated_at)).one()
+    return {
+        "etag": make_etag("projects", count, last_updated),
+        "data": [ProjectResponse.model_validate(project).model_dump(mode="json") for project in db.query(Project).all()],
+    }
+
+def _load_project(db: Session, project_id):
+    project = db.query(Project).filter(Project.id == project_id).first()
+    if not project:
+        return None
+    return {
+        "etag": make_etag("project", project_id, project.updated_at),
+        "data": ProjectResponse.model_validate(project).model_dump(mode="json"),
+    }
+
 @router.get("/projects", response_model=List[ProjectResponse])
-def get_projects(db: Session = Depends(get_db)):
-    projects = db.query(Project).all()
-    return projects
+def get_projects(request: Request, response: Response, db: Session = Depends(get_db)):
+    projects = project_cache.get_or_load("all", lambda: _load_projects(db))
+    not_modified = conditional_response(request, response, projects["etag"])
+    if not_modified:
+        return not_modified
+    return projects["data"]
 
 @router.get("/projects/{project_id}", response_model=ProjectResponse)
-def get_project(project_id: int, db: Session = Depends(get_db)):
-    project = db.query(Project).filter(Project.id == project_id).first()
+def get_project(project_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
+    project = project_cache.get_or_load(project_id, lambda: _load_project(db, project_id))
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
-    return project
+    not_modified = conditional_response(request, response, project["etag"])
+    if not_modified:
+        return not_modified
+    return project["data"]
 
 @router.post("/projects", response_model=ProjectResponse)
 def create_project(project: ProjectCreate, db: Session = Depends(get_db)):
     try:
-        logger.info(f"Creating project with data: {project.dict()}")
+        logger.info(f"Creating project with data: {project.model_dump()}")
         
         # Check if project key already exists
         existing_project = db.query(Project).filter(Project.key == project.key.upper()).first()
@@ -34,10 +70,11 @@ def create_project(project: ProjectCreate, db: Session = Depends(get_db)):
             logger.error(f"Project key {project.key} already exists")
             raise HTTPException(status_code=400, detail=f"Project key '{project.key.upper()}' already exists")
         
-        db_project = Project(**project.dict())
+        db_project = Project(**project.model_dump())
         db.add(db_project)
         db.commit()
         db.refresh(db_project)
+        invalidate_project_cache()
         
         logger.info(f"Project created successfully with id: {db_project.id}")
         return db_project
@@ -57,19 +94,41 @@ def update_project(project_id: int, project: ProjectUpdate, db: Session = Depend
     if not db_project:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    for key, value in project.dict(exclude_unset=True).items():
+    for key, value in project.model_dump(exclude_unset=True).items():
         setattr(db_project, key, value)
     
     db.commit()
     db.refresh(db_project)
+    invalidate_project_cache(project_id)
     return db_project
 
+def _invalidate_deleted_project(project_id):
+    invalidate_project_cache(project_id)
+    invalidate_sprint_cache()
+    invalidate_task_stats(project_id)
+
 @router.delete("/projects/{project_id}")
-def delete_project(project_id: int, db: Session = Depends(get_db)):
-    db_project = db.query(Project).filter(Project.id == project_id).first()
-    if not db_project:
+def delete_project(project_id: int, response: Response, db: Session = Depends(get_db)):
+    if not db.query(Project.id).filter(Project.id == project_id).first():
         raise HTTPException(status_code=404, detail="Project not found")
     
-    db.delete(db_project)
-    db.commit()
-    return {"success": True}
\ No newline at end of file
+    task_count = db.query(func.count(Task.id)).filter(Task.project_id == project_id).scalar()
+    if task_count > PROJECT_DELETE_INLINE_MAX_TASKS:
+        try:
+            job = deletion_jobs.start(project_id, task_count, _invalidate_deleted_project)
+        except TimeoutError:
+            raise HTTPException(status_code=409, detail="Another request is starting this deletion")
+        response.status_code = 202
+        return {"success": True, "job": job}
+    
+    for _ in delete_project_rows(db, project_id):
+        pass
+    _invalidate_deleted_project(project_id)
+    return {"success": True}
+
+@router.get("/projects/{project_id}/deletion")
+def get_project_deletion(project_id: int):
+    job = deletion_jobs.get(project_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="No deletion job for this project")
+    return job
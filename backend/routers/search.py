@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+from core.search import comment_snippets, highlight, search_tasks, tokenize
+from models.database import get_read_db
+from models.task import Task
+from schemas.search import CommentSnippet, SearchHit, SearchResponse
+from schemas.task import TaskResponse
+
+router = APIRouter()
+
+@router.get("/search", response_model=SearchResponse)
+def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    project_id: Optional[int] = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0, le=10000),
+    db: Session = Depends(get_read_db)
+):
+    ranked, has_more = search_tasks(db, q, project_id, limit, offset)
+    terms = tokenize(q)
+    tasks, comments = {}, {}
+    if ranked:
+        task_ids = [task_id for task_id, _ in ranked]
+        tasks = {task.id: task for task in db.query(Task).filter(Task.id.in_(task_ids)).all()}
+        comments = comment_snippets(db, task_ids, terms)
+    
+    hits = [
+        SearchHit(
+            task=TaskResponse.model_validate(tasks[task_id]),
+            score=round(score, 4),
+            title_highlight=highlight(tasks[task_id].title, terms),
+            snippet=highlight(tasks[task_id].description, terms, snippet=True),
+            comments=[
+                CommentSnippet(comment_id=comment_id, snippet=snippet)
+                for comment_id, snippet in comments.get(task_id, ())
+            ],
+        )
+        for task_id, score in ranked
+        # The in-process index can briefly lag a delete made by another session
+        if task_id in tasks
+    ]
+    return SearchResponse(query=q, limit=limit, offset=offset, has_more=has_more, hits=hits)
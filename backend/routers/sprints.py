@@ -1,33 +1,125 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import case, func
 from sqlalchemy.orm import Session
 from typing import List, Optional
+from core.analytics import mark_sprint_changed
+from core.cache import create_cache
+from core.etag import conditional_response, make_etag
 from models.database import get_db
 from models.sprint import Sprint
-from schemas.sprint import SprintCreate, SprintUpdate, SprintResponse
+from models.task import Task
+from schemas.sprint import SprintCreate, SprintUpdate, SprintResponse, SprintStats
 
 router = APIRouter()
 
-@router.get("/sprints", response_model=List[SprintResponse])
-def get_sprints(project_id: Optional[int] = Query(None), db: Session = Depends(get_db)):
+sprint_cache = create_cache("sprints")
+
+def invalidate_sprint_cache():
+    # Lists are keyed per project filter, so any sprint write drops the whole namespace
+    sprint_cache.invalidate()
+
+def _dump(sprint):
+    return SprintResponse.model_validate(sprint).model_dump(mode="json", exclude={"stats"})
+
+def get_sprint_stats(db: Session, sprint_ids):
+    if not sprint_ids:
+        return {}
+
+    is_done = Task.status == "done"
+    rows = db.query(
+        Task.sprint_id,
+        Task.assigned_to,
+        func.count(Task.id),
+        func.sum(case((is_done, 1), else_=0)),
+        func.coalesce(func.sum(Task.story_points), 0),
+        func.coalesce(func.sum(case((is_done, Task.story_points), else_=0)), 0),
+    ).filter(
+        Task.sprint_id.in_(sprint_ids)
+    ).group_by(Task.sprint_id, Task.assigned_to).all()
+
+    stats = {sprint_id: SprintStats() for sprint_id in sprint_ids}
+    for sprint_id, assigned_to, count, done, points, done_points in rows:
+        sprint_stats = stats[sprint_id]
+        sprint_stats.task_count += count
+        sprint_stats.done_count += int(done or 0)
+        sprint_stats.story_points += int(points)
+        sprint_stats.done_story_points += int(done_points)
+        if assigned_to:
+            sprint_stats.assignees.append(assigned_to)
+    for sprint_stats in stats.values():
+        sprint_stats.assignees.sort()
+    return stats
+
+def _sprint_query(db: Session, project_id):
     query = db.query(Sprint)
     if project_id:
         query = query.filter(Sprint.project_id == project_id)
+    return query
+
+def _load_sprints(db: Session, project_id):
+    query = _sprint_query(db, project_id)
+    count, last_updated = query.with_entities(func.count(Sprint.id), func.max(Sprint.updated_at)).one()
+    return {
+        "etag": make_etag("sprints", project_id, None, count, last_updated),
+        "data": [_dump(sprint) for sprint in query.all()],
+    }
+
+def _load_sprint(db: Session, sprint_id):
+    sprint = db.query(Sprint).filter(Sprint.id == sprint_id).first()
+    if not sprint:
+        return None
+    return {"etag": make_etag("sprint", sprint_id, sprint.updated_at), "data": _dump(sprint)}
+
+@router.get("/sprints", response_model=List[SprintResponse])
+def get_sprints(
+    request: Request,
+    response: Response,
+    project_id: Optional[int] = Query(None),
+    include: Optional[str] = Query(None, pattern="^stats$"),
+    db: Session = Depends(get_db)
+):
+    if include != "stats":
+        sprints = sprint_cache.get_or_load(f"list:{project_id}", lambda: _load_sprints(db, project_id))
+        not_modified = conditional_response(request, response, sprints["etag"])
+        if not_modified:
+            return not_modified
+        return sprints["data"]
+    
+    query = _sprint_query(db, project_id)
+    # Sprint summaries also change whenever a task in any sprint does
+    version = query.with_entities(func.count(Sprint.id), func.max(Sprint.updated_at)).one()
+    task_query = db.query(func.count(Task.id), func.max(Task.updated_at)).filter(Task.sprint_id.isnot(None))
+    if project_id:
+        task_query = task_query.filter(Task.project_id == project_id)
+    version = tuple(version) + tuple(task_query.one())
+    not_modified = conditional_response(request, response, make_etag("sprints", project_id, include, *version))
+    if not_modified:
+        return not_modified
+    
     sprints = query.all()
-    return sprints
+    stats = get_sprint_stats(db, [sprint.id for sprint in sprints])
+    return [
+        SprintResponse.model_validate(sprint).model_copy(update={"stats": stats[sprint.id]})
+        for sprint in sprints
+    ]
 
 @router.get("/sprints/{sprint_id}", response_model=SprintResponse)
-def get_sprint(sprint_id: int, db: Session = Depends(get_db)):
-    sprint = db.query(Sprint).filter(Sprint.id == sprint_id).first()
+def get_sprint(sprint_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
+    sprint = sprint_cache.get_or_load(sprint_id, lambda: _load_sprint(db, sprint_id))
     if not sprint:
         raise HTTPException(status_code=404, detail="Sprint not found")
-    return sprint
+    not_modified = conditional_response(request, response, sprint["etag"])
+    if not_modified:
+        return not_modified
+    return sprint["data"]
 
 @router.post("/sprints", response_model=SprintResponse)
 def create_sprint(sprint: SprintCreate, db: Session = Depends(get_db)):
-    db_sprint = Sprint(**sprint.dict())
+    db_sprint = Sprint(**sprint.model_dump())
     db.add(db_sprint)
     db.commit()
     db.refresh(db_sprint)
+    invalidate_sprint_cache()
     return db_sprint
 
 @router.put("/sprints/{sprint_id}", response_model=SprintResponse)
@@ -36,11 +128,12 @@ def update_sprint(sprint_id: int, sprint: SprintUpdate, db: Session = Depends(ge
     if not db_sprint:
         raise HTTPException(status_code=404, detail="Sprint not found")
     
-    for key, value in sprint.dict(exclude_unset=True).items():
+    for key, value in sprint.model_dump(exclude_unset=True).items():
         setattr(db_sprint, key, value)
     
     db.commit()
     db.refresh(db_sprint)
+    invalidate_sprint_cache()
     return db_sprint
 
 @router.post("/sprints/{sprint_id}/start", response_model=SprintResponse)
@@ -50,8 +143,10 @@ def start_sprint(sprint_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Sprint not found")
     
     sprint.status = "active"
+    mark_sprint_changed(db, sprint_id)
     db.commit()
     db.refresh(sprint)
+    invalidate_sprint_cache()
     return sprint
 
 @router.post("/sprints/{sprint_id}/complete", response_model=SprintResponse)
@@ -61,6 +156,8 @@ def complete_sprint(sprint_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Sprint not found")
     
     sprint.status = "completed"
+    mark_sprint_changed(db, sprint_id)
     db.commit()
     db.refresh(sprint)
+    invalidate_sprint_cache()
     return sprint
\ No newline at end of file
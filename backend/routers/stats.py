@@ -0,0 +1,88 @@
+import os
+from collections import defaultdict
+from itertools import groupby
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from core.cache import create_cache
+from models.database import get_db
+from models.project import Project
+from models.task import Task
+from schemas.stats import TaskStatsResponse
+
+router = APIRouter()
+
+STATS_CACHE_TTL = float(os.getenv("STATS_CACHE_TTL", "10"))
+stats_cache = create_cache("stats", ttl=STATS_CACHE_TTL)
+
+GROUP_COLUMNS = (Task.status, Task.task_type, Task.priority, Task.assigned_to)
+AGGREGATES = (func.count(Task.id), func.coalesce(func.sum(Task.story_points), 0))
+
+def invalidate_task_stats(project_id):
+    stats_cache.invalidate(project_id)
+    stats_cache.invalidate("all")
+    stats_cache.invalidate("projects")
+
+def compute_task_stats(db: Session, project_id=None):
+    query = db.query(*GROUP_COLUMNS, *AGGREGATES)
+    if project_id is not None:
+        query = query.filter(Task.project_id == project_id)
+    return _build_stats(project_id, query.group_by(*GROUP_COLUMNS).all())
+
+def compute_project_task_stats(db: Session):
+    """Stats for every project that has tasks, from one GROUP BY instead of a query per project."""
+    rows = db.query(Task.project_id, *GROUP_COLUMNS, *AGGREGATES).group_by(
+        Task.project_id, *GROUP_COLUMNS
+    ).order_by(Task.project_id).all()
+    return [
+        _build_stats(project_id, [row[1:] for row in project_rows])
+        for project_id, project_rows in groupby(rows, key=lambda row: row[0])
+    ]
+
+def _build_stats(project_id, rows):
+    by_status = defaultdict(int)
+    by_type = defaultdict(int)
+    by_priority = defaultdict(int)
+    by_assignee = defaultdict(int)
+    points_by_status = defaultdict(int)
+    for status, task_type, priority, assigned_to, count, points in rows:
+        by_status[status] += count
+        by_type[task_type] += count
+        by_priority[priority] += count
+        by_assignee[str(assigned_to) if assigned_to else "unassigned"] += count
+        points_by_status[status] += int(points)
+
+    return TaskStatsResponse(
+        project_id=project_id,
+        total=sum(by_status.values()),
+        story_points=sum(points_by_status.values()),
+        done_story_points=points_by_status.get("done", 0),
+        by_status=by_status,
+        by_type=by_type,
+        by_priority=by_priority,
+        by_assignee=by_assignee,
+        story_points_by_status=points_by_status,
+    )
+
+@router.get("/stats", response_model=TaskStatsResponse)
+def get_stats(db: Session = Depends(get_db)):
+    return stats_cache.get_or_load("all", lambda: compute_task_stats(db).model_dump())
+
+@router.get("/stats/projects", response_model=List[TaskStatsResponse])
+def get_all_project_stats(db: Session = Depends(get_db)):
+    return stats_cache.get_or_load(
+        "projects", lambda: [s.model_dump() for s in compute_project_task_stats(db)]
+    )
+
+@router.get("/projects/{project_id}/stats", response_model=TaskStatsResponse)
+def get_project_stats(project_id: int, db: Session = Depends(get_db)):
+    def load():
+        if not db.query(Project.id).filter(Project.id == project_id).first():
+            return None
+        return compute_task_stats(db, project_id).model_dump()
+
+    stats = stats_cache.get_or_load(project_id, load)
+    if stats is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    return stats
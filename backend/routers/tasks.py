@@ -1,58 +1,198 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional
-from models.database import get_db
+from core.activity_log import record_activity, task_activity_page
+from core.etag import conditional_response, make_etag
+from core.events import notify_task_change
+from core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, decode_cursor, encode_cursor, paginate
+from core.ranking import RankConflict, place_task
+from core.serialization import response_columns, rows_response
+from models.database import get_db, get_read_db
 from models.task import Task
-from models.activity_log import ActivityLog
-from schemas.task import TaskCreate, TaskUpdate, TaskMove, TaskAssign, TaskResponse
+from models.project import Project
+from models.task_tombstone import TaskTombstone
+from models.activity_log_archive import ActivityLogArchive
+from models.user import User
+from schemas.task import TaskCreate, TaskUpdate, TaskMove, TaskAssign, TaskResponse, TaskChangesResponse, TaskDetailResponse
 from schemas.comment import CommentCreate, CommentResponse
 from schemas.activity_log import ActivityLogResponse
+from schemas.user import UserSummary
 from models.comment import Comment
+from routers.stats import invalidate_task_stats
 
 router = APIRouter()
 
+TASK_SORT_COLUMNS = {
+    "id": [Task.id],
+    # Board order: read straight off ix_tasks_project_status_rank when filtered by project
+    "rank": [Task.status, Task.rank, Task.id],
+    "created_at": [Task.created_at, Task.id],
+    "updated_at": [Task.updated_at, Task.id],
+}
+
+def task_filters(project_id=None, sprint_id=None, status=None, assigned_to=None):
+    criteria = []
+    if project_id:
+        criteria.append(Task.project_id == project_id)
+    if sprint_id:
+        criteria.append(Task.sprint_id == sprint_id)
+    if status:
+        criteria.append(Task.status == status)
+    if assigned_to:
+        criteria.append(Task.assigned_to == assigned_to)
+    return criteria
+
+def _task_list_version(db: Session, project_id):
+    # Every task insert, update, delete and rank rewrite advances its project's change_seq, so the
+    # high-water mark versions any list without touching the tasks table
+    if project_id:
+        return db.query(Project.change_seq).filter(Project.id == project_id).scalar()
+    return tuple(db.query(func.count(Project.id), func.max(Project.id), func.sum(Project.change_seq)).one())
+
 @router.get("/tasks", response_model=List[TaskResponse])
 def get_tasks(
+    request: Request,
+    response: Response,
     project_id: Optional[int] = Query(None),
     sprint_id: Optional[int] = Query(None),
     status: Optional[str] = Query(None),
     assigned_to: Optional[int] = Query(None),
-    db: Session = Depends(get_db)
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None),
+    sort: str = Query("id", pattern="^(id|created_at|updated_at|rank)$"),
+    order: str = Query("asc", pattern="^(asc|desc)$"),
+    db: Session = Depends(get_read_db)
 ):
-    query = db.query(Task)
-    if project_id:
-        query = query.filter(Task.project_id == project_id)
-    if sprint_id:
-        query = query.filter(Task.sprint_id == sprint_id)
-    if status:
-        query = query.filter(Task.status == status)
-    if assigned_to:
-        query = query.filter(Task.assigned_to == assigned_to)
+    # Plain column rows instead of ORM objects: no identity map, no per-row validation on the way out
+    query = db.query(*response_columns(TaskResponse, Task)).filter(
+        *task_filters(project_id, sprint_id, status, assigned_to)
+    )
+    
+    etag = make_etag(
+        "tasks", _task_list_version(db, project_id),
+        project_id, sprint_id, status, assigned_to, limit, after, sort, order
+    )
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
+    
+    tasks, next_cursor = paginate(
+        query, TASK_SORT_COLUMNS[sort], f"{sort}:{order}",
+        limit=limit, after=after, descending=order == "desc"
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return rows_response(tasks, headers=response.headers)
+
+@router.get("/tasks/changes", response_model=TaskChangesResponse)
+def get_task_changes(
+    project_id: int = Query(...),
+    since: Optional[str] = Query(None),
+    limit: int = Query(500, ge=1, le=1000),
+    db: Session = Depends(get_read_db)
+):
+    if not db.query(Project.id).filter(Project.id == project_id).first():
+        raise HTTPException(status_code=404, detail="Project not found")
+    
+    cursor_key = f"changes:{project_id}"
+    since_seq = decode_cursor(since, cursor_key, [Task.change_seq])[0] if since else 0
+    
+    tasks = db.query(Task).filter(
+        Task.project_id == project_id, Task.change_seq > since_seq
+    ).order_by(Task.change_seq).limit(limit + 1).all()
+    tombstones = db.query(TaskTombstone.task_id, TaskTombstone.change_seq).filter(
+        TaskTombstone.project_id == project_id, TaskTombstone.change_seq > since_seq
+    ).order_by(TaskTombstone.change_seq).limit(limit + 1).all()
     
-    tasks = query.all()
-    return tasks
+    # Merge both feeds by sequence and cut the page at `limit` changes
+    changes = sorted(
+        [(task.change_seq, task, None) for task in tasks] +
+        [(tombstone.change_seq, None, tombstone.task_id) for tombstone in tombstones],
+        key=lambda change: change[0]
+    )
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+    last_seq = changes[-1][0] if changes else since_seq
+    
+    return TaskChangesResponse(
+        cursor=encode_cursor(cursor_key, [last_seq]),
+        has_more=has_more,
+        tasks=[TaskResponse.model_validate(task) for _, task, _ in changes if task is not None],
+        deleted=[task_id for _, _, task_id in changes if task_id is not None],
+    )
 
 @router.get("/tasks/{task_id}", response_model=TaskResponse)
-def get_task(task_id: int, db: Session = Depends(get_db)):
+def get_task(task_id: int, request: Request, response: Response, db: Session = Depends(get_read_db)):
+    version = db.query(Task.updated_at).filter(Task.id == task_id).first()
+    if not version:
+        raise HTTPException(status_code=404, detail="Task not found")
+    not_modified = conditional_response(request, response, make_etag("task", task_id, version.updated_at))
+    if not_modified:
+        return not_modified
+    
     task = db.query(Task).filter(Task.id == task_id).first()
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     return task
 
+@router.get("/tasks/{task_id}/detail", response_model=TaskDetailResponse)
+def get_task_detail(
+    task_id: int,
+    comments_limit: int = Query(20, ge=1, le=100),
+    comments_after: Optional[str] = Query(None),
+    activity_limit: int = Query(20, ge=1, le=100),
+    activity_after: Optional[str] = Query(None),
+    db: Session = Depends(get_read_db)
+):
+    # Five queries regardless of size: task with its people, a page of comments, a page each of hot and
+    # archived activity, remaining users
+    task = db.query(Task).options(
+        joinedload(Task.assignee), joinedload(Task.creator)
+    ).filter(Task.id == task_id).first()
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    
+    comments, comments_cursor = paginate(
+        db.query(Comment).filter(Comment.task_id == task_id),
+        [Comment.created_at, Comment.id], "comments:created_at",
+        limit=comments_limit, after=comments_after
+    )
+    activity, activity_cursor = task_activity_page(db, task_id, limit=activity_limit, after=activity_after)
+    
+    users = {user.id: user for user in (task.assignee, task.creator) if user is not None}
+    missing = {row.user_id for row in comments + activity} - users.keys()
+    if missing:
+        users.update((user.id, user) for user in db.query(User).filter(User.id.in_(missing)).all())
+    
+    return TaskDetailResponse(
+        task=TaskResponse.model_validate(task),
+        comments=[CommentResponse.model_validate(comment) for comment in comments],
+        comments_cursor=comments_cursor,
+        activity=[ActivityLogResponse.model_validate(entry) for entry in activity],
+        activity_cursor=activity_cursor,
+        users=[UserSummary.model_validate(user) for _, user in sorted(users.items())],
+    )
+
 @router.post("/tasks", response_model=TaskResponse)
 def create_task(task: TaskCreate, db: Session = Depends(get_db)):
-    db_task = Task(**task.dict())
+    db_task = Task(**task.model_dump())
     db.add(db_task)
-    db.commit()
-    db.refresh(db_task)
+    db.flush()
     
-    activity = ActivityLog(
+    record_activity(
+        db,
         task_id=db_task.id,
         user_id=task.created_by,
         action="created"
     )
-    db.add(activity)
+    notify_task_change(
+        db, "task.created", db_task.project_id, db_task.id,
+        TaskResponse.model_validate(db_task).model_dump(mode="json")
+    )
     db.commit()
+    db.refresh(db_task)
+    invalidate_task_stats(db_task.project_id)
     
     return db_task
 
@@ -62,10 +202,11 @@ def update_task(task_id: int, task: TaskUpdate, db: Session = Depends(get_db)):
     if not db_task:
         raise HTTPException(status_code=404, detail="Task not found")
     
-    for key, value in task.dict(exclude_unset=True).items():
+    for key, value in task.model_dump(exclude_unset=True).items():
         old_value = getattr(db_task, key)
         if old_value != value:
-            activity = ActivityLog(
+            record_activity(
+                db,
                 task_id=task_id,
                 user_id=db_task.created_by,
                 action="updated",
@@ -73,11 +214,12 @@ def update_task(task_id: int, task: TaskUpdate, db: Session = Depends(get_db)):
                 old_value=str(old_value) if old_value else None,
                 new_value=str(value) if value else None
             )
-            db.add(activity)
         setattr(db_task, key, value)
     
+    notify_task_change(db, "task.updated", db_task.project_id, task_id, task.model_dump(mode="json", exclude_unset=True))
     db.commit()
     db.refresh(db_task)
+    invalidate_task_stats(db_task.project_id)
     return db_task
 
 @router.delete("/tasks/{task_id}")
@@ -86,8 +228,12 @@ def delete_task(task_id: int, db: Session = Depends(get_db)):
     if not db_task:
         raise HTTPException(status_code=404, detail="Task not found")
     
+    project_id = db_task.project_id
+    db.query(ActivityLogArchive).filter(ActivityLogArchive.task_id == task_id).delete(synchronize_session=False)
     db.delete(db_task)
+    notify_task_change(db, "task.deleted", project_id, task_id)
     db.commit()
+    invalidate_task_stats(project_id)
     return {"success": True}
 
 @router.put("/tasks/{task_id}/move", response_model=TaskResponse)
@@ -99,7 +245,8 @@ def move_task(task_id: int, move: TaskMove, db: Session = Depends(get_db)):
     if move.status:
         old_status = task.status
         task.status = move.status
-        activity = ActivityLog(
+        record_activity(
+            db,
             task_id=task_id,
             user_id=task.created_by,
             action="moved",
@@ -107,12 +254,12 @@ def move_task(task_id: int, move: TaskMove, db: Session = Depends(get_db)):
             old_value=old_status,
             new_value=move.status
         )
-        db.add(activity)
     
     if move.sprint_id is not None:
         old_sprint = task.sprint_id
         task.sprint_id = move.sprint_id
-        activity = ActivityLog(
+        record_activity(
+            db,
             task_id=task_id,
             user_id=task.created_by,
             action="moved",
@@ -120,10 +267,22 @@ def move_task(task_id: int, move: TaskMove, db: Session = Depends(get_db)):
             old_value=str(old_sprint) if old_sprint else None,
             new_value=str(move.sprint_id) if move.sprint_id else None
         )
-        db.add(activity)
     
+    if move.before_id is not None or move.after_id is not None:
+        try:
+            place_task(db, task, move.before_id, move.after_id)
+        except RankConflict as e:
+            db.rollback()
+            raise HTTPException(status_code=409, detail=str(e))
+    
+    db.flush()
+    notify_task_change(
+        db, "task.moved", task.project_id, task_id,
+        {**move.model_dump(exclude_none=True, exclude={"before_id", "after_id"}), "rank": task.rank}
+    )
     db.commit()
     db.refresh(task)
+    invalidate_task_stats(task.project_id)
     return task
 
 @router.put("/tasks/{task_id}/assign", response_model=TaskResponse)
@@ -135,7 +294,8 @@ def assign_task(task_id: int, assign: TaskAssign, db: Session = Depends(get_db))
     old_assignee = task.assigned_to
     task.assigned_to = assign.user_id
     
-    activity = ActivityLog(
+    record_activity(
+        db,
         task_id=task_id,
         user_id=task.created_by,
         action="assigned",
@@ -143,15 +303,28 @@ def assign_task(task_id: int, assign: TaskAssign, db: Session = Depends(get_db))
         old_value=str(old_assignee) if old_assignee else None,
         new_value=str(assign.user_id)
     )
-    db.add(activity)
     
+    notify_task_change(db, "task.assigned", task.project_id, task_id, {"assigned_to": assign.user_id})
     db.commit()
     db.refresh(task)
+    invalidate_task_stats(task.project_id)
     return task
 
 @router.get("/tasks/{task_id}/comments", response_model=List[CommentResponse])
-def get_task_comments(task_id: int, db: Session = Depends(get_db)):
-    comments = db.query(Comment).filter(Comment.task_id == task_id).all()
+def get_task_comments(
+    task_id: int,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None),
+    db: Session = Depends(get_read_db)
+):
+    comments, next_cursor = paginate(
+        db.query(Comment).filter(Comment.task_id == task_id),
+        [Comment.created_at, Comment.id], "comments:created_at",
+        limit=limit, after=after
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return comments
 
 @router.post("/tasks/{task_id}/comments", response_model=CommentResponse)
@@ -160,22 +333,29 @@ def add_task_comment(task_id: int, comment: CommentCreate, db: Session = Depends
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     
-    db_comment = Comment(**comment.dict())
+    db_comment = Comment(**comment.model_dump())
     db.add(db_comment)
-    db.commit()
-    db.refresh(db_comment)
     
-    activity = ActivityLog(
+    record_activity(
+        db,
         task_id=task_id,
         user_id=comment.user_id,
         action="commented"
     )
-    db.add(activity)
     db.commit()
+    db.refresh(db_comment)
     
     return db_comment
 
 @router.get("/tasks/{task_id}/activity", response_model=List[ActivityLogResponse])
-def get_task_activity(task_id: int, db: Session = Depends(get_db)):
-    activity = db.query(ActivityLog).filter(ActivityLog.task_id == task_id).all()
-    return activity
\ No newline at end of file
+def get_task_activity(
+    task_id: int,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None),
+    db: Session = Depends(get_read_db)
+):
+    activity, next_cursor = task_activity_page(db, task_id, limit=limit, after=after)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return activity
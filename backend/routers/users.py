@@ -1,20 +1,29 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from typing import List
+from core.cache import create_cache
 from models.database import get_db
 from models.user import User
 from schemas.user import UserCreate, UserResponse
 
 router = APIRouter()
 
+user_cache = create_cache("users")
+
+def _dump(user):
+    return UserResponse.model_validate(user).model_dump(mode="json")
+
 @router.get("/users", response_model=List[UserResponse])
 def get_users(db: Session = Depends(get_db)):
-    users = db.query(User).all()
-    return users
+    return user_cache.get_or_load("all", lambda: [_dump(user) for user in db.query(User).all()])
 
 @router.get("/users/{user_id}", response_model=UserResponse)
 def get_user(user_id: int, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.id == user_id).first()
+    def load():
+        user = db.query(User).filter(User.id == user_id).first()
+        return _dump(user) if user else None
+    
+    user = user_cache.get_or_load(user_id, load)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    return user
\ No newline at end of file
+    return user
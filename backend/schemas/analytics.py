@@ -0,0 +1,43 @@
+from pydantic import BaseModel
+from datetime import date, datetime
+from typing import List, Optional
+
+class BurndownDay(BaseModel):
+    day: date
+    total_points: int
+    done_points: int
+    remaining_points: int
+    total_tasks: int
+    done_tasks: int
+    scope_added_points: int
+    scope_removed_points: int
+    ideal_remaining_points: float
+
+class BurndownResponse(BaseModel):
+    sprint_id: int
+    start_date: datetime
+    end_date: datetime
+    days: List[BurndownDay]
+
+class SprintVelocity(BaseModel):
+    sprint_id: int
+    name: str
+    end_date: datetime
+    committed_points: int
+    completed_points: int
+
+class VelocityResponse(BaseModel):
+    project_id: int
+    sprints: List[SprintVelocity]
+    average_completed_points: Optional[float] = None
+
+class CycleTimeResponse(BaseModel):
+    project_id: int
+    sprint_id: Optional[int] = None
+    days: int
+    count: int
+    mean_hours: Optional[float] = None
+    p50_hours: Optional[float] = None
+    p75_hours: Optional[float] = None
+    p90_hours: Optional[float] = None
+    p95_hours: Optional[float] = None
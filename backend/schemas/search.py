@@ -0,0 +1,21 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from schemas.task import TaskResponse
+
+class CommentSnippet(BaseModel):
+    comment_id: int
+    snippet: str
+
+class SearchHit(BaseModel):
+    task: TaskResponse
+    score: float
+    title_highlight: str
+    snippet: Optional[str] = None
+    comments: List[CommentSnippet] = []
+
+class SearchResponse(BaseModel):
+    query: str
+    limit: int
+    offset: int
+    has_more: bool
+    hits: List[SearchHit]
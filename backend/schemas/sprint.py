@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 class SprintBase(BaseModel):
     project_id: int
@@ -20,9 +20,17 @@ class SprintUpdate(BaseModel):
     end_date: Optional[datetime] = None
     status: Optional[str] = None
 
+class SprintStats(BaseModel):
+    task_count: int = 0
+    done_count: int = 0
+    story_points: int = 0
+    done_story_points: int = 0
+    assignees: List[int] = []
+
 class SprintResponse(SprintBase):
     id: int
     created_at: datetime
+    stats: Optional[SprintStats] = None
 
     class Config:
         from_attributes = True
\ No newline at end of file
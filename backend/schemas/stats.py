@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+from typing import Dict, Optional
+
+class TaskStatsResponse(BaseModel):
+    project_id: Optional[int] = None
+    total: int
+    story_points: int
+    done_story_points: int
+    by_status: Dict[str, int]
+    by_type: Dict[str, int]
+    by_priority: Dict[str, int]
+    by_assignee: Dict[str, int]
+    story_points_by_status: Dict[str, int]
@@ -1,6 +1,11 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
+from schemas.activity_log import ActivityLogResponse
+from schemas.comment import CommentResponse
+from schemas.user import UserSummary
+
+BULK_MAX_ITEMS = 1000
 
 class TaskBase(BaseModel):
     project_id: int
@@ -31,6 +36,9 @@ class TaskUpdate(BaseModel):
 class TaskMove(BaseModel):
     status: Optional[str] = None
     sprint_id: Optional[int] = None
+    # Neighbours in the destination column: the task directly above and the one directly below
+    before_id: Optional[int] = None
+    after_id: Optional[int] = None
 
 class TaskAssign(BaseModel):
     user_id: int
@@ -40,6 +48,55 @@ class TaskResponse(TaskBase):
     created_by: int
     created_at: datetime
     updated_at: datetime
+    rank: Optional[str] = None
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class TaskBulkCreate(BaseModel):
+    tasks: List[TaskCreate] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+class TaskBulkMoveItem(TaskMove):
+    task_id: int
+
+class TaskBulkMove(BaseModel):
+    items: List[TaskBulkMoveItem] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+class TaskBulkAssignItem(TaskAssign):
+    task_id: int
+
+class TaskBulkAssign(BaseModel):
+    items: List[TaskBulkAssignItem] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+class TaskBulkUpdateItem(TaskUpdate):
+    task_id: int
+
+class TaskBulkUpdate(BaseModel):
+    items: List[TaskBulkUpdateItem] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+class TaskBulkResult(BaseModel):
+    index: int
+    task_id: Optional[int] = None
+    success: bool
+    error: Optional[str] = None
+    task: Optional[TaskResponse] = None
+
+class TaskBulkResponse(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[TaskBulkResult]
+
+
+class TaskChangesResponse(BaseModel):
+    cursor: str
+    has_more: bool
+    tasks: List[TaskResponse]
+    deleted: List[int]
+
+class TaskDetailResponse(BaseModel):
+    task: TaskResponse
+    comments: List[CommentResponse]
+    comments_cursor: Optional[str] = None
+    activity: List[ActivityLogResponse]
+    activity_cursor: Optional[str] = None
+    users: List[UserSummary]
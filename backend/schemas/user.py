@@ -16,4 +16,13 @@ class UserResponse(UserBase):
     created_at: datetime
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class UserSummary(BaseModel):
+    id: int
+    username: str
+    full_name: str
+    avatar_url: Optional[str] = None
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,73 @@
+import os
+
+# Tests build their own schema on SQLite; skip the MySQL database creation and demo seeding
+os.environ.setdefault("STARTUP_MODE", "production")
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+import main
+from core import search
+from core.cache import caches
+from models import database
+from models.database import Base
+from models.user import User
+
+@pytest.fixture
+def engine(tmp_path):
+    # A file rather than :memory:, so background threads get connections and transactions of their own
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'test.db'}", connect_args={"check_same_thread": False, "timeout": 30}
+    )
+    Base.metadata.create_all(bind=engine)
+    database.engine = engine
+    database.SessionLocal.configure(bind=engine)
+    yield engine
+    database.engine = None
+    engine.dispose()
+
+@pytest.fixture
+def client(engine):
+    for cache in caches.values():
+        cache.invalidate()
+    search.search_index = search.InvertedIndex()
+    with TestClient(main.app) as client:
+        yield client
+
+@pytest.fixture
+def db(engine):
+    session = database.SessionLocal()
+    yield session
+    session.close()
+
+@pytest.fixture
+def user(db):
+    user = User(username="alice", email="alice@example.com", full_name="Alice")
+    db.add(user)
+    db.commit()
+    return user.id
+
+@pytest.fixture
+def project(client, user):
+    response = client.post("/api/projects", json={"name": "Board", "key": "BRD", "owner_id": user})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+@pytest.fixture
+def make_task(client, project, user):
+    def make_task(**fields):
+        payload = {"project_id": project["id"], "title": "Task", "task_type": "task", "created_by": user, **fields}
+        response = client.post("/api/tasks", json=payload)
+        assert response.status_code == 200, response.text
+        return response.json()
+    return make_task
+
+@pytest.fixture
+def flush_activity():
+    # Activity rows reach the table through the background writer; stopping it drains the queue
+    from core.activity_log import activity_writer
+
+    def flush():
+        activity_writer.stop()
+        activity_writer.start()
+    return flush
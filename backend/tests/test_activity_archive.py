@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta
+from core.activity_log import archive_activity
+from models.activity_log import ActivityLog
+from models.activity_log_archive import ActivityLogArchive
+
+def _comment(client, task, user, content):
+    response = client.post(
+        f"/api/tasks/{task['id']}/comments", json={"task_id": task["id"], "user_id": user, "content": content}
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+def test_comments_page_oldest_first(client, make_task, user):
+    task = make_task()
+    ids = [_comment(client, task, user, f"Comment {i}")["id"] for i in range(3)]
+
+    first = client.get(f"/api/tasks/{task['id']}/comments", params={"limit": 2})
+    rest = client.get(f"/api/tasks/{task['id']}/comments", params={"after": first.headers["X-Next-Cursor"]})
+
+    assert [comment["id"] for comment in first.json()] == ids[:2]
+    assert [comment["id"] for comment in rest.json()] == ids[2:]
+    assert "X-Next-Cursor" not in rest.headers
+
+def test_activity_pages_across_hot_and_archived_rows(client, db, make_task, flush_activity):
+    task = make_task()
+    for title in ("B", "C", "D"):
+        client.put(f"/api/tasks/{task['id']}", json={"title": title})
+    flush_activity()
+    # Age the two oldest rows past the cutoff so they move to the archive
+    oldest = db.query(ActivityLog).filter(ActivityLog.task_id == task["id"]).order_by(ActivityLog.id).limit(2).all()
+    for days, row in zip((200, 100), oldest):
+        row.created_at = datetime.utcnow() - timedelta(days=days)
+    db.commit()
+
+    assert archive_activity(older_than_days=90, batch_size=1) == 2
+    assert db.query(ActivityLog).count() == 2
+    assert db.query(ActivityLogArchive).count() == 2
+
+    first = client.get(f"/api/tasks/{task['id']}/activity", params={"limit": 3})
+    rest = client.get(f"/api/tasks/{task['id']}/activity", params={"limit": 3, "after": first.headers["X-Next-Cursor"]})
+    entries = first.json() + rest.json()
+    assert [entry["new_value"] for entry in entries] == ["D", "C", "B", None]
+    assert entries[-1]["action"] == "created"
+    assert "X-Next-Cursor" not in rest.headers
+
+def test_deleting_a_task_removes_its_archived_activity(client, db, make_task, flush_activity):
+    task = make_task()
+    flush_activity()
+    db.query(ActivityLog).update({ActivityLog.created_at: datetime.utcnow() - timedelta(days=365)})
+    db.commit()
+    assert archive_activity(older_than_days=90) == 1
+
+    assert client.delete(f"/api/tasks/{task['id']}").status_code == 200
+    assert db.query(ActivityLogArchive).count() == 0
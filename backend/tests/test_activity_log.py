@@ -0,0 +1,94 @@
+import asyncio
+import threading
+import pytest
+from core import activity_log
+from core.activity_log import ActivityLogWriter, activity_row, record_activity
+from models.activity_log import ActivityLog
+
+def _rows(count):
+    return [activity_row(1, 1, "updated", "title", str(i), str(i + 1)) for i in range(count)]
+
+def _logged(db):
+    db.expire_all()
+    return db.query(ActivityLog).count()
+
+@pytest.fixture
+def writer(engine):
+    # One row per batch and one queue slot, so a held worker leaves the queue full after two rows
+    writer = ActivityLogWriter(batch_size=1, flush_interval=0.05, max_queue=1)
+    batches = []
+    write = writer.write
+    release, holding = threading.Event(), threading.Event()
+    release.set()
+
+    def recording_write(rows):
+        # Background writes can be held; inline writes from the submitting thread go straight through
+        name = threading.current_thread().name
+        if name != "MainThread":
+            holding.set()
+            release.wait(5)
+        batches.append((name, len(rows)))
+        write(rows)
+
+    def hold():
+        release.clear()
+        writer.start()
+        writer.submit(_rows(1))
+        holding.wait(5)
+
+    writer.write = recording_write
+    writer.batches, writer.release, writer.hold = batches, release, hold
+    yield writer
+    release.set()
+    writer.stop()
+
+def test_rows_are_written_in_batches(writer, db):
+    writer.batch_size = 2
+    writer.queue.maxsize = 10
+    writer.start()
+    writer.submit(_rows(5))
+    writer.stop()
+
+    assert sum(size for _, size in writer.batches) == 5
+    assert max(size for _, size in writer.batches) == 2
+    assert _logged(db) == 5
+
+def test_rows_are_queued_only_once_the_transaction_commits(db, monkeypatch):
+    submitted = []
+    monkeypatch.setattr(activity_log.activity_writer, "submit", submitted.append)
+
+    db.query(ActivityLog).count()
+    record_activity(db, 1, 1, "created")
+    db.rollback()
+    record_activity(db, 1, 1, "updated")
+    db.commit()
+
+    assert [[row["action"] for row in rows] for rows in submitted] == [["updated"]]
+
+def test_full_queue_writes_inline_off_the_event_loop(writer, db, monkeypatch):
+    monkeypatch.setattr(activity_log, "ACTIVITY_LOG_SUBMIT_TIMEOUT", 0.01)
+    writer.hold()
+
+    # The queue takes one row and the rest cannot wait for room
+    writer.submit(_rows(4))
+
+    assert writer.batches == [("MainThread", 3)]
+    writer.release.set()
+    writer.stop()
+    assert _logged(db) == 5
+
+def test_full_queue_on_the_event_loop_goes_to_the_bounded_overflow(writer, db, monkeypatch):
+    monkeypatch.setattr(activity_log, "ACTIVITY_LOG_OVERFLOW_MAX_ROWS", 3)
+    writer.hold()
+
+    async def handler():
+        writer.submit(_rows(3))
+        writer.submit(_rows(2))
+
+    asyncio.run(handler())
+    writer.release.set()
+    writer.stop()
+
+    assert writer.dropped == 2
+    assert [size for name, size in writer.batches if name.startswith("activity-log-overflow")] == [2]
+    assert _logged(db) == 4
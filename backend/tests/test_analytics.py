@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta
+import pytest
+from core.analytics import TOTAL_COLUMNS, _sprint_totals, backfill_analytics
+from models.sprint_snapshot import SprintSnapshot
+
+@pytest.fixture
+def sprints(client, project):
+    today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    return [
+        client.post("/api/sprints", json={
+            "project_id": project["id"], "name": f"Sprint {i}",
+            "start_date": (today - timedelta(days=3)).isoformat(), "end_date": (today + timedelta(days=7)).isoformat(),
+        }).json()["id"]
+        for i in range(2)
+    ]
+
+def _today(db, sprint_id):
+    db.expire_all()
+    return db.query(SprintSnapshot).filter(
+        SprintSnapshot.sprint_id == sprint_id, SprintSnapshot.day == datetime.utcnow().date()
+    ).one()
+
+def _assert_snapshots_match_tasks(db, sprint_ids):
+    totals = _sprint_totals(db, sprint_ids)
+    for sprint_id in sprint_ids:
+        snapshot = _today(db, sprint_id)
+        expected = totals.get(sprint_id, dict.fromkeys(TOTAL_COLUMNS, 0))
+        assert {column: getattr(snapshot, column) for column in TOTAL_COLUMNS} == expected
+
+def test_snapshot_deltas_track_every_kind_of_task_write(client, db, make_task, sprints):
+    first, second = sprints
+    tasks = [make_task(title=f"Task {i}", sprint_id=first, story_points=i + 1)["id"] for i in range(3)]
+    _assert_snapshots_match_tasks(db, [first])
+
+    client.put(f"/api/tasks/{tasks[0]}/move", json={"status": "done"})
+    client.put(f"/api/tasks/{tasks[0]}", json={"story_points": 10})
+    _assert_snapshots_match_tasks(db, [first])
+
+    client.put(f"/api/tasks/{tasks[0]}/move", json={"sprint_id": second})
+    client.put("/api/tasks/bulk/update", json={"items": [
+        {"task_id": tasks[1], "status": "done"}, {"task_id": tasks[2], "sprint_id": second},
+    ]})
+    _assert_snapshots_match_tasks(db, sprints)
+
+    client.delete(f"/api/tasks/{tasks[0]}")
+    client.post(f"/api/sprints/{second}/start")
+    _assert_snapshots_match_tasks(db, sprints)
+
+def test_scope_changes_accumulate_over_the_day(client, db, make_task, sprints):
+    first, second = sprints
+    task = make_task(sprint_id=first, story_points=5)["id"]
+
+    client.put(f"/api/tasks/{task}", json={"story_points": 8})
+    client.put(f"/api/tasks/{task}", json={"story_points": 6})
+    client.put(f"/api/tasks/{task}/move", json={"sprint_id": second})
+
+    snapshot = _today(db, first)
+    assert (snapshot.scope_added_points, snapshot.scope_removed_points) == (8, 8)
+    assert (_today(db, second).scope_added_points, _today(db, second).scope_removed_points) == (6, 0)
+
+def test_burndown_carries_snapshots_over_quiet_days(client, make_task, sprints):
+    make_task(sprint_id=sprints[0], story_points=3)
+
+    days = client.get(f"/api/sprints/{sprints[0]}/burndown").json()["days"]
+
+    assert len(days) == 4
+    assert days[-1]["remaining_points"] == 3
+
+def test_backfill_rebuilds_snapshots_from_history(client, db, make_task, sprints):
+    task = make_task(sprint_id=sprints[0], story_points=3)["id"]
+    client.put(f"/api/tasks/{task}/move", json={"status": "done"})
+    make_task(sprint_id=sprints[0], story_points=2)
+    db.query(SprintSnapshot).delete()
+    db.commit()
+
+    backfill_analytics()
+
+    _assert_snapshots_match_tasks(db, [sprints[0]])
+    assert db.query(SprintSnapshot).filter(SprintSnapshot.sprint_id == sprints[0]).count() == 4
@@ -0,0 +1,49 @@
+import inspect
+import pytest
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from core.async_routes import async_router
+from models import database
+from routers import projects, tasks
+
+@pytest.fixture
+def async_client(engine, monkeypatch):
+    # Same database file through the asyncio driver, standing in for aiomysql
+    async_engine = create_async_engine(engine.url.set(drivername="sqlite+aiosqlite"))
+    monkeypatch.setattr(
+        database, "AsyncSessionLocal", async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+    )
+    app = FastAPI()
+    for router in (projects.router, tasks.router):
+        app.include_router(async_router(router), prefix="/api")
+    with TestClient(app) as client:
+        yield client
+        client.portal.call(async_engine.dispose)
+
+def test_converted_handlers_are_coroutines_on_the_async_session():
+    routes = [route for route in async_router(tasks.router).routes if isinstance(route, APIRoute)]
+
+    assert routes and all(inspect.iscoroutinefunction(route.endpoint) for route in routes)
+    dependencies = {
+        (route.path, method): inspect.signature(route.endpoint).parameters["db"].default.dependency
+        for route in routes for method in route.methods
+    }
+    # Handlers on the read session keep reading from replicas
+    assert dependencies[("/tasks/{task_id}", "GET")] is database.get_async_read_db
+    assert dependencies[("/tasks/{task_id}", "PUT")] is database.get_async_db
+
+def test_async_routes_read_and_write_the_same_data(client, async_client, project, user):
+    payload = {"project_id": project["id"], "title": "Async", "task_type": "task", "created_by": user}
+
+    created = async_client.post("/api/tasks", json=payload)
+    assert created.status_code == 200, created.text
+    async_client.put(f"/api/tasks/{created.json()['id']}", json={"status": "done"})
+
+    listed = async_client.get("/api/tasks", params={"project_id": project["id"]}).json()
+    assert listed == client.get("/api/tasks", params={"project_id": project["id"]}).json()
+    assert [(task["title"], task["status"]) for task in listed] == [("Async", "done")]
+
+def test_async_routes_keep_handler_errors(async_client):
+    assert async_client.get("/api/tasks/999").status_code == 404
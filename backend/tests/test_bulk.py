@@ -0,0 +1,75 @@
+import pytest
+from sqlalchemy import event
+from routers import bulk
+
+@pytest.fixture
+def foreign_keys(engine):
+    event.listen(engine, "connect", lambda connection, record: connection.execute("PRAGMA foreign_keys=ON"))
+    engine.dispose()
+
+@pytest.fixture
+def stale_lookups(monkeypatch):
+    # As if the referenced rows were deleted between the existence check and the write
+    monkeypatch.setattr(bulk, "_existing_ids", lambda db, column, ids: {i for i in ids if i is not None})
+
+def _project_tasks(client, project):
+    return client.get("/api/tasks", params={"project_id": project["id"]}).json()
+
+def test_bulk_create_reports_each_item(client, project, user):
+    tasks = [
+        {"project_id": project["id"], "title": "One", "task_type": "task", "created_by": user},
+        {"project_id": 999, "title": "Two", "task_type": "task", "created_by": user},
+        {"project_id": project["id"], "title": "Three", "task_type": "bug", "created_by": user, "assigned_to": 999},
+    ]
+
+    body = client.post("/api/tasks/bulk", json={"tasks": tasks}).json()
+
+    assert (body["succeeded"], body["failed"]) == (1, 2)
+    assert [r["error"] for r in body["results"]] == [None, "Project not found", "User not found"]
+    assert body["results"][0]["task"]["title"] == "One"
+    assert [t["title"] for t in _project_tasks(client, project)] == ["One"]
+
+def test_bulk_move_and_update_apply_every_valid_item(client, make_task, flush_activity):
+    first, second = make_task(), make_task()
+
+    moved = client.put("/api/tasks/bulk/move", json={"items": [
+        {"task_id": first["id"], "status": "done"}, {"task_id": 999, "status": "done"},
+    ]}).json()
+    updated = client.put("/api/tasks/bulk/update", json={"items": [
+        {"task_id": second["id"], "title": "Renamed", "priority": "high"},
+    ]}).json()
+
+    assert [r["success"] for r in moved["results"]] == [True, False]
+    assert moved["results"][0]["task"]["status"] == "done"
+    assert (updated["results"][0]["task"]["title"], updated["results"][0]["task"]["priority"]) == ("Renamed", "high")
+    flush_activity()
+    actions = [a["field_changed"] for a in client.get(f"/api/tasks/{second['id']}/activity").json()]
+    assert sorted(a for a in actions if a) == ["priority", "title"]
+
+def test_bulk_create_rolls_back_on_integrity_error(client, project, user, foreign_keys, stale_lookups):
+    tasks = [
+        {"project_id": project["id"], "title": "Valid", "task_type": "task", "created_by": user},
+        {"project_id": project["id"], "title": "Gone sprint", "task_type": "task", "created_by": user, "sprint_id": 999},
+    ]
+
+    response = client.post("/api/tasks/bulk", json={"tasks": tasks})
+
+    assert response.status_code == 400
+    assert _project_tasks(client, project) == []
+
+@pytest.mark.parametrize("path,item", [
+    ("move", {"status": "done", "sprint_id": 999}),
+    ("update", {"title": "Renamed", "assigned_to": 999}),
+])
+def test_bulk_updates_roll_back_on_integrity_error(
+    client, project, make_task, foreign_keys, stale_lookups, flush_activity, path, item
+):
+    first, second = make_task(), make_task()
+    items = [{"task_id": first["id"], "status": "done"}, {"task_id": second["id"], **item}]
+
+    response = client.put(f"/api/tasks/bulk/{path}", json={"items": items})
+
+    assert response.status_code == 400
+    assert [(t["status"], t["title"]) for t in _project_tasks(client, project)] == [("todo", "Task"), ("todo", "Task")]
+    flush_activity()
+    assert [a["action"] for a in client.get(f"/api/tasks/{first['id']}/activity").json()] == ["created"]
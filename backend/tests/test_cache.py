@@ -0,0 +1,73 @@
+import asyncio
+import json
+from sqlalchemy.util.concurrency import greenlet_spawn
+from core import cache as cache_module
+from core.cache import RedisCache, TTLCache
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(ttl=60, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+    assert cache.evictions == 1
+
+def test_entries_expire_after_the_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = TTLCache(ttl=10)
+    cache.set("a", 1)
+
+    now[0] += 9
+    assert cache.get("a") == 1
+    now[0] += 2
+    assert cache.get("a") is None
+
+def test_a_load_that_raced_an_invalidation_is_not_stored():
+    cache = TTLCache(ttl=60)
+
+    def load():
+        cache.invalidate("a")
+        return "stale"
+
+    assert cache.get_or_load("a", load) == "stale"
+    assert cache.get("a") is None
+
+def test_reads_are_served_from_the_cache_until_a_write(client, project):
+    from routers.projects import project_cache
+
+    client.get(f"/api/projects/{project['id']}")
+    hits = project_cache.hits
+    assert client.get(f"/api/projects/{project['id']}").json()["name"] == "Board"
+    assert project_cache.hits == hits + 1
+
+    client.put(f"/api/projects/{project['id']}", json={"name": "Renamed"})
+
+    assert client.get(f"/api/projects/{project['id']}").json()["name"] == "Renamed"
+    assert client.get("/api/admin/cache").json()["projects"]["backend"] == "memory"
+
+class _Client:
+    def __init__(self, values):
+        self.values = values
+
+    def get(self, key):
+        return self.values.get(key)
+
+class _AsyncClient(_Client):
+    async def get(self, key):
+        await asyncio.sleep(0)
+        return self.values.get(key)
+
+def test_redis_cache_awaits_the_asyncio_client_inside_run_sync():
+    cache = RedisCache("redis://localhost:6379/0", "projects", ttl=60)
+    cache.redis = _Client({f"{cache.prefix}1": json.dumps("from the blocking client")})
+    cache._async_redis = _AsyncClient({f"{cache.prefix}1": json.dumps("from the asyncio client")})
+
+    async def handler():
+        # What AsyncSession.run_sync does with a DB_ASYNC handler body
+        return await greenlet_spawn(cache.get, 1)
+
+    assert asyncio.run(handler()) == "from the asyncio client"
+    assert cache.get(1) == "from the blocking client"
@@ -0,0 +1,61 @@
+def _changes(client, project_id, **params):
+    response = client.get("/api/tasks/changes", params={"project_id": project_id, **params})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+def test_changes_start_with_every_task(client, project, make_task):
+    ids = [make_task(title=f"Task {i}")["id"] for i in range(3)]
+
+    page = _changes(client, project["id"])
+
+    assert [task["id"] for task in page["tasks"]] == ids
+    assert page["deleted"] == []
+    assert page["has_more"] is False
+
+def test_changes_merge_updates_and_tombstones_after_the_cursor(client, project, make_task):
+    kept, deleted, untouched = (make_task(title=f"Task {i}")["id"] for i in range(3))
+    cursor = _changes(client, project["id"])["cursor"]
+
+    client.delete(f"/api/tasks/{deleted}")
+    client.put(f"/api/tasks/{kept}", json={"title": "Renamed"})
+    page = _changes(client, project["id"], since=cursor)
+
+    assert [task["id"] for task in page["tasks"]] == [kept]
+    assert page["tasks"][0]["title"] == "Renamed"
+    assert page["deleted"] == [deleted]
+    assert untouched not in page["deleted"]
+    assert _changes(client, project["id"], since=page["cursor"])["tasks"] == []
+
+def test_changes_pages_cut_across_both_feeds_in_sequence_order(client, project, make_task):
+    first, second = make_task()["id"], make_task()["id"]
+    cursor = _changes(client, project["id"])["cursor"]
+    client.delete(f"/api/tasks/{first}")
+    client.put(f"/api/tasks/{second}", json={"title": "Renamed"})
+
+    page = _changes(client, project["id"], since=cursor, limit=1)
+    assert page == {**page, "tasks": [], "deleted": [first], "has_more": True}
+
+    page = _changes(client, project["id"], since=page["cursor"], limit=1)
+    assert [task["id"] for task in page["tasks"]] == [second]
+    assert page["deleted"] == []
+    assert page["has_more"] is False
+
+def test_changes_reject_a_cursor_from_another_project(client, project, user, make_task):
+    make_task()
+    other = client.post("/api/projects", json={"name": "Other", "key": "OTH", "owner_id": user}).json()
+    cursor = _changes(client, project["id"])["cursor"]
+
+    response = client.get("/api/tasks/changes", params={"project_id": other["id"], "since": cursor})
+
+    assert response.status_code == 400
+
+def test_bulk_writes_advance_the_change_sequence(client, project, make_task, user):
+    task = make_task()["id"]
+    cursor = _changes(client, project["id"])["cursor"]
+
+    client.put("/api/tasks/bulk/move", json={"items": [{"task_id": task, "status": "done"}]})
+    created = client.post("/api/tasks/bulk", json={"tasks": [
+        {"project_id": project["id"], "title": "Bulk", "task_type": "task", "created_by": user},
+    ]}).json()["results"][0]["task_id"]
+
+    assert [t["id"] for t in _changes(client, project["id"], since=cursor)["tasks"]] == [task, created]
@@ -0,0 +1,52 @@
+import asyncio
+import json
+from core.events import RESYNC_MESSAGE, EventHub, LocalBroker, Subscriber
+
+def test_committed_task_changes_reach_the_project_socket(client, project, make_task):
+    task = make_task()
+
+    with client.websocket_connect(f"/api/ws/projects/{project['id']}") as socket:
+        client.put(f"/api/tasks/{task['id']}", json={"title": "Renamed"})
+        client.delete(f"/api/tasks/{task['id']}")
+
+        updated, deleted = socket.receive_json(), socket.receive_json()
+
+    assert (updated["type"], updated["task_id"], updated["fields"]) == ("task.updated", task["id"], {"title": "Renamed"})
+    assert (deleted["type"], deleted["task_id"]) == ("task.deleted", task["id"])
+
+def test_rolled_back_changes_are_not_published(db, monkeypatch):
+    from core import events
+
+    published = []
+    monkeypatch.setattr(events.event_hub, "publish", lambda project_id, payload: published.append(payload))
+    # Begin a transaction, as a handler's first query would
+    db.connection()
+
+    events.notify_task_change(db, "task.updated", 1, 1)
+    db.rollback()
+    events.notify_task_change(db, "task.deleted", 1, 2)
+    db.commit()
+
+    assert [payload["type"] for payload in published] == ["task.deleted"]
+
+def test_slow_subscriber_is_told_to_resync():
+    async def scenario():
+        subscriber = Subscriber(project_id=1, max_queue=2)
+        for i in range(3):
+            subscriber.offer(json.dumps({"seq": i}))
+        return subscriber.dropped, await subscriber.get(), subscriber.queue.empty()
+
+    assert asyncio.run(scenario()) == (2, RESYNC_MESSAGE, True)
+
+def test_hub_delivers_only_to_the_project_subscribers():
+    async def scenario():
+        hub = EventHub(LocalBroker(), max_queue=10)
+        await hub.start()
+        with hub.subscribe(1) as board, hub.subscribe(2) as other:
+            hub.publish(1, {"type": "task.created", "task_id": 7})
+            message = await asyncio.wait_for(board.get(), 1)
+            empty = other.queue.empty()
+        await hub.stop()
+        return json.loads(message), empty, hub.subscribers
+
+    assert asyncio.run(scenario()) == ({"type": "task.created", "task_id": 7}, True, {})
@@ -0,0 +1,84 @@
+import csv
+import io
+import orjson
+from core import importer
+
+def _import(client, project_id, body, content_type, **params):
+    response = client.post(
+        f"/api/projects/{project_id}/import", params=params, content=body, headers={"Content-Type": content_type}
+    )
+    assert response.status_code == 200, response.text
+    return [orjson.loads(line) for line in response.content.splitlines()]
+
+def test_ndjson_import_reports_progress_and_row_errors(client, project):
+    records = [
+        {"title": "First", "task_type": "task", "creator": "alice", "story_points": 3},
+        {"title": "Second", "task_type": "bug", "creator": "alice@example.com", "status": "done"},
+        {"title": "Orphan", "task_type": "task", "creator": "nobody"},
+        {"title": "Third", "task_type": "task", "creator": "alice"},
+    ]
+    body = b"".join(orjson.dumps(record) + b"\n" for record in records)
+
+    lines = _import(client, project["id"], body, "application/x-ndjson", batch_size=2)
+
+    summary = lines[-1]
+    assert summary["type"] == "summary"
+    assert summary == {**summary, "processed": 4, "imported": 3, "failed": 1}
+    assert summary["errors"][0]["row"] == 3
+    assert any(line["type"] == "progress" for line in lines[:-1])
+    tasks = client.get("/api/tasks", params={"project_id": project["id"]}).json()
+    assert [task["title"] for task in tasks] == ["First", "Second", "Third"]
+    assert [task["status"] for task in tasks] == ["todo", "done", "todo"]
+
+def test_csv_import_with_default_creator(client, project):
+    body = b"title,task_type,priority\nAlpha,task,high\nBeta,story,low\n"
+
+    summary = _import(client, project["id"], body, "text/csv", created_by="alice")[-1]
+
+    assert summary == {**summary, "imported": 2, "failed": 0}
+
+def test_import_into_missing_project_is_404(client, user):
+    response = client.post("/api/projects/999/import", params={"format": "json"}, content=b"[]")
+    assert response.status_code == 404
+
+def test_import_without_returning_assigns_ids_per_row(client, engine, project, monkeypatch):
+    # A dialect without RETURNING that isn't a suitably configured MySQL falls back to per-row ids
+    monkeypatch.setattr(engine.dialect, "insert_returning", False)
+    monkeypatch.setattr(engine.dialect, "insert_executemany_returning", False)
+    records = [{"title": f"Task {i}", "task_type": "task", "creator": "alice"} for i in range(3)]
+
+    summary = _import(client, project["id"], orjson.dumps(records), "application/json")[-1]
+
+    assert summary == {**summary, "imported": 3, "failed": 0}
+    assert importer._consecutive_ids[engine] is False
+    tasks = client.get("/api/tasks", params={"project_id": project["id"]}).json()
+    assert [task["title"] for task in tasks] == [record["title"] for record in records]
+
+def test_export_round_trips_imported_tasks(client, project):
+    records = [{"title": f"Task {i}", "task_type": "task", "creator": "alice"} for i in range(5)]
+    _import(client, project["id"], orjson.dumps(records), "application/json")
+
+    response = client.get("/api/export/tasks", params={"project_id": project["id"]})
+
+    assert response.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["title"] for row in rows] == [record["title"] for record in records]
+
+def test_csv_export_of_tasks(client, project, make_task):
+    titles = [make_task(title=f"Task {i}")["title"] for i in range(5)]
+
+    response = client.get("/api/export/tasks", params={"project_id": project["id"]})
+
+    assert response.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["title"] for row in rows] == titles
+
+def test_ndjson_export_of_activity(client, make_task, flush_activity):
+    task = make_task()
+    client.put(f"/api/tasks/{task['id']}/move", json={"status": "done"})
+    flush_activity()
+
+    response = client.get("/api/export/activity", params={"task_id": task["id"], "format": "ndjson"})
+
+    actions = [orjson.loads(line)["action"] for line in response.content.splitlines()]
+    assert actions == ["created", "moved"]
@@ -0,0 +1,34 @@
+import logging
+import re
+import pytest
+from core import instrumentation
+from core.instrumentation import instrument_engine
+
+@pytest.fixture
+def instrumented(engine):
+    instrument_engine(engine)
+    return engine
+
+def test_server_timing_reports_queries(instrumented, client, project, make_task):
+    make_task(title="One")
+    response = client.get("/api/tasks", params={"project_id": project["id"]})
+    assert response.status_code == 200
+    timing = response.headers["server-timing"]
+    match = re.match(r'db;dur=([\d.]+);desc="(\d+) queries", app;dur=([\d.]+)$', timing)
+    assert match is not None
+    assert int(match.group(2)) > 0
+    assert float(match.group(1)) <= float(match.group(3))
+
+def test_metrics_expose_route_histograms(instrumented, client, project):
+    client.get("/api/tasks", params={"project_id": project["id"]})
+    body = client.get("/api/admin/metrics").text
+    assert "# TYPE http_request_duration_seconds histogram" in body
+    assert 'route="/api/tasks"' in body
+    assert "http_request_db_queries_bucket" in body
+
+def test_slow_queries_are_logged(instrumented, client, project, monkeypatch, caplog):
+    monkeypatch.setattr(instrumentation, "SLOW_QUERY_THRESHOLD_MS", 0.000001)
+    with caplog.at_level(logging.WARNING, logger="core.instrumentation"):
+        client.get("/api/tasks", params={"project_id": project["id"]})
+    slow = [record.getMessage() for record in caplog.records if record.name == "core.instrumentation"]
+    assert any("Slow query" in message and "/api/tasks" in message for message in slow)
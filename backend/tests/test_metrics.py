@@ -0,0 +1,36 @@
+import pytest
+from sqlalchemy import create_engine, exc
+from core.metrics import Histogram, InstrumentedQueuePool, pool_stats
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+
+    assert snapshot["buckets"] == [(0.1, 2), (1.0, 3), ("+Inf", 4)]
+    assert snapshot["count"] == 4
+    assert snapshot["sum"] == pytest.approx(3.65)
+
+def test_instrumented_pool_records_waits_and_timeouts(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}", poolclass=InstrumentedQueuePool,
+        pool_size=1, max_overflow=0, pool_timeout=0.05,
+    )
+    held = engine.connect()
+    with pytest.raises(exc.TimeoutError):
+        engine.connect()
+
+    stats = pool_stats(engine.pool)
+
+    assert (stats["size"], stats["checked_out"], stats["timeouts"]) == (1, 1, 1)
+    assert stats["wait_seconds"]["count"] == 2
+    held.close()
+    engine.dispose()
+
+def test_admin_pool_reports_the_sync_pool(client):
+    pools = client.get("/api/admin/pool").json()
+
+    assert pools["sync"]["pool_class"] == "QueuePool"
+    assert "async" not in pools
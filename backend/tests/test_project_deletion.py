@@ -0,0 +1,66 @@
+import time
+from models.comment import Comment
+from models.project import Project
+from models.sprint import Sprint
+from models.task import Task
+from models.task_tombstone import TaskTombstone
+from routers import projects
+
+def _wait_for_job(client, project_id, timeout=10):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = client.get(f"/api/projects/{project_id}/deletion").json()
+        if job["status"] != "running":
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"Deletion of project {project_id} did not finish")
+
+def _fill(client, project, make_task, user, count):
+    sprint = client.post("/api/sprints", json={
+        "project_id": project["id"], "name": "Sprint 1",
+        "start_date": "2026-10-01T00:00:00", "end_date": "2026-10-14T00:00:00",
+    }).json()
+    for i in range(count):
+        task = make_task(title=f"Task {i}", sprint_id=sprint["id"], story_points=1)
+        response = client.post(
+            f"/api/tasks/{task['id']}/comments", json={"task_id": task["id"], "content": "Looks good", "user_id": user},
+        )
+        assert response.status_code == 200, response.text
+    client.delete(f"/api/tasks/{task['id']}")
+
+def _remaining(db, project_id):
+    db.expire_all()
+    counts = {
+        model.__name__: db.query(model).filter(model.project_id == project_id).count()
+        for model in (Sprint, Task, TaskTombstone)
+    }
+    counts["Project"] = db.query(Project).filter(Project.id == project_id).count()
+    counts["Comment"] = db.query(Comment).count()
+    return counts
+
+def test_small_project_is_deleted_inline(client, db, project, make_task, user):
+    _fill(client, project, make_task, user, 3)
+
+    response = client.delete(f"/api/projects/{project['id']}")
+
+    assert response.status_code == 200
+    assert response.json() == {"success": True}
+    assert _remaining(db, project["id"]) == dict.fromkeys(["Sprint", "Task", "TaskTombstone", "Project", "Comment"], 0)
+    assert client.get(f"/api/projects/{project['id']}").status_code == 404
+
+def test_large_project_is_deleted_by_a_background_job(client, db, project, make_task, user, monkeypatch):
+    monkeypatch.setattr(projects, "PROJECT_DELETE_INLINE_MAX_TASKS", 2)
+    monkeypatch.setattr("core.project_deletion.PROJECT_DELETE_BATCH_SIZE", 2)
+    _fill(client, project, make_task, user, 6)
+
+    response = client.delete(f"/api/projects/{project['id']}")
+
+    assert response.status_code == 202
+    assert response.json()["job"] == {**response.json()["job"], "status": "running", "total_tasks": 5}
+    job = _wait_for_job(client, project["id"])
+    assert job == {**job, "status": "completed", "deleted_tasks": 5, "error": None}
+    assert _remaining(db, project["id"]) == dict.fromkeys(["Sprint", "Task", "TaskTombstone", "Project", "Comment"], 0)
+    assert client.get(f"/api/projects/{project['id']}").status_code == 404
+
+def test_deletion_status_of_unknown_project_is_404(client):
+    assert client.get("/api/projects/999/deletion").status_code == 404
@@ -0,0 +1,95 @@
+import pytest
+from core.ranking import RankConflict, rank_after, rank_between, rebalance_column, spaced_ranks
+
+def test_rank_between_sorts_strictly_inside():
+    assert "a" < rank_between("a", "b") < "b"
+    assert "a" < rank_between("a", "a1") < "a1"
+    assert rank_between(None, "0001") < "0001"
+    assert rank_between("zz", None) > "zz"
+
+def test_rank_between_rejects_reversed_bounds():
+    with pytest.raises(RankConflict):
+        rank_between("b", "a")
+
+def test_repeated_appends_keep_their_width():
+    rank = spaced_ranks(1)[0]
+    for _ in range(500):
+        following = rank_after(rank)
+        assert following > rank
+        assert len(following) <= 6
+        rank = following
+
+def test_spaced_ranks_ascend():
+    ranks = spaced_ranks(1000)
+    assert ranks == sorted(set(ranks))
+
+def _column(client, project_id, status="todo"):
+    params = {"project_id": project_id, "status": status, "sort": "rank"}
+    return [task["id"] for task in client.get("/api/tasks", params=params).json()]
+
+@pytest.fixture
+def column(client, project, make_task):
+    return [make_task(title=f"Task {i}")["id"] for i in range(5)]
+
+def test_move_between_two_tasks(client, project, column):
+    a, b, c, d, e = column
+
+    response = client.put(f"/api/tasks/{e}/move", json={"before_id": a, "after_id": b})
+
+    assert response.status_code == 200, response.text
+    assert _column(client, project["id"]) == [a, e, b, c, d]
+
+def test_before_id_alone_places_directly_below_that_task(client, project, column):
+    a, b, c, d, e = column
+
+    client.put(f"/api/tasks/{e}/move", json={"before_id": a})
+
+    assert _column(client, project["id"]) == [a, e, b, c, d]
+
+def test_after_id_alone_places_directly_above_that_task(client, project, column):
+    a, b, c, d, e = column
+
+    client.put(f"/api/tasks/{a}/move", json={"after_id": e})
+
+    assert _column(client, project["id"]) == [b, c, d, a, e]
+
+def test_one_sided_moves_reach_the_ends_of_the_column(client, project, column):
+    a, b, c, d, e = column
+
+    client.put(f"/api/tasks/{a}/move", json={"before_id": e})
+    client.put(f"/api/tasks/{d}/move", json={"after_id": b})
+
+    assert _column(client, project["id"]) == [d, b, c, e, a]
+
+def test_move_into_another_column_next_to_a_task(client, project, column):
+    a, b, c, d, e = column
+    client.put(f"/api/tasks/{a}/move", json={"status": "in_progress"})
+    client.put(f"/api/tasks/{b}/move", json={"status": "in_progress"})
+
+    client.put(f"/api/tasks/{c}/move", json={"status": "in_progress", "after_id": b})
+
+    assert _column(client, project["id"], "in_progress") == [a, c, b]
+    assert _column(client, project["id"]) == [d, e]
+
+def test_neighbour_from_another_column_is_a_conflict(client, column):
+    a, b, c, d, e = column
+    client.put(f"/api/tasks/{a}/move", json={"status": "done"})
+
+    assert client.put(f"/api/tasks/{b}/move", json={"before_id": a}).status_code == 409
+    assert client.put(f"/api/tasks/{b}/move", json={"before_id": b}).status_code == 409
+
+def test_rebalance_keeps_order_and_changes_the_list_etag(client, db, project, column):
+    for _ in range(20):
+        client.put(f"/api/tasks/{column[-1]}/move", json={"before_id": column[0], "after_id": column[1]})
+        column.insert(1, column.pop())
+    params = {"project_id": project["id"]}
+    etag = client.get("/api/tasks", params=params).headers["etag"]
+    cursor = client.get("/api/tasks/changes", params=params).json()["cursor"]
+
+    assert rebalance_column(db, project["id"], "todo") == 5
+    db.commit()
+
+    assert _column(client, project["id"]) == column
+    assert client.get("/api/tasks", params=params, headers={"If-None-Match": etag}).status_code == 200
+    changed = client.get("/api/tasks/changes", params={**params, "since": cursor}).json()["tasks"]
+    assert sorted(task["id"] for task in changed) == sorted(column)
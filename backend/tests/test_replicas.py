@@ -0,0 +1,73 @@
+import time
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, insert
+from core.replicas import READ_PRIMARY_COOKIE, ReadYourWritesMiddleware, replica_monitor
+from models import database
+from models.database import Base
+from models.task import Task
+
+@pytest.fixture
+def replica(tmp_path, monkeypatch, client):
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=replica)
+    monkeypatch.setattr(database, "MYSQL_REPLICAS", [("replica", 3306)])
+    monkeypatch.setattr(database, "replica_engines", [replica])
+    monkeypatch.setattr(replica_monitor, "engines", [replica])
+    monkeypatch.setattr(replica_monitor, "status", [{"url": "replica", "healthy": False, "lag_seconds": None, "error": None}])
+    monkeypatch.setattr(replica_monitor, "healthy", [])
+    yield replica
+    replica.dispose()
+
+def _add_task(bind, title):
+    # Core insert, so the replica needs no project row for change tracking
+    with bind.begin() as conn:
+        return conn.execute(
+            insert(Task).values(project_id=1, title=title, task_type="task", created_by=1, rank="m")
+        ).inserted_primary_key[0]
+
+def test_reads_go_to_a_healthy_replica(client, engine, replica):
+    task_id = _add_task(engine, "Primary")
+    assert _add_task(replica, "Replica") == task_id
+
+    assert client.get(f"/api/tasks/{task_id}").json()["title"] == "Primary"
+    replica_monitor.check(0)
+    assert replica_monitor.stats()[0]["healthy"]
+    assert client.get(f"/api/tasks/{task_id}").json()["title"] == "Replica"
+
+def test_clients_that_wrote_read_from_the_primary(client, engine, replica):
+    task_id = _add_task(engine, "Primary")
+    _add_task(replica, "Replica")
+    replica_monitor.check(0)
+
+    client.cookies.set(READ_PRIMARY_COOKIE, str(time.time() + 60))
+
+    assert client.get(f"/api/tasks/{task_id}").json()["title"] == "Primary"
+
+def test_successful_writes_set_the_read_primary_cookie():
+    app = FastAPI()
+    app.add_middleware(ReadYourWritesMiddleware)
+
+    @app.api_route("/write/{status}", methods=["GET", "POST"])
+    def write(status: int):
+        return JSONResponse({}, status_code=status)
+
+    with TestClient(app) as client:
+        assert READ_PRIMARY_COOKIE in client.post("/write/200").cookies
+        assert READ_PRIMARY_COOKIE not in client.post("/write/404").cookies
+        assert READ_PRIMARY_COOKIE not in client.get("/write/200").cookies
+
+def test_unreachable_replica_falls_back_to_the_primary(client, engine, tmp_path, monkeypatch):
+    broken = create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+    monkeypatch.setattr(database, "MYSQL_REPLICAS", [("replica", 3306)])
+    monkeypatch.setattr(database, "replica_engines", [broken])
+    monkeypatch.setattr(replica_monitor, "engines", [broken])
+    monkeypatch.setattr(replica_monitor, "status", [{"url": "replica", "healthy": True, "lag_seconds": None, "error": None}])
+    monkeypatch.setattr(replica_monitor, "healthy", [0])
+    task_id = _add_task(engine, "Primary")
+
+    assert client.get(f"/api/tasks/{task_id}").json()["title"] == "Primary"
+    status = replica_monitor.stats()[0]
+    assert not status["healthy"] and status["error"]
@@ -0,0 +1,91 @@
+from core import search
+from core.search import InvertedIndex, highlight
+
+def _search(client, q, **params):
+    response = client.get("/api/search", params={"q": q, **params})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+def _comment(client, task, user, content):
+    response = client.post(
+        f"/api/tasks/{task['id']}/comments", json={"task_id": task["id"], "user_id": user, "content": content}
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+def test_index_is_built_at_startup(client):
+    assert search.search_index.ready.wait(5)
+    assert search.search_index.state == "ready"
+
+def test_title_matches_outrank_description_and_comment_matches(client, project, make_task, user):
+    in_comment = make_task(title="Unrelated")
+    _comment(client, in_comment, user, "the deploy script fails")
+    in_description = make_task(title="Pipeline", description="Deployment checklist")
+    in_title = make_task(title="Deploy to staging")
+
+    hits = _search(client, "deploy", project_id=project["id"])["hits"]
+
+    assert [hit["task"]["id"] for hit in hits] == [in_title["id"], in_description["id"], in_comment["id"]]
+
+def test_every_term_must_match(client, project, make_task):
+    both = make_task(title="Login page crash")
+    make_task(title="Login page copy")
+
+    hits = _search(client, "login crash", project_id=project["id"])["hits"]
+
+    assert [hit["task"]["id"] for hit in hits] == [both["id"]]
+
+def test_hits_are_highlighted_and_escaped(client, project, make_task):
+    make_task(title="Fix <b>search</b> ranking", description="Searching " + "padding " * 40 + "end")
+
+    hit = _search(client, "search", project_id=project["id"])["hits"][0]
+
+    assert hit["title_highlight"] == "Fix &lt;b&gt;<mark>search</mark>&lt;/b&gt; ranking"
+    assert hit["snippet"].startswith("<mark>Searching</mark> padding")
+    assert hit["snippet"].endswith("…")
+
+def test_comment_hits_are_highlighted_like_task_hits(client, project, make_task, user):
+    task = make_task(title="Unrelated")
+    _comment(client, task, user, "nothing to see")
+    comment = _comment(client, task, user, "Flaky <test> on CI")
+
+    hit = _search(client, "flaky", project_id=project["id"])["hits"][0]
+
+    assert hit["snippet"] is None
+    assert hit["comments"] == [{"comment_id": comment["id"], "snippet": "<mark>Flaky</mark> &lt;test&gt; on CI"}]
+
+def test_index_follows_updates_and_deletes(client, project, make_task):
+    renamed, deleted = make_task(title="Old name"), make_task(title="Old task")
+
+    client.put(f"/api/tasks/{renamed['id']}", json={"title": "New name"})
+    client.delete(f"/api/tasks/{deleted['id']}")
+
+    assert _search(client, "old", project_id=project["id"])["hits"] == []
+    assert [hit["task"]["id"] for hit in _search(client, "new")["hits"]] == [renamed["id"]]
+
+def test_writes_during_a_build_are_replayed_after_it(db, project, make_task):
+    task = make_task(title="Original")
+    index = InvertedIndex()
+    execute = db.execute
+
+    def execute_with_concurrent_write(*args, **kwargs):
+        # Another session commits a rename while the build is reading the tables
+        index.apply(("task", task["id"], project["id"], {"title": "Renamed"}))
+        return execute(*args, **kwargs)
+
+    db.execute = execute_with_concurrent_write
+    index.build(db)
+
+    assert index.state == "ready"
+    assert index.search(["original"]) == []
+    assert [task_id for task_id, _ in index.search(["renamed"])] == [task["id"]]
+
+def test_highlight_matches_term_prefixes_only():
+    assert highlight("reindex the index", ["index"]) == "reindex the <mark>index</mark>"
+
+def test_search_can_be_turned_off(client, monkeypatch):
+    monkeypatch.setattr(search, "SEARCH_BACKEND", "off")
+
+    response = client.get("/api/search", params={"q": "anything"})
+
+    assert response.status_code == 503
@@ -0,0 +1,9 @@
+def test_row_encoded_list_matches_the_validated_detail(client, project, make_task, user):
+    make_task(description="With <html> & unicode ✓", story_points=3, assigned_to=user, due_date="2026-03-01T12:30:00")
+    make_task()
+
+    listed = client.get("/api/tasks", params={"project_id": project["id"]})
+
+    assert listed.headers["content-type"] == "application/json"
+    for task in listed.json():
+        assert task == client.get(f"/api/tasks/{task['id']}").json()
@@ -0,0 +1,47 @@
+import pytest
+
+@pytest.fixture
+def make_sprint(client, project):
+    def make_sprint(name):
+        payload = {
+            "project_id": project["id"], "name": name,
+            "start_date": "2026-01-05T00:00:00", "end_date": "2026-01-19T00:00:00",
+        }
+        response = client.post("/api/sprints", json=payload)
+        assert response.status_code == 200, response.text
+        return response.json()
+    return make_sprint
+
+def test_sprint_list_includes_batched_stats(client, project, make_task, make_sprint, user, db):
+    from models.user import User
+
+    other = User(username="carol", email="carol@example.com", full_name="Carol")
+    db.add(other)
+    db.commit()
+    first, second, empty = make_sprint("Sprint 1"), make_sprint("Sprint 2"), make_sprint("Sprint 3")
+    make_task(sprint_id=first["id"], status="done", story_points=3, assigned_to=user)
+    make_task(sprint_id=first["id"], status="todo", story_points=5, assigned_to=other.id)
+    make_task(sprint_id=first["id"], status="todo", assigned_to=user)
+    make_task(sprint_id=second["id"], status="done", story_points=2)
+    make_task(story_points=8)
+
+    response = client.get("/api/sprints", params={"project_id": project["id"], "include": "stats"})
+
+    stats = {sprint["id"]: sprint["stats"] for sprint in response.json()}
+    assert stats[first["id"]] == {
+        "task_count": 3, "done_count": 1, "story_points": 8, "done_story_points": 3,
+        "assignees": sorted([user, other.id]),
+    }
+    assert stats[second["id"]] == {
+        "task_count": 1, "done_count": 1, "story_points": 2, "done_story_points": 2, "assignees": [],
+    }
+    assert stats[empty["id"]] == {
+        "task_count": 0, "done_count": 0, "story_points": 0, "done_story_points": 0, "assignees": [],
+    }
+
+def test_sprint_list_omits_stats_unless_asked(client, project, make_sprint):
+    make_sprint("Sprint 1")
+
+    sprints = client.get("/api/sprints", params={"project_id": project["id"]}).json()
+
+    assert [sprint["stats"] for sprint in sprints] == [None]
@@ -0,0 +1,66 @@
+import runpy
+import sys
+import main
+from core import search
+from core.seed import seed_demo_data
+from models.database import Base
+from models.project import Project
+from models.task import Task
+from models.user import User
+
+def test_ready_once_startup_finished_and_the_database_answers(client):
+    body = client.get("/ready").json()
+
+    assert body["ready"] is True
+    assert body["startup_seconds"] >= 0
+
+def test_ready_reports_an_unreachable_database(client, monkeypatch):
+    def unavailable():
+        raise ConnectionError("no route to host")
+    monkeypatch.setattr(main.database, "get_engine", unavailable)
+
+    response = client.get("/ready")
+
+    assert response.status_code == 503
+    assert response.json()["reason"] == "database unavailable"
+    assert client.get("/").status_code == 200
+
+def test_production_startup_leaves_the_database_alone(client, db):
+    assert db.query(User).count() == 0
+
+def test_seed_only_fills_an_empty_database(db):
+    assert seed_demo_data(db) is True
+    assert seed_demo_data(db) is False
+
+    assert (db.query(User).count(), db.query(Project).count(), db.query(Task).count()) == (3, 1, 7)
+
+def test_seed_command(engine, monkeypatch):
+    import manage
+
+    monkeypatch.setattr(sys, "argv", ["manage.py", "seed"])
+    manage.main()
+    manage.main()
+
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("SELECT COUNT(*) FROM users").scalar() == 3
+
+def test_prepare_before_fork_seeds_once(engine, db, monkeypatch):
+    Base.metadata.drop_all(bind=engine)
+    monkeypatch.setattr(main, "STARTUP_MODE", "development")
+    monkeypatch.setattr(main.database, "ensure_database_exists", lambda: None)
+    monkeypatch.setitem(main.startup_state, "prepared", False)
+
+    main.prepare_before_fork()
+    main.prepare_before_fork()
+
+    assert main.startup_state["prepared"] is True
+    assert db.query(User).count() == 3
+
+def test_multiple_workers_need_a_shareable_search(engine, monkeypatch):
+    config = runpy.run_path("gunicorn.conf.py")
+
+    monkeypatch.setattr(search, "SEARCH_BACKEND", "auto")
+    # SQLite has no FULLTEXT, so every worker would build its own index
+    assert config["_in_process_search"]() is True
+    monkeypatch.setattr(search, "SEARCH_BACKEND", "off")
+    assert config["_in_process_search"]() is False
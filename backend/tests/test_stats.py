@@ -0,0 +1,38 @@
+def test_project_stats_count_each_breakdown(client, project, make_task, user):
+    make_task(status="done", story_points=3, assigned_to=user)
+    make_task(status="done", story_points=2, task_type="bug", priority="high")
+    make_task(status="todo", story_points=5, assigned_to=user)
+
+    stats = client.get(f"/api/projects/{project['id']}/stats").json()
+
+    assert stats["total"] == 3
+    assert stats["story_points"] == 10
+    assert stats["done_story_points"] == 5
+    assert stats["by_status"] == {"done": 2, "todo": 1}
+    assert stats["by_type"] == {"task": 2, "bug": 1}
+    assert stats["by_priority"] == {"medium": 2, "high": 1}
+    assert stats["by_assignee"] == {str(user): 2, "unassigned": 1}
+    assert stats["story_points_by_status"] == {"done": 5, "todo": 5}
+
+def test_task_writes_invalidate_cached_stats(client, project, make_task):
+    task = make_task(status="todo")
+    assert client.get(f"/api/projects/{project['id']}/stats").json()["by_status"] == {"todo": 1}
+
+    client.put(f"/api/tasks/{task['id']}", json={"status": "done"})
+
+    assert client.get(f"/api/projects/{project['id']}/stats").json()["by_status"] == {"done": 1}
+
+def test_all_project_stats_match_the_per_project_endpoint(client, project, make_task, user):
+    other = client.post("/api/projects", json={"name": "Other", "key": "OTH", "owner_id": user}).json()
+    make_task(story_points=1)
+    make_task(project_id=other["id"], status="done", story_points=4)
+
+    by_project = {stats["project_id"]: stats for stats in client.get("/api/stats/projects").json()}
+
+    for project_id in (project["id"], other["id"]):
+        assert by_project[project_id] == client.get(f"/api/projects/{project_id}/stats").json()
+    overall = client.get("/api/stats").json()
+    assert overall["total"] == sum(stats["total"] for stats in by_project.values())
+
+def test_stats_for_a_missing_project_is_404(client):
+    assert client.get("/api/projects/999/stats").status_code == 404
@@ -0,0 +1,50 @@
+from sqlalchemy import event
+from models.user import User
+
+def _comment(client, task, user, content):
+    response = client.post(
+        f"/api/tasks/{task['id']}/comments", json={"task_id": task["id"], "user_id": user, "content": content}
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+def test_detail_bundles_pages_and_referenced_users(client, db, make_task, user, flush_activity):
+    commenter = User(username="carol", email="carol@example.com", full_name="Carol")
+    db.add(commenter)
+    db.commit()
+    task = make_task()
+    comments = [_comment(client, task, user if i % 2 else commenter.id, f"Comment {i}")["id"] for i in range(3)]
+    client.put(f"/api/tasks/{task['id']}", json={"title": "Renamed"})
+    flush_activity()
+
+    detail = client.get(f"/api/tasks/{task['id']}/detail", params={"comments_limit": 2, "activity_limit": 1}).json()
+
+    assert detail["task"]["title"] == "Renamed"
+    assert [comment["id"] for comment in detail["comments"]] == comments[:2]
+    assert [entry["field_changed"] for entry in detail["activity"]] == ["title"]
+    assert sorted(summary["id"] for summary in detail["users"]) == sorted([user, commenter.id])
+
+    rest = client.get(f"/api/tasks/{task['id']}/detail", params={
+        "comments_after": detail["comments_cursor"], "activity_after": detail["activity_cursor"],
+    }).json()
+    assert [comment["id"] for comment in rest["comments"]] == comments[2:]
+    assert [entry["action"] for entry in rest["activity"]] == ["commented"] * 3 + ["created"]
+    assert rest["comments_cursor"] is None and rest["activity_cursor"] is None
+
+def test_detail_costs_five_queries(client, db, engine, make_task, user, flush_activity):
+    commenter = User(username="carol", email="carol@example.com", full_name="Carol")
+    db.add(commenter)
+    db.commit()
+    task = make_task(assigned_to=user)
+    _comment(client, task, commenter.id, "First")
+    flush_activity()
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    response = client.get(f"/api/tasks/{task['id']}/detail")
+
+    assert response.status_code == 200
+    assert len(statements) == 5
+
+def test_detail_of_a_missing_task_is_404(client):
+    assert client.get("/api/tasks/999/detail").status_code == 404
@@ -0,0 +1,101 @@
+import pytest
+from core.pagination import DEFAULT_PAGE_SIZE
+from models.task import Task
+
+def _all_pages(client, **params):
+    ids, pages, cursor = [], 0, None
+    while True:
+        response = client.get("/api/tasks", params={**params, **({"after": cursor} if cursor else {})})
+        assert response.status_code == 200, response.text
+        ids.extend(task["id"] for task in response.json())
+        pages += 1
+        cursor = response.headers.get("x-next-cursor")
+        if not cursor:
+            return ids, pages
+
+@pytest.mark.parametrize("sort,order", [("id", "asc"), ("id", "desc"), ("created_at", "asc"), ("rank", "asc"), ("updated_at", "desc")])
+def test_cursor_pages_cover_the_list_once(client, project, make_task, sort, order):
+    for i in range(7):
+        make_task(title=f"Task {i}")
+    params = {"project_id": project["id"], "sort": sort, "order": order}
+    expected = [task["id"] for task in client.get("/api/tasks", params=params).json()]
+
+    ids, pages = _all_pages(client, **params, limit=3)
+
+    assert ids == expected
+    assert pages == 3
+
+def test_cursor_from_another_sort_is_rejected(client, project, make_task):
+    for i in range(3):
+        make_task(title=f"Task {i}")
+    cursor = client.get("/api/tasks", params={"project_id": project["id"], "limit": 1}).headers["x-next-cursor"]
+
+    response = client.get("/api/tasks", params={"project_id": project["id"], "sort": "rank", "after": cursor})
+
+    assert response.status_code == 400
+
+def test_list_without_limit_gets_the_default_page(client, db, project, user):
+    db.add_all(
+        Task(project_id=project["id"], title=f"Task {i}", task_type="task", created_by=user)
+        for i in range(DEFAULT_PAGE_SIZE + 1)
+    )
+    db.commit()
+
+    response = client.get("/api/tasks", params={"project_id": project["id"]})
+
+    assert len(response.json()) == DEFAULT_PAGE_SIZE
+    assert response.headers["x-next-cursor"]
+
+def test_page_size_is_bounded(client, project):
+    assert client.get("/api/tasks", params={"limit": 1001}).status_code == 422
+
+def test_unchanged_list_answers_304(client, project, make_task):
+    make_task()
+    params = {"project_id": project["id"]}
+    etag = client.get("/api/tasks", params=params).headers["etag"]
+
+    response = client.get("/api/tasks", params=params, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+@pytest.mark.parametrize("change", ["update", "create", "delete"])
+def test_task_writes_change_the_list_etag(client, project, make_task, change):
+    task = make_task()
+    params = {"project_id": project["id"]}
+    etag = client.get("/api/tasks", params=params).headers["etag"]
+
+    if change == "update":
+        client.put(f"/api/tasks/{task['id']}", json={"title": "Renamed"})
+    elif change == "create":
+        make_task()
+    else:
+        client.delete(f"/api/tasks/{task['id']}")
+
+    assert client.get("/api/tasks", params=params, headers={"If-None-Match": etag}).status_code == 200
+
+def test_filters_are_part_of_the_list_etag(client, project, make_task):
+    make_task()
+    etag = client.get("/api/tasks", params={"project_id": project["id"]}).headers["etag"]
+
+    response = client.get(
+        "/api/tasks", params={"project_id": project["id"], "status": "done"}, headers={"If-None-Match": etag}
+    )
+
+    assert response.status_code == 200
+
+def test_task_detail_answers_304_until_the_task_changes(client, make_task):
+    task = make_task()
+    etag = client.get(f"/api/tasks/{task['id']}").headers["etag"]
+
+    assert client.get(f"/api/tasks/{task['id']}", headers={"If-None-Match": etag}).status_code == 304
+    client.put(f"/api/tasks/{task['id']}", json={"title": "Renamed"})
+    assert client.get(f"/api/tasks/{task['id']}", headers={"If-None-Match": etag}).status_code == 200
+
+def test_project_list_answers_304_until_a_project_changes(client, project):
+    etag = client.get("/api/projects").headers["etag"]
+
+    assert client.get("/api/projects", headers={"If-None-Match": etag}).status_code == 304
+    client.put(f"/api/projects/{project['id']}", json={"name": "Renamed"})
+    assert client.get("/api/projects", headers={"If-None-Match": etag}).status_code == 200
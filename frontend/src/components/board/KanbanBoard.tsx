@@ -7,7 +7,7 @@ import { Task } from '@/lib/apiService';
 interface KanbanBoardProps {
   tasks: Task[];
   onTaskClick: (task: Task) => void;
-  onTaskMove: (taskId: number, newStatus: string) => void;
+  onTaskMove: (taskId: number, newStatus: string, beforeId?: number, afterId?: number) => void;
 }
 
 const columns = [
@@ -23,8 +23,20 @@ export default function KanbanBoard({ tasks, onTaskClick, onTaskMove }: KanbanBo
 
     const taskId = parseInt(result.draggableId);
     const newStatus = result.destination.droppableId;
+    const task = tasks.find((t) => t.id === taskId);
+    if (!task) return;
 
-    onTaskMove(taskId, newStatus);
+    // Neighbours at the drop position; ranks only order tasks within one project's column
+    const column = getTasksByStatus(newStatus).filter((t) => t.id !== taskId);
+    const index = result.destination.index;
+    const before = column[index - 1];
+    const after = column[index];
+    onTaskMove(
+      taskId,
+      newStatus,
+      before && before.project_id === task.project_id ? before.id : undefined,
+      after && after.project_id === task.project_id ? after.id : undefined,
+    );
   };
 
   const getTasksByStatus = (status: string) => {
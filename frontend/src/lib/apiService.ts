@@ -9,6 +9,14 @@ export interface Project {
   updated_at: string;
 }
 
+export interface SprintStats {
+  task_count: number;
+  done_count: number;
+  story_points: number;
+  done_story_points: number;
+  assignees: number[];
+}
+
 export interface Sprint {
   id: number;
   project_id: number;
@@ -18,6 +26,7 @@ export interface Sprint {
   end_date: string;
   status: string;
   created_at: string;
+  stats?: SprintStats;
 }
 
 export interface Task {
@@ -35,6 +44,7 @@ export interface Task {
   created_at: string;
   updated_at: string;
   due_date?: string;
+  rank?: string;
 }
 
 export interface User {
@@ -66,17 +76,97 @@ export interface ActivityLog {
   created_at: string;
 }
 
+export interface UserSummary {
+  id: number;
+  username: string;
+  full_name: string;
+  avatar_url?: string;
+}
+
+export interface TaskDetail {
+  task: Task;
+  comments: Comment[];
+  comments_cursor?: string;
+  activity: ActivityLog[];
+  activity_cursor?: string;
+  users: UserSummary[];
+}
+
+export interface TaskStats {
+  project_id?: number;
+  total: number;
+  story_points: number;
+  done_story_points: number;
+  by_status: Record<string, number>;
+  by_type: Record<string, number>;
+  by_priority: Record<string, number>;
+  by_assignee: Record<string, number>;
+  story_points_by_status: Record<string, number>;
+}
+
+export interface BurndownDay {
+  day: string;
+  total_points: number;
+  done_points: number;
+  remaining_points: number;
+  total_tasks: number;
+  done_tasks: number;
+  scope_added_points: number;
+  scope_removed_points: number;
+  ideal_remaining_points: number;
+}
+
+export interface Burndown {
+  sprint_id: number;
+  start_date: string;
+  end_date: string;
+  days: BurndownDay[];
+}
+
+export interface Velocity {
+  project_id: number;
+  sprints: {
+    sprint_id: number;
+    name: string;
+    end_date: string;
+    committed_points: number;
+    completed_points: number;
+  }[];
+  average_completed_points?: number;
+}
+
+export interface CycleTime {
+  project_id: number;
+  sprint_id?: number;
+  days: number;
+  count: number;
+  mean_hours?: number;
+  p50_hours?: number;
+  p75_hours?: number;
+  p90_hours?: number;
+  p95_hours?: number;
+}
+
 export const projectAPI = {
   getAll: () => apiClient.get<Project[]>('/api/projects'),
   getById: (id: number) => apiClient.get<Project>(`/api/projects/${id}`),
   create: (data: Partial<Project>) => apiClient.post<Project>('/api/projects', data),
   update: (id: number, data: Partial<Project>) => apiClient.put<Project>(`/api/projects/${id}`, data),
   delete: (id: number) => apiClient.delete(`/api/projects/${id}`),
+  getStats: (id: number) => apiClient.get<TaskStats>(`/api/projects/${id}/stats`),
+  getAllStats: () => apiClient.get<TaskStats[]>('/api/stats/projects'),
+};
+
+export const statsAPI = {
+  getAll: () => apiClient.get<TaskStats>('/api/stats'),
 };
 
 export const sprintAPI = {
-  getAll: (projectId?: number) => {
-    const params = projectId ? { project_id: projectId } : {};
+  getAll: (projectId?: number, include?: 'stats') => {
+    const params = {
+      ...(projectId ? { project_id: projectId } : {}),
+      ...(include ? { include } : {}),
+    };
     return apiClient.get<Sprint[]>('/api/sprints', { params });
   },
   getById: (id: number) => apiClient.get<Sprint>(`/api/sprints/${id}`),
@@ -86,15 +176,45 @@ export const sprintAPI = {
   complete: (id: number) => apiClient.post<Sprint>(`/api/sprints/${id}/complete`),
 };
 
+export interface TaskFilters {
+  project_id?: number;
+  sprint_id?: number;
+  status?: string;
+  assigned_to?: number;
+  limit?: number;
+  after?: string;
+  sort?: 'id' | 'created_at' | 'updated_at' | 'rank';
+  order?: 'asc' | 'desc';
+}
+
 export const taskAPI = {
-  getAll: (filters?: { project_id?: number; sprint_id?: number; status?: string; assigned_to?: number }) => {
+  getAll: (filters?: TaskFilters) => {
     return apiClient.get<Task[]>('/api/tasks', { params: filters });
   },
+  // The list is paged server-side; follow X-Next-Cursor until every matching task is loaded
+  getAllPages: async (filters?: TaskFilters) => {
+    const tasks: Task[] = [];
+    let after: string | undefined;
+    do {
+      const response = await apiClient.get<Task[]>('/api/tasks', {
+        params: { limit: 1000, ...filters, ...(after ? { after } : {}) },
+      });
+      tasks.push(...response.data);
+      after = response.headers['x-next-cursor'] || undefined;
+    } while (after);
+    return tasks;
+  },
   getById: (id: number) => apiClient.get<Task>(`/api/tasks/${id}`),
+  getDetail: (id: number, params?: {
+    comments_limit?: number;
+    comments_after?: string;
+    activity_limit?: number;
+    activity_after?: string;
+  }) => apiClient.get<TaskDetail>(`/api/tasks/${id}/detail`, { params }),
   create: (data: Partial<Task>) => apiClient.post<Task>('/api/tasks', data),
   update: (id: number, data: Partial<Task>) => apiClient.put<Task>(`/api/tasks/${id}`, data),
   delete: (id: number) => apiClient.delete(`/api/tasks/${id}`),
-  move: (id: number, data: { status?: string; sprint_id?: number }) => 
+  move: (id: number, data: { status?: string; sprint_id?: number; before_id?: number; after_id?: number }) => 
     apiClient.put<Task>(`/api/tasks/${id}/move`, data),
   assign: (id: number, userId: number) => 
     apiClient.put<Task>(`/api/tasks/${id}/assign`, { user_id: userId }),
@@ -104,6 +224,14 @@ export const taskAPI = {
   getActivity: (id: number) => apiClient.get<ActivityLog[]>(`/api/tasks/${id}/activity`),
 };
 
+export const analyticsAPI = {
+  getBurndown: (sprintId: number) => apiClient.get<Burndown>(`/api/sprints/${sprintId}/burndown`),
+  getVelocity: (projectId: number, sprints?: number) =>
+    apiClient.get<Velocity>(`/api/projects/${projectId}/velocity`, { params: sprints ? { sprints } : {} }),
+  getCycleTime: (projectId: number, params?: { days?: number; sprint_id?: number }) =>
+    apiClient.get<CycleTime>(`/api/projects/${projectId}/cycle-time`, { params }),
+};
+
 export const userAPI = {
   getAll: () => apiClient.get<User[]>('/api/users'),
   getById: (id: number) => apiClient.get<User>(`/api/users/${id}`),
@@ -41,8 +41,8 @@ export default function Backlog() {
 
   const fetchTasks = async () => {
     try {
-      const response = await taskAPI.getAll();
-      setTasks(response.data.filter((task) => !task.sprint_id));
+      const tasks = await taskAPI.getAllPages();
+      setTasks(tasks.filter((task) => !task.sprint_id));
     } catch (error) {
       console.error('Failed to fetch tasks:', error);
     }
@@ -47,6 +47,30 @@ export default function Board() {
     fetchTasks();
   }, [selectedProject]);
 
+  useEffect(() => {
+    if (selectedProject === 'all') return;
+
+    const source = new EventSource(`/api/projects/${selectedProject}/events`);
+    source.onmessage = (message) => {
+      const change = JSON.parse(message.data);
+      if (change.type === 'resync') {
+        fetchTasks();
+      } else if (change.type === 'task.deleted') {
+        setTasks((current) => current.filter((t) => t.id !== change.task_id));
+      } else if (change.type === 'task.created') {
+        setTasks((current) => [
+          ...current.filter((t) => t.id !== change.task_id),
+          { id: change.task_id, ...change.fields } as Task,
+        ]);
+      } else {
+        setTasks((current) =>
+          current.map((t) => (t.id === change.task_id ? { ...t, ...change.fields } : t))
+        );
+      }
+    };
+    return () => source.close();
+  }, [selectedProject]);
+
   const fetchProjects = async () => {
     try {
       const response = await projectAPI.getAll();
@@ -59,8 +83,7 @@ export default function Board() {
   const fetchTasks = async () => {
     try {
       const filters = selectedProject !== 'all' ? { project_id: selectedProject as number } : {};
-      const response = await taskAPI.getAll(filters);
-      setTasks(response.data);
+      setTasks(await taskAPI.getAllPages({ ...filters, sort: 'rank' }));
     } catch (error) {
       console.error('Failed to fetch tasks:', error);
     }
@@ -71,9 +94,9 @@ export default function Board() {
     setDrawerOpen(true);
   };
 
-  const handleTaskMove = async (taskId: number, newStatus: string) => {
+  const handleTaskMove = async (taskId: number, newStatus: string, beforeId?: number, afterId?: number) => {
     try {
-      await taskAPI.move(taskId, { status: newStatus });
+      await taskAPI.move(taskId, { status: newStatus, before_id: beforeId, after_id: afterId });
       fetchTasks();
     } catch (error) {
       console.error('Failed to move task:', error);
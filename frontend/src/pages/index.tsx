@@ -13,7 +13,7 @@ import { MdBugReport } from 'react-icons/md';
 import KpiCard from '@/components/dashboard/KpiCard';
 import SupportFab from '@/components/ai/SupportFab';
 import TaskCreateDialog from '@/components/tasks/TaskCreateDialog';
-import { taskAPI } from '@/lib/apiService';
+import { statsAPI } from '@/lib/apiService';
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer, PieChart, Pie, Cell, Legend } from 'recharts';
 
 export default function Dashboard() {
@@ -33,28 +33,29 @@ export default function Dashboard() {
 
   const fetchDashboardData = async () => {
     try {
-      const tasksResponse = await taskAPI.getAll();
-      const tasks = tasksResponse.data;
+      const statsResponse = await statsAPI.getAll();
+      const { total, by_status: byStatus, by_type: byType } = statsResponse.data;
+      const count = (counts: Record<string, number>, key: string) => counts[key] || 0;
 
-      const total = tasks.length;
-      const inProgress = tasks.filter((t) => t.status === 'in_progress').length;
-      const done = tasks.filter((t) => t.status === 'done').length;
-      const bugs = tasks.filter((t) => t.task_type === 'bug').length;
-
-      setStats({ total, inProgress, done, bugs });
+      setStats({
+        total,
+        inProgress: count(byStatus, 'in_progress'),
+        done: count(byStatus, 'done'),
+        bugs: count(byType, 'bug'),
+      });
 
       const typeData = [
-        { name: 'Story', value: tasks.filter((t) => t.task_type === 'story').length },
-        { name: 'Task', value: tasks.filter((t) => t.task_type === 'task').length },
-        { name: 'Bug', value: tasks.filter((t) => t.task_type === 'bug').length },
+        { name: 'Story', value: count(byType, 'story') },
+        { name: 'Task', value: count(byType, 'task') },
+        { name: 'Bug', value: count(byType, 'bug') },
       ];
       setTasksByType(typeData);
 
       const statusData = [
-        { name: 'To Do', value: tasks.filter((t) => t.status === 'todo').length },
-        { name: 'In Progress', value: tasks.filter((t) => t.status === 'in_progress').length },
-        { name: 'In Review', value: tasks.filter((t) => t.status === 'in_review').length },
-        { name: 'Done', value: tasks.filter((t) => t.status === 'done').length },
+        { name: 'To Do', value: count(byStatus, 'todo') },
+        { name: 'In Progress', value: count(byStatus, 'in_progress') },
+        { name: 'In Review', value: count(byStatus, 'in_review') },
+        { name: 'Done', value: count(byStatus, 'done') },
       ];
       setTasksByStatus(statusData);
     } catch (error) {
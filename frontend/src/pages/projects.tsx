@@ -19,7 +19,7 @@ import {
 } from '@mui/icons-material';
 import SupportFab from '@/components/ai/SupportFab';
 import ProjectCreateDialog from '@/components/projects/ProjectCreateDialog';
-import { Project, projectAPI, taskAPI } from '@/lib/apiService';
+import { Project, projectAPI } from '@/lib/apiService';
 import { format } from 'date-fns';
 
 export default function Projects() {
@@ -33,17 +33,14 @@ export default function Projects() {
 
   const fetchProjects = async () => {
     try {
-      const response = await projectAPI.getAll();
-      const projectsData = response.data;
-      setProjects(projectsData);
+      const [response, statsResponse] = await Promise.all([projectAPI.getAll(), projectAPI.getAllStats()]);
+      setProjects(response.data);
 
       const stats: Record<number, { total: number; done: number }> = {};
-      for (const project of projectsData) {
-        const tasksResponse = await taskAPI.getAll({ project_id: project.id });
-        const tasks = tasksResponse.data;
-        stats[project.id] = {
-          total: tasks.length,
-          done: tasks.filter((t) => t.status === 'done').length,
+      for (const projectStats of statsResponse.data) {
+        stats[projectStats.project_id as number] = {
+          total: projectStats.total,
+          done: projectStats.by_status.done || 0,
         };
       }
       setProjectStats(stats);
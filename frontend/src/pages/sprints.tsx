@@ -15,12 +15,11 @@ import {
 } from '@mui/material';
 import { Add as AddIcon, CalendarToday as CalendarIcon } from '@mui/icons-material';
 import SupportFab from '@/components/ai/SupportFab';
-import { Sprint, sprintAPI, taskAPI, Task } from '@/lib/apiService';
+import { Sprint, sprintAPI } from '@/lib/apiService';
 import { format, differenceInDays } from 'date-fns';
 
 export default function Sprints() {
   const [sprints, setSprints] = useState<Sprint[]>([]);
-  const [sprintTasks, setSprintTasks] = useState<Record<number, Task[]>>({});
 
   useEffect(() => {
     fetchSprints();
@@ -28,26 +27,16 @@ export default function Sprints() {
 
   const fetchSprints = async () => {
     try {
-      const response = await sprintAPI.getAll();
-      const sprintsData = response.data;
-      setSprints(sprintsData);
-
-      const tasksMap: Record<number, Task[]> = {};
-      for (const sprint of sprintsData) {
-        const tasksResponse = await taskAPI.getAll({ sprint_id: sprint.id });
-        tasksMap[sprint.id] = tasksResponse.data;
-      }
-      setSprintTasks(tasksMap);
+      const response = await sprintAPI.getAll(undefined, 'stats');
+      setSprints(response.data);
     } catch (error) {
       console.error('Failed to fetch sprints:', error);
     }
   };
 
-  const getSprintProgress = (sprintId: number) => {
-    const tasks = sprintTasks[sprintId] || [];
-    if (tasks.length === 0) return 0;
-    const completedTasks = tasks.filter((t) => t.status === 'done').length;
-    return (completedTasks / tasks.length) * 100;
+  const getSprintProgress = (sprint: Sprint) => {
+    if (!sprint.stats || sprint.stats.task_count === 0) return 0;
+    return (sprint.stats.done_count / sprint.stats.task_count) * 100;
   };
 
   const getSprintStatusColor = (status: string) => {
@@ -92,8 +81,9 @@ export default function Sprints() {
 
         <Grid container spacing={3}>
           {sprints.map((sprint) => {
-            const tasks = sprintTasks[sprint.id] || [];
-            const progress = getSprintProgress(sprint.id);
+            const taskCount = sprint.stats?.task_count || 0;
+            const assignees = sprint.stats?.assignees || [];
+            const progress = getSprintProgress(sprint);
             const daysRemaining = getDaysRemaining(sprint.end_date);
 
             return (
@@ -178,18 +168,15 @@ export default function Sprints() {
 
                       <Stack direction="row" justifyContent="space-between" alignItems="center">
                         <Typography variant="body2" color="text.secondary">
-                          {tasks.length} tasks
+                          {taskCount} tasks
                         </Typography>
                         <AvatarGroup max={4} sx={{ '& .MuiAvatar-root': { width: 28, height: 28 } }}>
-                          {tasks
-                            .filter((t) => t.assigned_to)
-                            .slice(0, 4)
-                            .map((task, idx) => (
-                              <Avatar
-                                key={idx}
-                                src={`https://i.pravatar.cc/150?img=${task.assigned_to}`}
-                              />
-                            ))}
+                          {assignees.slice(0, 4).map((userId) => (
+                            <Avatar
+                              key={userId}
+                              src={`https://i.pravatar.cc/150?img=${userId}`}
+                            />
+                          ))}
                         </AvatarGroup>
                       </Stack>
                     </Stack>